@@ -0,0 +1,67 @@
+"""Benchmarks of the scaffolding commands."""
+
+from common import SyntheticProject, run_command
+
+
+class CreateModule:
+    """create_module in a project that already has apps."""
+
+    params = [[10, 100, 1000], [1, 10]]
+    param_names = ["existing_apps", "new_modules"]
+
+    def setup_params(self, existing_apps, new_modules):
+        self.project = SyntheticProject(existing_apps, tests_per_category=0)
+        self.run_index = 0
+
+    def setup(self, existing_apps, new_modules):
+        self.run_index += 1
+        self.module_names = [f"module_{self.run_index}_{index}" for index in range(new_modules)]
+
+    def time_create_module(self, existing_apps, new_modules):
+        run_command("create_module", *self.module_names)
+
+    def teardown_params(self, existing_apps, new_modules):
+        self.project.close()
+
+
+class _ComponentCommand:
+    """Base for the create_* component commands, run in a single app."""
+
+    command = None
+
+    def setup_params(self):
+        self.project = SyntheticProject(0)
+        run_command("create_module", "shop")
+        self.run_index = 0
+
+    def setup(self):
+        self.run_index += 1
+        self.name = f"Product{self.run_index}"
+
+    def teardown_params(self):
+        self.project.close()
+
+
+class CreateModel(_ComponentCommand):
+    def time_create_model(self):
+        run_command("create_model", self.name, "shop")
+
+
+class CreateSerializer(_ComponentCommand):
+    def time_create_serializer(self):
+        run_command("create_serializer", self.name, "shop")
+
+
+class CreateService(_ComponentCommand):
+    def time_create_service(self):
+        run_command("create_service", self.name, "shop")
+
+
+class CreateFactory(_ComponentCommand):
+    def time_create_factory(self):
+        run_command("create_factory", self.name, "shop")
+
+
+class CreateViews(_ComponentCommand):
+    def time_create_views(self):
+        run_command("create_views", self.name, "shop")
@@ -0,0 +1,56 @@
+"""Benchmarks of the __init__.py and settings file editing."""
+
+from io import StringIO
+
+from common import SyntheticProject, settings_content
+
+
+class UpdateAllList:
+    """Adding a name to a large __all__ list."""
+
+    params = [[10, 100, 1000]]
+    param_names = ["items"]
+
+    def setup_params(self, items):
+        names = [f"Model{index}" for index in range(items)]
+        imports = "\n".join(f"from .model_{index} import Model{index}" for index in range(items))
+        exported = ",\n    ".join(f'"{name}"' for name in names)
+        self.content = f"{imports}\n\n__all__ = [\n    {exported}\n]\n"
+
+    def time_update_all_list(self, items):
+        from smartcli.utils import add_import_to_content, update_all_list
+
+        content = add_import_to_content(self.content, "from .new_model import NewModel")
+        update_all_list(content, "NewModel")
+
+    def time_init_file_index(self, items):
+        from smartcli.init_index import InitFileIndex
+
+        index = InitFileIndex(self.content)
+        index.add_import("from .new_model import NewModel")
+        index.add_to_all("NewModel")
+        index.render()
+
+
+class SettingsRewrite:
+    """Adding apps to INSTALLED_APPS in the settings file."""
+
+    params = [[10, 100, 1000]]
+    param_names = ["existing_apps"]
+
+    def setup_params(self, existing_apps):
+        self.project = SyntheticProject(existing_apps, tests_per_category=0)
+        self.original = settings_content(self.project.app_names)
+
+    def setup(self, existing_apps):
+        from smartcli.management.commands.create_module import Command
+
+        with open(self.project.settings_file, "w", encoding="utf-8") as f:
+            f.write(self.original)
+        self.command = Command(stdout=StringIO())
+
+    def time_add_apps_to_settings(self, existing_apps):
+        self.command._add_apps_to_settings(["new_app", "other_app"])
+
+    def teardown_params(self, existing_apps):
+        self.project.close()
@@ -0,0 +1,38 @@
+"""Benchmarks of the test command label discovery."""
+
+import os
+
+from common import SyntheticProject
+
+
+class FilteredTestLabels:
+    """Discovery of the test labels for `test --models`."""
+
+    params = [[10, 100, 1000]]
+    param_names = ["apps"]
+
+    def setup_params(self, apps):
+        from smartcli.discovery import TestLabelIndex
+
+        self.project = SyntheticProject(apps)
+        self.cache_file = os.path.join(self.project.root, ".smartcli", "test_labels.json")
+
+        # Warm the cache for the cached benchmark
+        index = TestLabelIndex(self.cache_file)
+        index.get_labels("models", self.project.project_apps)
+        index.save()
+
+    def time_filtered_test_labels(self, apps):
+        from smartcli.discovery import TestLabelIndex
+
+        TestLabelIndex(os.path.join(self.project.root, "no-cache.json")).get_labels(
+            "models", self.project.project_apps
+        )
+
+    def time_filtered_test_labels_cached(self, apps):
+        from smartcli.discovery import TestLabelIndex
+
+        TestLabelIndex.load(self.cache_file).get_labels("models", self.project.project_apps)
+
+    def teardown_params(self, apps):
+        self.project.close()
@@ -0,0 +1,133 @@
+"""
+Shared helpers for the Django SmartCLI benchmarks.
+
+Benchmarks run against synthetic projects created in temporary directories,
+with a minimal Django configuration pointing BASE_DIR at the project.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from io import StringIO
+from typing import List
+
+import django
+from django.conf import settings
+
+# Make the smartcli package importable when running from a checkout
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Test categories generated in each synthetic app
+TEST_CATEGORIES = ["models", "serializers", "services", "views"]
+
+
+def setup_django() -> None:
+    """Configure a minimal Django setup for the benchmarks (only once)."""
+    if settings.configured:
+        return
+
+    settings.configure(
+        BASE_DIR=tempfile.gettempdir(),
+        SECRET_KEY="benchmarks",
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "smartcli",
+        ],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        USE_CENTRALIZED_APPS=True,
+    )
+    django.setup()
+
+
+def run_command(name: str, *args, **options) -> str:
+    """
+    Run a management command quietly.
+
+    Args:
+        name: Name of the management command
+        *args: Positional arguments for the command
+        **options: Keyword options for the command
+
+    Returns:
+        str: The command output
+    """
+    from django.core.management import call_command
+
+    out = StringIO()
+    call_command(name, *args, stdout=out, stderr=StringIO(), **options)
+    return out.getvalue()
+
+
+def settings_content(app_names: List[str]) -> str:
+    """
+    Build a settings.py content listing the given apps.
+
+    Args:
+        app_names: Names of the project apps
+
+    Returns:
+        str: The settings file content
+    """
+    apps = ["django.contrib.admin", "django.contrib.auth"] + [f"apps.{name}" for name in app_names]
+    installed_apps = "\n".join(f'    "{app}",' for app in apps)
+    return f'SECRET_KEY = "benchmarks"\n\nINSTALLED_APPS = [\n{installed_apps}\n]\n'
+
+
+class SyntheticProject:
+    """
+    Temporary Django project with a number of generated apps.
+
+    Each app gets a tests/<category>/ directory per test category with a few
+    test files. While the project is open, settings.BASE_DIR and
+    settings.INSTALLED_APPS point at it and it is the current directory.
+    """
+
+    def __init__(self, app_count: int, tests_per_category: int = 2):
+        self.app_names = [f"app_{index}" for index in range(app_count)]
+        self.tests_per_category = tests_per_category
+        self.root = tempfile.mkdtemp(prefix="smartcli-bench-")
+        self.settings_file = os.path.join(self.root, "settings.py")
+        self.project_apps = [
+            (f"apps.{name}", os.path.join(self.root, "apps", name)) for name in self.app_names
+        ]
+        self._previous_cwd = os.getcwd()
+        self._previous_settings = {
+            "BASE_DIR": settings.BASE_DIR,
+            "INSTALLED_APPS": list(settings.INSTALLED_APPS),
+        }
+        self._create()
+        self._activate()
+
+    def _create(self) -> None:
+        """Write the settings file and the app test trees."""
+        with open(self.settings_file, "w", encoding="utf-8") as f:
+            f.write(settings_content(self.app_names))
+
+        for app_name in self.app_names:
+            app_path = os.path.join(self.root, "apps", app_name)
+            for category in TEST_CATEGORIES:
+                test_dir = os.path.join(app_path, "tests", category)
+                os.makedirs(test_dir)
+                open(os.path.join(test_dir, "__init__.py"), "w").close()
+                for index in range(self.tests_per_category):
+                    with open(os.path.join(test_dir, f"test_{category}_{index}.py"), "w") as f:
+                        f.write("from django.test import TestCase\n")
+
+    def _activate(self) -> None:
+        """Point the settings and the current directory at the project."""
+        settings.BASE_DIR = self.root
+        settings.INSTALLED_APPS = self._previous_settings["INSTALLED_APPS"] + [
+            f"apps.{name}" for name in self.app_names
+        ]
+        os.chdir(self.root)
+
+    def close(self) -> None:
+        """Restore the settings and remove the project."""
+        os.chdir(self._previous_cwd)
+        for name, value in self._previous_settings.items():
+            setattr(settings, name, value)
+        shutil.rmtree(self.root, ignore_errors=True)
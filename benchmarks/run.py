@@ -0,0 +1,245 @@
+"""
+Benchmark runner for Django SmartCLI.
+
+Usage:
+    python benchmarks/run.py run [--filter NAME] [--repeat N] [--output PATH]
+    python benchmarks/run.py compare BASELINE.json RESULTS.json [--threshold 1.2]
+
+Benchmarks are asv-style classes defined in benchmarks/bench_*.py:
+- `params` / `param_names`: parameter grid, every combination is benchmarked
+- `setup_params(*params)` / `teardown_params(*params)`: run once per combination
+- `setup(*params)` / `teardown(*params)`: run around each timed call
+- `time_*(*params)`: the timed methods
+
+Results are written as JSON (by default to benchmarks/results/<commit>.json)
+so that runs of different commits can be compared.
+"""
+
+import argparse
+import datetime
+import glob
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+# Default number of timed calls per benchmark and parameter combination
+DEFAULT_REPEAT = 5
+
+# Slowdown ratio reported as a regression by compare
+DEFAULT_THRESHOLD = 1.2
+
+
+def get_commit() -> str:
+    """Get the short hash of the current commit (or "unknown")."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=BENCHMARKS_DIR,
+        )
+    except OSError:
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def discover_benchmarks(name_filter: Optional[str] = None) -> List[tuple]:
+    """
+    Find the benchmark classes and their timed methods.
+
+    Args:
+        name_filter: Only keep benchmarks whose full name contains this text
+
+    Returns:
+        List[tuple]: (module name, class, method name) of each benchmark
+    """
+    if BENCHMARKS_DIR not in sys.path:
+        sys.path.insert(0, BENCHMARKS_DIR)
+
+    benchmarks = []
+    for path in sorted(glob.glob(os.path.join(BENCHMARKS_DIR, "bench_*.py"))):
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        module = importlib.import_module(module_name)
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module_name or class_name.startswith("_"):
+                continue
+            for method_name in sorted(name for name in dir(cls) if name.startswith("time_")):
+                full_name = f"{module_name}.{class_name}.{method_name}"
+                if name_filter and name_filter not in full_name:
+                    continue
+                benchmarks.append((module_name, cls, method_name))
+    return benchmarks
+
+
+def run_benchmark(cls, method_name: str, repeat: int) -> List[dict]:
+    """
+    Time a benchmark method for every parameter combination.
+
+    Args:
+        cls: The benchmark class
+        method_name: Name of the timed method
+        repeat: Number of timed calls per combination
+
+    Returns:
+        List[dict]: Timing statistics of each combination (in seconds)
+    """
+    param_grid = getattr(cls, "params", [])
+    param_names = getattr(cls, "param_names", [f"param{index}" for index in range(len(param_grid))])
+    results = []
+
+    for params in itertools.product(*param_grid):
+        benchmark = cls()
+        _call_hook(benchmark, "setup_params", params)
+        timings = []
+        try:
+            for _ in range(repeat):
+                _call_hook(benchmark, "setup", params)
+                start = time.perf_counter()
+                getattr(benchmark, method_name)(*params)
+                timings.append(time.perf_counter() - start)
+                _call_hook(benchmark, "teardown", params)
+        finally:
+            _call_hook(benchmark, "teardown_params", params)
+
+        results.append({
+            "params": dict(zip(param_names, params)),
+            "repeat": repeat,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.mean(timings),
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        })
+    return results
+
+
+def _call_hook(benchmark, hook_name: str, params: tuple) -> None:
+    """Call a setup/teardown hook if the benchmark defines it."""
+    hook = getattr(benchmark, hook_name, None)
+    if hook is not None:
+        hook(*params)
+
+
+def result_key(name: str, params: dict) -> str:
+    """Unique key of a benchmark result, e.g. "bench_files.UpdateAllList.time_x(items=100)"."""
+    formatted_params = ", ".join(f"{key}={value}" for key, value in params.items())
+    return f"{name}({formatted_params})"
+
+
+def run(args) -> int:
+    """Run the benchmarks and write the JSON results."""
+    from common import setup_django
+
+    setup_django()
+    import django
+
+    benchmarks = discover_benchmarks(args.filter)
+    if not benchmarks:
+        print("❌ Error: No benchmark matches the filter")
+        return 1
+
+    results: Dict[str, dict] = {}
+    for module_name, cls, method_name in benchmarks:
+        name = f"{module_name}.{cls.__name__}.{method_name}"
+        for result in run_benchmark(cls, method_name, args.repeat):
+            key = result_key(name, result["params"])
+            results[key] = result
+            print(f"{key:<80} {format_duration(result['median'])}")
+
+    commit = get_commit()
+    report = {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\n✅ Results written to {output}")
+    return 0
+
+
+def compare(args) -> int:
+    """Compare two JSON results and report regressions."""
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.results, "r", encoding="utf-8") as f:
+        current = json.load(f)
+
+    print(f"Baseline: {baseline['commit']}  Results: {current['commit']}  (median times)\n")
+
+    regressions = 0
+    for key in sorted(set(baseline["results"]) | set(current["results"])):
+        before = baseline["results"].get(key)
+        after = current["results"].get(key)
+        if before is None or after is None:
+            status = "added" if before is None else "removed"
+            print(f"{key:<80} {status}")
+            continue
+
+        ratio = after["median"] / before["median"] if before["median"] else 1.0
+        if ratio > args.threshold:
+            status = "❌ slower"
+            regressions += 1
+        elif ratio < 1 / args.threshold:
+            status = "✅ faster"
+        else:
+            status = ""
+        print(
+            f"{key:<80} {format_duration(before['median'])} -> "
+            f"{format_duration(after['median'])}  x{ratio:.2f} {status}"
+        )
+
+    if regressions:
+        print(f"\n❌ {regressions} benchmark(s) slower than x{args.threshold}")
+        return 1
+    return 0
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the benchmark runner."""
+    parser = argparse.ArgumentParser(description="Django SmartCLI benchmarks")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed calls per benchmark")
+    run_parser.add_argument("--output", help="Results file (default: benchmarks/results/<commit>.json)")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline", help="Results of the reference commit")
+    compare_parser.add_argument("results", help="Results to compare with the baseline")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Slowdown ratio reported as a regression"
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,6 +31,9 @@ setup(
             "pytest-django>=4.5.0",
             "pytest-cov>=4.0.0",
         ],
+        "yaml": [
+            "PyYAML>=6.0",
+        ],
     },
     
     # Metadata
@@ -53,7 +56,6 @@ setup(
         "Intended Audience :: Developers",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -83,7 +85,7 @@ setup(
     ],
     
     # Python version requirement
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     
     # Package data
     package_data={
@@ -9,6 +9,29 @@ import sys
 import os
 from typing import List, Optional
 
+# Only standard library modules may be imported at module level: --help,
+# --version and argument validation must not pay for importing Django
+from smartcli.naming import validate_module_name, validate_pascal_case_name
+from smartcli.project import get_project, read_settings_module
+
+
+# Environment variable forcing the legacy ``python manage.py`` subprocess mode
+SUBPROCESS_ENV_VAR = "SMARTCLI_SUBPROCESS"
+
+# Name type of the component commands taking <name> <app> arguments
+COMPONENT_NAME_TYPES = {
+    "create_model": "Model",
+    "create_serializer": "Serializer",
+    "create_service": "Service",
+    "create_factory": "Factory",
+    "create_views": "View",
+}
+
+# Options followed by a value (which is not a positional argument)
+VALUE_OPTIONS = ["--model", "--from-file", "--profile", "--settings", "--pythonpath", "-v", "--verbosity"]
+
+_django_ready = False
+
 
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -48,8 +71,14 @@ def main(args: Optional[List[str]] = None) -> int:
             return run_django_command("create_factory", args[1:])
         elif command == "create-views":
             return run_django_command("create_views", args[1:])
+        elif command == "apply":
+            return run_django_command("apply_spec", args[1:])
+        elif command == "list":
+            return run_django_command("list_components", args[1:])
         elif command == "test":
             return run_django_command("test", args[1:])
+        elif command == "serve":
+            return run_server(args[1:])
         else:
             print(f"❌ Unknown command: {command}")
             print_help()
@@ -72,14 +101,37 @@ def run_django_command(command: str, args: List[str]) -> int:
         int: Exit code
     """
     try:
+        # Reject invalid arguments before paying for the Django setup
+        error = validate_command_args(command, args)
+        if error:
+            print(f"❌ Error: {error}")
+            return 1
+
         # Check if we're in a Django project
         if not is_django_project():
             print("❌ Error: Not in a Django project directory")
-            print("   Please run this command from your Django project root")
+            print("   Please run this command from your Django project (or one of its directories)")
             return 1
+        project = get_project()
+
+        # Forward to a running `django-smartcli serve` process when available.
+        # The server runs from the project root: relative paths given from a
+        # subdirectory would resolve elsewhere, so those commands run here.
+        from smartcli.server import SERVED_COMMANDS, forward_command
+        if command in SERVED_COMMANDS and (project is None or os.getcwd() == project.root):
+            exit_code = forward_command(command, args)
+            if exit_code is not None:
+                return exit_code
+
+        # Run in the current interpreter when the settings module is known
+        if use_in_process():
+            settings_module = get_settings_module()
+            if settings_module:
+                return run_django_command_in_process(command, args, settings_module)
         
         # Build the command
-        cmd_args = ["python", "manage.py", command] + args
+        manage_py = project.manage_py if project is not None else "manage.py"
+        cmd_args = ["python", manage_py, command] + args
         
         # Execute the command
         import subprocess
@@ -101,14 +153,261 @@ def run_django_command(command: str, args: List[str]) -> int:
         return 1
 
 
+def validate_command_args(command: str, args: List[str]) -> Optional[str]:
+    """
+    Validate the arguments of a command without importing Django.
+
+    Only checks that don't need the project are done here (argument count and
+    name casing), the command itself validates the rest.
+
+    Args:
+        command: The Django command to run
+        args: Arguments for the command
+
+    Returns:
+        Optional[str]: An error message, or None if the arguments look valid
+    """
+    if "-h" in args or "--help" in args:
+        return None
+
+    positional_args = get_positional_args(args)
+    cli_command = command.replace("_", "-")
+
+    try:
+        if command == "create_module":
+            if not positional_args and not any(arg.startswith("--from-file") for arg in args):
+                return "Provide at least one module name or --from-file"
+            for module_name in positional_args:
+                validate_module_name(module_name)
+
+        elif command in COMPONENT_NAME_TYPES:
+            if len(positional_args) < 2 or not positional_args[0]:
+                return f"Usage: django-smartcli {cli_command} <name> <app>"
+            validate_pascal_case_name(positional_args[0], COMPONENT_NAME_TYPES[command])
+
+            model_name = get_option_value(args, "--model")
+            if model_name is not None:
+                if not model_name:
+                    return "--model requires a model name"
+                validate_pascal_case_name(model_name, "Model")
+
+    except ValueError as e:
+        return str(e)
+
+    return None
+
+
+def get_positional_args(args: List[str]) -> List[str]:
+    """
+    Get the positional arguments of a command line, skipping options and their values.
+
+    Args:
+        args: Arguments for the command
+
+    Returns:
+        List[str]: The positional arguments
+    """
+    positional_args = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+        elif arg.startswith("-"):
+            skip_next = arg in VALUE_OPTIONS
+        else:
+            positional_args.append(arg)
+    return positional_args
+
+
+def get_option_value(args: List[str], option: str) -> Optional[str]:
+    """
+    Get the value of an option given as "--option value" or "--option=value".
+
+    Args:
+        args: Arguments for the command
+        option: The option name
+
+    Returns:
+        Optional[str]: The option value, or None if the option is absent
+    """
+    for position, arg in enumerate(args):
+        if arg == option:
+            return args[position + 1] if position + 1 < len(args) else ""
+        if arg.startswith(f"{option}="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def run_django_command_in_process(command: str, args: List[str], settings_module: str) -> int:
+    """
+    Run a Django management command in the current interpreter.
+
+    Django is set up once per process and the command is executed with
+    call_command, so its output is streamed directly to stdout/stderr.
+
+    With --timings or --profile, the Django setup is timed (and profiled)
+    with the command and the CLI prints the phase breakdown.
+
+    Args:
+        command: The Django command to run
+        args: Arguments for the command
+        settings_module: Dotted path of the project settings module
+
+    Returns:
+        int: Exit code
+    """
+    profile_file = get_option_value(args, "--profile")
+    if "--timings" not in args and profile_file is None:
+        setup_django(settings_module)
+        return execute_django_command(command, args)
+
+    from smartcli.profiling import DJANGO_SETUP, ProfilingSession, profile_phase
+
+    session = ProfilingSession(profile_file)
+    with session:
+        with profile_phase(DJANGO_SETUP):
+            setup_django(settings_module)
+        exit_code = execute_django_command(command, args)
+    for line in session.format_report():
+        print(line)
+    return exit_code
+
+
+def execute_django_command(command: str, args: List[str], stdout=None, stderr=None) -> int:
+    """
+    Execute a Django management command with call_command (Django must be set up).
+
+    Args:
+        command: The Django command to run
+        args: Arguments for the command
+        stdout: Optional stream for the command output (defaults to sys.stdout)
+        stderr: Optional stream for the command errors (defaults to sys.stderr)
+
+    Returns:
+        int: Exit code
+    """
+    from django.core.management import call_command
+    from django.core.management.base import CommandError
+
+    streams = {}
+    if stdout is not None:
+        streams["stdout"] = stdout
+    if stderr is not None:
+        streams["stderr"] = stderr
+
+    try:
+        call_command(command, *args, **streams)
+    except CommandError as e:
+        print(f"CommandError: {str(e)}", file=stderr or sys.stderr)
+        return 1
+    except SystemExit as e:
+        # argparse --help and the test runner exit explicitly
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+
+    return 0
+
+
+def setup_django(settings_module: str) -> None:
+    """
+    Configure and set up Django for the current process (only once).
+
+    Args:
+        settings_module: Dotted path of the project settings module
+    """
+    global _django_ready
+    if _django_ready:
+        return
+
+    # Make the project importable, as `python manage.py` does. From a
+    # subdirectory, its modules (e.g. an app's apps.py) must not shadow the
+    # project packages.
+    project = get_project()
+    project_root = project.root if project is not None else os.getcwd()
+    if project_root != os.getcwd():
+        sys.path[:] = [path for path in sys.path if path not in ("", os.getcwd())]
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+    django.setup()
+    _django_ready = True
+
+
+def use_in_process() -> bool:
+    """
+    Check if commands should run in the current interpreter.
+
+    Returns:
+        bool: False when the subprocess mode is forced via SMARTCLI_SUBPROCESS
+    """
+    return os.environ.get(SUBPROCESS_ENV_VAR, "").lower() not in ("1", "true", "yes")
+
+
+def get_settings_module(manage_py_path: Optional[str] = None) -> Optional[str]:
+    """
+    Read the settings module declared in manage.py.
+
+    Args:
+        manage_py_path: Path to the manage.py file (defaults to the one of the current project)
+
+    Returns:
+        Optional[str]: The DJANGO_SETTINGS_MODULE value, or None if not found
+    """
+    if manage_py_path is not None:
+        return read_settings_module(manage_py_path)
+    project = get_project()
+    return project.settings_module if project is not None else None
+
+
+def run_server(args: List[str]) -> int:
+    """
+    Start (or stop with --stop) the scaffolding server for the current project.
+
+    Args:
+        args: Arguments for the serve command
+
+    Returns:
+        int: Exit code
+    """
+    from smartcli.server import serve, stop_server
+
+    if not is_django_project():
+        print("❌ Error: Not in a Django project directory")
+        print("   Please run this command from your Django project (or one of its directories)")
+        return 1
+
+    if "--stop" in args:
+        if stop_server():
+            print("✅ SmartCLI server stopped")
+            return 0
+        print("❌ Error: No SmartCLI server running for this project")
+        return 1
+
+    settings_module = get_settings_module()
+    if not settings_module:
+        print("❌ Error: Could not read DJANGO_SETTINGS_MODULE from manage.py")
+        return 1
+
+    # Forwarded commands run from the project root
+    os.chdir(get_project().root)
+    setup_django(settings_module)
+    return serve()
+
+
 def is_django_project() -> bool:
     """
-    Check if the current directory is a Django project.
-    
+    Check if the current directory belongs to a Django project.
+
+    manage.py is searched in the current directory and its parents.
+
     Returns:
         bool: True if this is a Django project directory
     """
-    return os.path.exists("manage.py")
+    return get_project() is not None
 
 
 def print_help() -> None:
@@ -120,22 +419,33 @@ USAGE:
     django-smartcli <command> [options]
 
 COMMANDS:
-    create-module <name>           Create a new Django module with complete structure
+    create-module <name>...        Create new Django modules with complete structure
     create-model <name> <app>      Create a Django model with best practices
     create-serializer <name> <app> Create a DRF serializer
     create-service <name> <app>    Create a business logic service
     create-factory <name> <app>    Create a factory_boy factory
     create-views <name> <app>      Create a DRF ViewSet
+    apply <spec_file>              Create modules and components from a spec file
+    list [<app>...]                List the components of the project apps
+    serve [--stop]                 Keep a warm process to run commands faster
 
 OPTIONS:
-    -h, --help     Show this help message
-    -v, --version  Show version information
+    -h, --help        Show this help message
+    -v, --version     Show version information
+    --timings         Report the time spent in each phase of a command
+    --profile FILE    Also save a cProfile dump of the command to FILE
 
 EXAMPLES:
     django-smartcli create-module users
+    django-smartcli create-module users orders billing
     django-smartcli create-model UserProfile users
+    django-smartcli create-model Product catalog --cached
     django-smartcli create-serializer UserProfileSerializer users
     django-smartcli create-service UserProfileService users
+    django-smartcli create-service OrderLine orders --bulk
+    django-smartcli apply scaffold.yaml
+    django-smartcli list users
+    django-smartcli create-views ProductViewSet catalog --profile create_views.pstats
 
 For more information, visit: https://github.com/nathanrenard3/django-smartcli
 """
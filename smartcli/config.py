@@ -15,6 +15,9 @@ DIRECTORIES = [
     "tests",
 ]
 
+# Maximum number of threads used for parallel filesystem work
+FILESYSTEM_MAX_WORKERS = 8
+
 # Test subdirectories
 TEST_SUBDIRECTORIES = [
     "models",
@@ -23,6 +26,37 @@ TEST_SUBDIRECTORIES = [
     "views",
 ]
 
+# Package directories whose __init__.py files are generated as lazy PEP 562
+# registries with USE_LAZY_INIT_FILES = True
+LAZY_INIT_DIRECTORIES = ["serializers", "services", "views"]
+
+# Name of the name -> submodule table of lazy __init__.py files
+LAZY_IMPORTS_NAME = "_LAZY_IMPORTS"
+
+# Directory of the SmartCLI caches, relative to the project BASE_DIR
+CACHE_DIRECTORY = ".smartcli"
+
+# Cache file of the test label discovery index (in CACHE_DIRECTORY)
+TEST_LABELS_CACHE_FILE = "test_labels.json"
+
+# Cache file of the project component index (in CACHE_DIRECTORY)
+PROJECT_INDEX_CACHE_FILE = "index.json"
+
+# Known test durations used to balance shards (in CACHE_DIRECTORY)
+TEST_DURATIONS_FILE = "test_durations.json"
+
+# History of recorded test durations (in CACHE_DIRECTORY)
+TEST_TIMINGS_DATABASE = "test_timings.sqlite3"
+
+# Migrated SQLite test database templates of test --snapshot-db (in CACHE_DIRECTORY)
+TEST_DB_SNAPSHOT_DIRECTORY = "test_db"
+
+# Number of recent runs averaged to estimate the duration of a test file
+TIMING_HISTORY_RUNS = 10
+
+# Number of slowest tests printed per category by test --record-timings
+SLOWEST_TESTS_COUNT = 5
+
 # File suffixes for different types
 FILE_SUFFIXES = {
     "model": "",
@@ -32,6 +66,15 @@ FILE_SUFFIXES = {
     "view": "_view",
 }
 
+# Component type of the files of each source directory
+SOURCE_DIRECTORY_TYPES = {
+    "models": "model",
+    "serializers": "serializer",
+    "services": "service",
+    "views": "view",
+    "factories": "factory",
+}
+
 # Import suffixes for different types
 IMPORT_SUFFIXES = {
     "model": "",
@@ -41,6 +84,17 @@ IMPORT_SUFFIXES = {
     "view": "View",
 }
 
+# Base class name suffixes of the component classes of each type (models.Model,
+# AbstractUser...): the project index doesn't list managers, paginations or
+# choices defined next to the components as components
+COMPONENT_BASE_SUFFIXES = {
+    "model": ("Model", "User"),
+    "serializer": ("Serializer",),
+    "service": ("Service",),
+    "factory": ("Factory",),
+    "view": ("View", "ViewSet"),
+}
+
 # Test class suffixes
 TEST_SUFFIXES = {
     "model": ["ModelTest", "ManagerTest"],
@@ -56,6 +110,13 @@ TEMPLATE_CONFIGS = {
         "base_fields": ["id", "created_at", "deleted_at"],
         "read_only_fields": ["id", "created_at"],
         "manager_methods": ["get_active", "get_by_id"],
+        # Meta.indexes of generated models: a partial index on the active rows
+        # (deleted_at IS NULL, the get_active() filter; empty to disable) and
+        # an index on created_at
+        "active_index_fields": ["-created_at"],
+        "created_at_index": True,
+        # Seconds the create_model --cached get_by_id keeps objects in the cache
+        "cache_timeout": 300,
     },
     "serializer": {
         "base_fields": ["id", "created_at", "deleted_at"],
@@ -64,12 +125,41 @@ TEMPLATE_CONFIGS = {
     "service": {
         "base_methods": ["create"],
         "decorators": ["@classmethod", "@transaction.atomic"],
+        # Objects per INSERT/UPDATE query of the create_service --bulk methods
+        "bulk_batch_size": 500,
+        # Upper bound of the generated create test (run right away when the
+        # service has a model of the same name): a single INSERT between the
+        # SAVEPOINT and RELEASE SAVEPOINT of transaction.atomic inside test
+        # transactions
+        "query_budget": {"create": 3},
+    },
+    "view": {
+        # Queries allowed per endpoint by the generated view tests (upper
+        # bounds). create_views --implement adds one query per prefetched
+        # relation, and to create: one per unique check, related lookup and
+        # many-to-many field of the serializer
+        "query_budget": {"list": 1, "retrieve": 1, "create": 3},
+        # Cursor pagination of create_views --implement
+        "page_size": 50,
+        "ordering": "-created_at",
     },
     "factory": {
         "base_fields": ["created_at", "deleted_at"],
     },
 }
 
+# Spec file sections mapped to the command generating them (in creation order)
+SPEC_COMPONENT_COMMANDS = {
+    "models": "create_model",
+    "factories": "create_factory",
+    "serializers": "create_serializer",
+    "services": "create_service",
+    "views": "create_views",
+}
+
+# Spec file sections accepting a "model" option
+SPEC_MODEL_COMPONENTS = ["serializers", "views"]
+
 # Validation patterns
 VALIDATION_PATTERNS = {
     "pascal_case": r"^[A-Z][a-zA-Z0-9_]*$",
@@ -0,0 +1,188 @@
+"""
+Test label discovery for the filtered test command.
+
+TestLabelIndex finds the test modules of each category (tests/models/,
+tests/services/, ...) of the project apps and caches them in
+.smartcli/test_labels.json. Each cached entry records the modification times
+of the directories it was built from: adding, removing or renaming a test
+file changes them, so only the stale entries are scanned again.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from django.apps import apps as django_apps
+from django.conf import settings
+
+from smartcli.config import CACHE_DIRECTORY, TEST_LABELS_CACHE_FILE
+from smartcli.transaction import write_transaction
+from smartcli.utils import get_apps_directory, read_file_content, write_file_content
+
+# Bump when the cache format changes
+CACHE_VERSION = 1
+
+
+def get_project_apps() -> List[Tuple[str, str]]:
+    """
+    Get the installed apps that belong to the project.
+
+    With centralized apps, only apps of the apps directory are kept. Otherwise
+    every installed app located in the project directory is kept.
+
+    Returns:
+        List[Tuple[str, str]]: (dotted app name, app directory) of each app
+    """
+    apps_dir = get_apps_directory()
+    base_dir = os.path.abspath(str(settings.BASE_DIR))
+    project_apps = []
+
+    for app_config in django_apps.get_app_configs():
+        if apps_dir:
+            if not app_config.name.startswith(f"{apps_dir}."):
+                continue
+        elif not os.path.abspath(app_config.path).startswith(base_dir + os.sep):
+            continue
+        project_apps.append((app_config.name, app_config.path))
+
+    return project_apps
+
+
+def get_cache_file() -> str:
+    """Path of the test label cache file of the current project."""
+    return os.path.join(str(settings.BASE_DIR), CACHE_DIRECTORY, TEST_LABELS_CACHE_FILE)
+
+
+class TestLabelIndex:
+    """
+    Cached index of the test labels of each app and test category.
+
+    Usage:
+        index = TestLabelIndex.load()
+        labels = index.get_labels("models")
+        index.save()
+    """
+
+    # Not a test case, despite the name
+    __test__ = False
+
+    def __init__(self, cache_file: Optional[str] = None, entries: Optional[Dict[str, dict]] = None):
+        self.cache_file = cache_file or get_cache_file()
+        self._entries: Dict[str, dict] = entries or {}
+        self._changed = False
+
+    @classmethod
+    def load(cls, cache_file: Optional[str] = None) -> "TestLabelIndex":
+        """
+        Load the index from the cache file (an empty index if missing or invalid).
+
+        Args:
+            cache_file: Path to the cache file (defaults to the project cache)
+
+        Returns:
+            TestLabelIndex: The loaded index
+        """
+        cache_file = cache_file or get_cache_file()
+        try:
+            data = json.loads(read_file_content(cache_file) or "{}")
+        except ValueError:
+            data = {}
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return cls(cache_file)
+        return cls(cache_file, data.get("entries", {}))
+
+    def get_labels(self, category: str, project_apps: Optional[List[Tuple[str, str]]] = None) -> List[str]:
+        """
+        Get the test labels of a category for the project apps.
+
+        Args:
+            category: The test category (models, services, serializers or views)
+            project_apps: (dotted app name, app directory) pairs (defaults to get_project_apps())
+
+        Returns:
+            List[str]: Test labels, e.g. "apps.users.tests.models.test_user"
+        """
+        if project_apps is None:
+            project_apps = get_project_apps()
+
+        labels = []
+        for app_name, app_path in project_apps:
+            key = f"{app_name}:{category}"
+            entry = self._entries.get(key)
+            if entry is None or entry.get("path") != app_path or not self._is_fresh(entry):
+                entry = self._scan(app_name, app_path, category)
+                self._entries[key] = entry
+                self._changed = True
+            labels.extend(entry["labels"])
+
+        return labels
+
+    def save(self) -> None:
+        """Write the index to the cache file if it changed."""
+        if not self._changed:
+            return
+
+        content = json.dumps({"version": CACHE_VERSION, "entries": self._entries}, indent=1, sort_keys=True)
+        try:
+            with write_transaction():
+                write_file_content(self.cache_file, content)
+        except OSError:
+            # A read-only project still runs its tests, just without cache
+            return
+        self._changed = False
+
+    @staticmethod
+    def _is_fresh(entry: dict) -> bool:
+        """Check that the directories of an entry did not change since it was built."""
+        for directory, mtime in entry["mtimes"].items():
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                return False
+        return True
+
+    @staticmethod
+    def _scan(app_name: str, app_path: str, category: str) -> dict:
+        """
+        Find the test modules of a category in an app.
+
+        Test files are searched in tests/<category>/ and its direct
+        subdirectories.
+
+        Returns:
+            dict: The index entry (app path, directory mtimes and labels)
+        """
+        tests_path = os.path.join(app_path, "tests")
+        category_path = os.path.join(tests_path, category)
+        mtimes = {}
+        labels = []
+
+        directories = [(category_path, f"{app_name}.tests.{category}")]
+        for position, (directory, package) in enumerate(directories):
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+                dir_entries = sorted(os.scandir(directory), key=lambda dir_entry: dir_entry.name)
+            except OSError:
+                mtimes[directory] = None
+                continue
+
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir():
+                    # Only one level of subdirectories is searched
+                    if position == 0 and not dir_entry.name.startswith((".", "__")):
+                        directories.append((dir_entry.path, f"{package}.{dir_entry.name}"))
+                elif dir_entry.name.startswith("test_") and dir_entry.name.endswith(".py"):
+                    labels.append(f"{package}.{dir_entry.name[:-3]}")
+
+        if mtimes[category_path] is None:
+            # Creating tests/ or tests/<category>/ changes the parent mtime
+            for directory in (app_path, tests_path):
+                try:
+                    mtimes[directory] = os.stat(directory).st_mtime_ns
+                except OSError:
+                    mtimes[directory] = None
+
+        return {"path": app_path, "mtimes": mtimes, "labels": labels}
@@ -0,0 +1,279 @@
+"""
+Changed-files test impact selection for the filtered test command.
+
+`test --changed-since <ref>` runs only the tests impacted by the files changed
+since a git ref:
+- tests changed themselves
+- tests matching a changed component by naming convention, e.g.
+  serializers/user_serializer.py -> tests/serializers/test_user_serializer.py
+  and factories/user_factory.py -> tests/models/test_user.py
+- tests importing a changed module, directly or transitively, found with a
+  static import graph of the project apps (deleted modules included: the
+  tests still importing them are the ones that will fail)
+
+Changed Python files outside the project apps (settings, shared utilities)
+can't be mapped to tests: the command then runs the full (filtered) suite.
+"""
+
+import ast
+import os
+import subprocess
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from smartcli.config import FILE_SUFFIXES, SOURCE_DIRECTORY_TYPES
+from smartcli.naming import extract_model_name_from_name
+from smartcli.timings import get_test_category
+
+
+def get_changed_files(ref: str, cwd: Optional[str] = None) -> List[str]:
+    """
+    Get the files changed since a git ref, including uncommitted and untracked files.
+
+    Args:
+        ref: Git ref to compare with (branch, tag or commit)
+        cwd: Directory inside the git repository (defaults to the current directory)
+
+    Returns:
+        List[str]: Absolute paths of the changed files
+
+    Raises:
+        ValueError: If git fails (not a repository, unknown ref, ...)
+    """
+    root = _run_git(["rev-parse", "--show-toplevel"], cwd).strip()
+    changed = _run_git(["diff", "--name-only", ref, "--"], cwd).splitlines()
+    changed += _run_git(["ls-files", "--others", "--exclude-standard", "--full-name"], cwd).splitlines()
+    return sorted({os.path.normpath(os.path.join(root, path)) for path in changed if path})
+
+
+def _run_git(args: List[str], cwd: Optional[str] = None) -> str:
+    """Run a git command and return its output."""
+    try:
+        result = subprocess.run(["git"] + args, capture_output=True, text=True, cwd=cwd)
+    except FileNotFoundError:
+        raise ValueError("git is required for --changed-since")
+    if result.returncode != 0:
+        raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+class ImportGraph:
+    """
+    Static import graph of the Python modules of the project apps.
+
+    Usage:
+        graph = ImportGraph.build(project_apps)
+        dependents = graph.get_dependents({"apps.users.models.user"})
+    """
+
+    def __init__(self, modules: Dict[str, str], imports: Dict[str, Set[str]]):
+        self.modules = modules
+        self._dependents: Dict[str, Set[str]] = {}
+        for module, imported_modules in imports.items():
+            for imported in imported_modules:
+                self._dependents.setdefault(imported, set()).add(module)
+
+    @classmethod
+    def build(cls, project_apps: List[Tuple[str, str]], deleted_modules: Iterable[str] = ()) -> "ImportGraph":
+        """
+        Parse every module of the project apps.
+
+        Args:
+            project_apps: (dotted app name, app directory) pairs
+            deleted_modules: Modules that no longer exist but may still be imported
+
+        Returns:
+            ImportGraph: The import graph
+        """
+        modules = {}
+        for app_name, app_path in project_apps:
+            for path in _iter_python_files(app_path):
+                modules[module_name_for_path(path, app_name, app_path)] = path
+        known_modules = set(modules) | set(deleted_modules)
+
+        imports = {}
+        for module, path in modules.items():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    tree = ast.parse(f.read())
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                continue
+            is_package = os.path.basename(path) == "__init__.py"
+            imports[module] = _get_imported_modules(tree, module, is_package, known_modules)
+
+        return cls(modules, imports)
+
+    def get_dependents(self, modules: Iterable[str]) -> Set[str]:
+        """
+        Get the modules importing any of the given modules, directly or transitively.
+
+        Args:
+            modules: Dotted module names
+
+        Returns:
+            Set[str]: The given modules and all their dependents
+        """
+        seen = set(modules)
+        queue = deque(seen)
+        while queue:
+            for dependent in self._dependents.get(queue.popleft(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen
+
+
+def _iter_python_files(directory: str) -> Iterable[str]:
+    """Yield the Python files of a directory tree (skipping hidden and cache directories)."""
+    for root, directories, files in os.walk(directory):
+        directories[:] = sorted(name for name in directories if not name.startswith((".", "__")))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                yield os.path.join(root, name)
+
+
+def module_name_for_path(path: str, app_name: str, app_path: str) -> str:
+    """
+    Get the dotted module name of a file of an app.
+
+    Args:
+        path: Path to the Python file
+        app_name: Dotted name of the app
+        app_path: Directory of the app
+
+    Returns:
+        str: The module name (packages are named after their directory)
+    """
+    relative = os.path.relpath(os.path.splitext(path)[0], app_path)
+    parts = [part for part in relative.split(os.sep) if part != "."]
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join([app_name] + parts)
+
+
+def _get_imported_modules(tree: ast.Module, module: str, is_package: bool, known_modules: Set[str]) -> Set[str]:
+    """Get the project modules imported by a module (relative imports resolved)."""
+    package = module if is_package else module.rpartition(".")[0]
+    imported = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                package_parts = package.split(".")
+                if node.level > 1:
+                    package_parts = package_parts[: -(node.level - 1)]
+                base = ".".join(part for part in package_parts + [base] if part)
+            # "from package import name" may import the submodule package.name
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        for name in names:
+            # "import a.b.c" imports a, a.b and a.b.c
+            parts = name.split(".")
+            for end in range(1, len(parts) + 1):
+                candidate = ".".join(parts[:end])
+                if candidate in known_modules and candidate != module:
+                    imported.add(candidate)
+
+    return imported
+
+
+def get_test_candidates(path: str, app_path: str) -> List[str]:
+    """
+    Get the test files matching a component file by naming convention.
+
+    Args:
+        path: Path to the changed component file
+        app_path: Directory of the app
+
+    Returns:
+        List[str]: Paths of the conventional test files (existing or not)
+    """
+    relative = os.path.relpath(path, app_path).split(os.sep)
+    if len(relative) != 2 or relative[0] not in SOURCE_DIRECTORY_TYPES:
+        return []
+
+    directory, filename = relative
+    stem = os.path.splitext(filename)[0]
+    if stem == "__init__":
+        return []
+
+    component_type = SOURCE_DIRECTORY_TYPES[directory]
+    suffix = FILE_SUFFIXES[component_type]
+    base_name = extract_model_name_from_name(stem, suffix) if suffix else stem
+    tests_path = os.path.join(app_path, "tests")
+
+    if component_type == "factory":
+        # Factories are exercised by the tests of their model
+        return [os.path.join(tests_path, "models", f"test_{base_name}.py")]
+    return [os.path.join(tests_path, directory, f"test_{base_name}{suffix}.py")]
+
+
+def is_test_module(module: str) -> bool:
+    """Check if a module is a test module (tests/.../test_*.py)."""
+    parts = module.split(".")
+    return "tests" in parts[:-1] and parts[-1].startswith("test_")
+
+
+def get_impacted_test_labels(
+    changed_files: List[str],
+    project_apps: List[Tuple[str, str]],
+    categories: Optional[List[str]] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Get the test labels impacted by changed files.
+
+    Args:
+        changed_files: Absolute paths of the changed files
+        project_apps: (dotted app name, app directory) pairs
+        categories: Only keep tests of these categories (all tests when None)
+
+    Returns:
+        Tuple[List[str], List[str]]: Impacted test labels, and changed Python
+        files outside the project apps (not mapped to tests)
+    """
+    changed_modules = set()
+    deleted_modules = set()
+    unmapped = []
+
+    for path in changed_files:
+        if not path.endswith(".py"):
+            continue
+        app = _find_app(path, project_apps)
+        if app is None:
+            unmapped.append(path)
+            continue
+
+        app_name, app_path = app
+        module = module_name_for_path(path, app_name, app_path)
+        changed_modules.add(module)
+        if not os.path.exists(path):
+            deleted_modules.add(module)
+        for test_path in get_test_candidates(path, app_path):
+            if os.path.exists(test_path):
+                changed_modules.add(module_name_for_path(test_path, app_name, app_path))
+
+    # Tests still importing deleted modules are impacted too
+    graph = ImportGraph.build(project_apps, deleted_modules)
+    impacted = [module for module in graph.get_dependents(changed_modules) if is_test_module(module)]
+    if categories is not None:
+        impacted = [module for module in impacted if get_test_category(module) in categories]
+
+    # Deleted test files can't be run
+    labels = sorted(module for module in impacted if module in graph.modules)
+    return labels, unmapped
+
+
+def _find_app(path: str, project_apps: List[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+    """Find the app containing a file (the deepest one for nested apps)."""
+    matches = [
+        (app_name, app_path)
+        for app_name, app_path in project_apps
+        if os.path.abspath(path).startswith(os.path.abspath(app_path) + os.sep)
+    ]
+    return max(matches, key=lambda app: len(app[1])) if matches else None
+
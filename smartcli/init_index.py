@@ -0,0 +1,477 @@
+"""
+AST-based editor for package __init__.py files.
+
+This module provides InitFileIndex, which parses an __init__.py file once,
+records its imports and __all__ list, accepts any number of additions in
+memory and renders the updated content with minimal edits: new imports are
+inserted after the import section and only the __all__ assignment is
+rewritten.
+
+InitFileBatch groups the updates of several generators so that each
+__init__.py file is parsed and written only once.
+
+Lazy __init__.py files (USE_LAZY_INIT_FILES) don't import their submodules:
+they map each exported name to its submodule in a _LAZY_IMPORTS table and
+import it on first access with a module __getattr__ (PEP 562). Additions are
+written to the table instead of import lines.
+"""
+
+import ast
+import io
+import tokenize
+from typing import Dict, List, Optional, Set, Tuple
+
+from smartcli.config import LAZY_IMPORTS_NAME
+from smartcli.profiling import INIT_UPDATES, profile_phase
+from smartcli.utils import add_import_to_content, read_file_content, update_all_list, write_file_content
+
+LAZY_INIT_DOCSTRING = '"""Exports of the package, imported from their submodule on first access (PEP 562)."""'
+
+LAZY_INIT_LOADER = '''
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access."""
+    if name in {table}:
+        value = getattr(importlib.import_module({table}[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    """List the exported names, imported or not."""
+    return sorted(set(globals()) | set(__all__))
+'''.format(table=LAZY_IMPORTS_NAME)
+
+
+class InitFileIndex:
+    """
+    In-memory index of the imports and __all__ entries of an __init__.py file.
+
+    Usage:
+        index = InitFileIndex.from_file(init_file)
+        index.add_import("from .user import User")
+        index.add_to_all("User")
+        content = index.render()
+
+    Args:
+        content: Content of the __init__.py file
+        lazy: Write relative imports to a lazy registry. Empty files and files
+            made only of relative imports and __all__ are converted, files that
+            are already lazy are always maintained as such.
+    """
+
+    def __init__(self, content: str = "", lazy: bool = False):
+        self.content = content
+        self._imported: Set[Tuple[int, str, str]] = set()
+        self._all_items: List[str] = []
+        self._all_span: Optional[Tuple[int, int]] = None
+        self._all_has_comments = False
+        self._all_is_dynamic = False
+        self._all_last_item_end: Optional[int] = None
+        self._import_end_line = 0
+        self._new_imports: List[str] = []
+        self._new_all_items: List[str] = []
+        self._lazy_imports: Dict[str, str] = {}
+        self._lazy_span: Optional[Tuple[int, int]] = None
+        self._lazy_has_comments = False
+        self._new_lazy_imports: Dict[str, str] = {}
+        self._relative_imports_only = True
+        self._docstring: Optional[str] = None
+
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            # Unparsable file: render() falls back to the text-based helpers
+            self._tree = None
+            self.is_lazy = False
+        else:
+            self._tree = tree
+            self._index(tree)
+            self.is_lazy = self._lazy_span is not None or (lazy and self._relative_imports_only)
+
+    @classmethod
+    def from_file(cls, file_path: str, lazy: bool = False) -> "InitFileIndex":
+        """
+        Build an index from a file (an empty index if the file doesn't exist).
+
+        Args:
+            file_path: Path to the __init__.py file
+            lazy: Write relative imports to a lazy registry (see InitFileIndex)
+
+        Returns:
+            InitFileIndex: The index of the file
+        """
+        return cls(read_file_content(file_path), lazy)
+
+    @property
+    def all_items(self) -> List[str]:
+        """Names currently exported in __all__, including pending additions."""
+        return self._all_items + self._new_all_items
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether render() would produce content different from the original."""
+        return bool(self._new_imports or self._new_all_items or self._new_lazy_imports)
+
+    def add_import(self, import_line: str) -> bool:
+        """
+        Add an import line unless all of its names are already imported.
+
+        Args:
+            import_line: Import line to add (e.g. "from .user import User")
+
+        Returns:
+            bool: True if the import was added
+        """
+        if self.is_lazy:
+            lazy_imports = self._lazy_import_entries(import_line)
+            if lazy_imports is not None:
+                return self._add_lazy_imports(lazy_imports)
+
+        keys = self._import_keys(import_line)
+        if keys is None:
+            # Not a plain import statement, fall back to a textual check
+            if import_line in self.content or import_line in self._new_imports:
+                return False
+        elif keys <= self._imported:
+            return False
+        else:
+            self._imported.update(keys)
+
+        self._new_imports.append(import_line)
+        return True
+
+    def add_to_all(self, name: str) -> bool:
+        """
+        Add a name to __all__ unless it is already exported.
+
+        Args:
+            name: Name to add to __all__
+
+        Returns:
+            bool: True if the name was added
+        """
+        if name in self._all_items or name in self._new_all_items:
+            return False
+        self._new_all_items.append(name)
+        return True
+
+    def render(self) -> str:
+        """
+        Render the updated file content.
+
+        Returns:
+            str: The content with pending imports and __all__ entries applied
+        """
+        if not self.has_changes:
+            return self.content
+
+        if self._tree is None:
+            return self._render_fallback()
+
+        if self.is_lazy and self._lazy_span is None:
+            return self._render_lazy_file()
+
+        content = self.content
+        edits = []
+
+        if self._new_lazy_imports:
+            start, end = self._lazy_span
+            edits.append((start, end, self._render_lazy_imports(content[start:end])))
+
+        if self._new_imports:
+            offset = self._line_offset(self._import_end_line)
+            new_imports = "\n".join(self._new_imports)
+            if offset == len(content) and content and not content.endswith("\n"):
+                edits.append((offset, offset, "\n" + new_imports))
+            else:
+                edits.append((offset, offset, new_imports + "\n"))
+
+        if self._new_all_items and self._all_span is not None:
+            start, end = self._all_span
+            edits.append((start, end, self._render_all(content[start:end])))
+
+        # Apply edits from the end of the file so offsets stay valid. An import
+        # inserted where __all__ starts goes after the __all__ replacement.
+        for start, end, text in sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+            content = content[:start] + text + content[end:]
+
+        if self._new_all_items and self._all_span is None and not self._all_is_dynamic:
+            if content and not content.endswith("\n"):
+                content += "\n"
+            content += "\n" + self._format_all(sorted(self._new_all_items)) + "\n"
+
+        return content
+
+    def _index(self, tree: ast.Module) -> None:
+        """Record imports, the import section end and the __all__ assignment."""
+        body = tree.body
+        in_import_section = True
+
+        for position, node in enumerate(body):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self._imported.update(self._node_import_keys(node))
+                if in_import_section:
+                    self._import_end_line = node.end_lineno
+                continue
+
+            is_docstring = (
+                position == 0
+                and isinstance(node, ast.Expr)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+            )
+            if is_docstring:
+                self._docstring = ast.get_source_segment(self.content, node)
+                if self._import_end_line == 0:
+                    self._import_end_line = node.end_lineno
+                continue
+
+            in_import_section = False
+            self._index_all(node)
+            self._index_lazy_imports(node)
+
+        if self._lazy_span is not None:
+            return
+
+        # Eager files made of relative imports and __all__ can be converted to a lazy registry
+        for node in body:
+            lazy_imports = self._lazy_import_entries(ast.unparse(node)) if isinstance(node, ast.ImportFrom) else None
+            if lazy_imports is not None:
+                for name, module in lazy_imports.items():
+                    self._lazy_imports.setdefault(name, module)
+            elif not (node is body[0] and self._docstring is not None) and not self._is_all_assignment(node):
+                self._relative_imports_only = False
+
+    @staticmethod
+    def _is_all_assignment(node: ast.stmt) -> bool:
+        """Check if node assigns __all__."""
+        return isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+        )
+
+    def _index_lazy_imports(self, node: ast.stmt) -> None:
+        """Record the lazy import table if node is a literal _LAZY_IMPORTS assignment."""
+        if not isinstance(node, ast.Assign) or self._lazy_span is not None:
+            return
+        if not any(isinstance(target, ast.Name) and target.id == LAZY_IMPORTS_NAME for target in node.targets):
+            return
+        if not isinstance(node.value, ast.Dict) or not all(
+            isinstance(item, ast.Constant) and isinstance(item.value, str)
+            for item in node.value.keys + node.value.values
+        ):
+            return
+
+        self._lazy_imports = {key.value: value.value for key, value in zip(node.value.keys, node.value.values)}
+        start = self._position_offset(node.lineno, node.col_offset)
+        end = self._position_offset(node.end_lineno, node.end_col_offset)
+        self._lazy_span = (start, end)
+        self._lazy_has_comments = self._contains_comment(self.content[start:end])
+
+    def _index_all(self, node: ast.stmt) -> None:
+        """Record the __all__ list if node is a literal __all__ assignment."""
+        if not isinstance(node, ast.Assign) or self._all_span is not None:
+            return
+        if not any(isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+            return
+        is_literal = isinstance(node.value, (ast.List, ast.Tuple)) and all(
+            isinstance(element, ast.Constant) and isinstance(element.value, str)
+            for element in node.value.elts
+        )
+        if not is_literal:
+            # Computed __all__: leave it to the user
+            self._all_is_dynamic = True
+            return
+
+        self._all_items = [element.value for element in node.value.elts]
+        start = self._position_offset(node.lineno, node.col_offset)
+        end = self._position_offset(node.end_lineno, node.end_col_offset)
+        self._all_span = (start, end)
+        if node.value.elts:
+            last_item = node.value.elts[-1]
+            self._all_last_item_end = self._position_offset(last_item.end_lineno, last_item.end_col_offset) - start
+        self._all_has_comments = self._contains_comment(self.content[start:end])
+
+    def _render_all(self, original: str) -> str:
+        """Render the __all__ assignment with the pending names added."""
+        if not self._all_has_comments and original.rstrip().endswith("]"):
+            return self._format_all(sorted(self._all_items + self._new_all_items))
+
+        # Keep comments (and tuples) untouched, insert before the closing bracket
+        text = original.rstrip()
+        if self._all_last_item_end is not None:
+            position = self._all_last_item_end
+            if not text[position:].lstrip().startswith(","):
+                text = text[:position] + "," + text[position:]
+        closing = text[-1]
+        body = text[:-1].rstrip()
+        new_items = "".join(f'\n    "{item}",' for item in self._new_all_items)
+        return f"{body}{new_items}\n{closing}"
+
+    @staticmethod
+    def _format_all(items: List[str]) -> str:
+        """Format an __all__ list the way the generators write it."""
+        formatted_items = ",\n    ".join(f'"{item}"' for item in items)
+        return f"__all__ = [\n    {formatted_items}\n]"
+
+    @staticmethod
+    def _lazy_import_entries(import_line: str) -> Optional[Dict[str, str]]:
+        """Parse a relative import line into {name: submodule} lazy entries (None for other imports)."""
+        try:
+            tree = ast.parse(import_line.strip())
+        except SyntaxError:
+            return None
+        if len(tree.body) != 1 or not isinstance(tree.body[0], ast.ImportFrom):
+            return None
+        node = tree.body[0]
+        if not node.level or any(alias.name == "*" or alias.asname for alias in node.names):
+            return None
+        module = "." * node.level + (node.module or "")
+        return {alias.name: module for alias in node.names}
+
+    def _add_lazy_imports(self, lazy_imports: Dict[str, str]) -> bool:
+        """Add entries to the lazy import table, returns True if any was added."""
+        added = False
+        for name, module in lazy_imports.items():
+            if name not in self._lazy_imports and name not in self._new_lazy_imports:
+                self._new_lazy_imports[name] = module
+                added = True
+        return added
+
+    def _render_lazy_imports(self, original: str) -> str:
+        """Render the _LAZY_IMPORTS assignment with the pending entries added."""
+        if not self._lazy_has_comments:
+            return self._format_lazy_imports({**self._lazy_imports, **self._new_lazy_imports})
+
+        # Keep comments untouched, insert before the closing brace
+        body = original.rstrip()[:-1].rstrip()
+        if not body.endswith((",", "{")):
+            body += ","
+        new_entries = "".join(f'\n    "{name}": "{module}",' for name, module in self._new_lazy_imports.items())
+        return f"{body}{new_entries}\n}}"
+
+    @staticmethod
+    def _format_lazy_imports(lazy_imports: Dict[str, str]) -> str:
+        """Format the _LAZY_IMPORTS table, sorted by name."""
+        entries = "".join(f'    "{name}": "{module}",\n' for name, module in sorted(lazy_imports.items()))
+        return f"{LAZY_IMPORTS_NAME} = {{\n{entries}}}"
+
+    def _render_lazy_file(self) -> str:
+        """Render an empty or eager __init__.py file as a lazy registry."""
+        lazy_imports = {**self._lazy_imports, **self._new_lazy_imports}
+        all_items = sorted(set(self._all_items + self._new_all_items))
+        imports = "".join(f"{import_line}\n" for import_line in self._new_imports)
+        return (
+            f"{self._docstring or LAZY_INIT_DOCSTRING}\n\n"
+            f"import importlib\n{imports}\n"
+            f"{self._format_lazy_imports(lazy_imports)}\n\n"
+            f"{self._format_all(all_items)}\n"
+            f"{LAZY_INIT_LOADER}"
+        )
+
+    def _render_fallback(self) -> str:
+        """Apply pending changes with the text-based helpers."""
+        content = self.content
+        for import_line in self._new_imports:
+            content = add_import_to_content(content, import_line)
+        for name in self._new_all_items:
+            content = update_all_list(content, name)
+        return content
+
+    def _line_offset(self, line_index: int) -> int:
+        """Character offset of the start of a 0-based line index."""
+        lines = self.content.split("\n")
+        line_index = min(line_index, len(lines))
+        offset = sum(len(line) + 1 for line in lines[:line_index])
+        return min(offset, len(self.content))
+
+    def _position_offset(self, lineno: int, col_offset: int) -> int:
+        """Character offset of an AST position (1-based line, UTF-8 byte column)."""
+        line = self.content.split("\n")[lineno - 1]
+        column = len(line.encode("utf-8")[:col_offset].decode("utf-8", errors="ignore"))
+        return self._line_offset(lineno - 1) + column
+
+    @staticmethod
+    def _contains_comment(source: str) -> bool:
+        """Check if a source fragment contains comments."""
+        try:
+            tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+            return any(token.type == tokenize.COMMENT for token in tokens)
+        except (tokenize.TokenError, SyntaxError):
+            return "#" in source
+
+    @classmethod
+    def _import_keys(cls, import_line: str) -> Optional[Set[Tuple[int, str, str]]]:
+        """Parse an import line into (level, module, name) keys."""
+        try:
+            tree = ast.parse(import_line.strip())
+        except SyntaxError:
+            return None
+        if len(tree.body) != 1 or not isinstance(tree.body[0], (ast.Import, ast.ImportFrom)):
+            return None
+        return cls._node_import_keys(tree.body[0])
+
+    @staticmethod
+    def _node_import_keys(node: ast.stmt) -> Set[Tuple[int, str, str]]:
+        """Get the (level, module, name) keys imported by an import node."""
+        if isinstance(node, ast.ImportFrom):
+            return {(node.level, node.module or "", alias.asname or alias.name) for alias in node.names}
+        return {(0, "", alias.asname or alias.name) for alias in node.names}
+
+
+class InitFileBatch:
+    """
+    Collect __init__.py import/__all__ updates and apply them in a single pass.
+
+    Each __init__.py file is read and written only once on flush, no matter
+    how many components were added to it.
+    """
+
+    def __init__(self):
+        self._updates: Dict[str, List[Tuple[str, List[str]]]] = {}
+        self._lazy_files: Set[str] = set()
+        # __init__.py files of the last flush that already had all their imports
+        self.unchanged_files: List[str] = []
+
+    def add(self, init_file: str, import_line: str, names: List[str], lazy: bool = False) -> None:
+        """
+        Queue an import line and the names to export from an __init__.py file.
+
+        Args:
+            init_file: Path to the __init__.py file
+            import_line: Import line to add
+            names: Names to add to __all__
+            lazy: Write the import to a lazy registry (see InitFileIndex)
+        """
+        self._updates.setdefault(init_file, []).append((import_line, list(names)))
+        if lazy:
+            self._lazy_files.add(init_file)
+
+    @profile_phase(INIT_UPDATES)
+    def flush(self) -> List[str]:
+        """
+        Apply all queued updates, one read and at most one write per file.
+
+        Files already holding every queued import are not rewritten, they are
+        listed in unchanged_files.
+
+        Returns:
+            List[str]: Paths of the updated __init__.py files
+        """
+        updated_files = []
+        self.unchanged_files = []
+        for init_file, updates in self._updates.items():
+            index = InitFileIndex.from_file(init_file, init_file in self._lazy_files)
+            for import_line, names in updates:
+                index.add_import(import_line)
+                for name in names:
+                    index.add_to_all(name)
+            if write_file_content(init_file, index.render()):
+                updated_files.append(init_file)
+            else:
+                self.unchanged_files.append(init_file)
+
+        self._updates = {}
+        self._lazy_files = set()
+        return updated_files
@@ -0,0 +1,357 @@
+"""
+Model introspection for the generator commands.
+
+Generators read the installed models from the Django app registry (`_meta`)
+instead of only knowing the base fields of TEMPLATE_CONFIGS. Models that are
+not installed yet (e.g. created earlier in the same `apply` run) can't be
+described: generators then fall back to the base fields.
+
+The models of an app are described once per process, so a batch of
+generators (`apply`, the `serve` server) doesn't introspect a model twice.
+Descriptions are only valid while the model modules are unchanged: the
+installed classes are not reloaded when a models file is edited, so the
+`serve` server compares get_models_mtimes() with its startup values and
+leaves model-driven commands to the CLI once they differ.
+"""
+
+import importlib
+import os
+from typing import Dict, List, Optional
+
+from django.apps import apps as django_apps
+from django.db import models
+
+from smartcli.config import TEMPLATE_CONFIGS
+from smartcli.discovery import get_project_apps
+from smartcli.utils import get_app_import_path
+
+# Faker providers of the fields without specific handling, by field class
+FAKER_PROVIDERS = [
+    (models.EmailField, 'factory.Faker("email")'),
+    (models.URLField, 'factory.Faker("url")'),
+    (models.TextField, 'factory.Faker("paragraph")'),
+    (models.BooleanField, 'factory.Faker("pybool")'),
+    (models.SmallIntegerField, 'factory.Faker("pyint", max_value=32767)'),
+    (models.IntegerField, 'factory.Faker("pyint")'),
+    (models.FloatField, 'factory.Faker("pyfloat")'),
+    (models.DateTimeField, "factory.LazyFunction(timezone.now)"),
+    (models.DateField, 'factory.Faker("date_object")'),
+    (models.TimeField, 'factory.Faker("time_object")'),
+    (models.UUIDField, 'factory.Faker("uuid4", cast_to=None)'),
+    (models.JSONField, "factory.LazyFunction(dict)"),
+]
+
+# Model descriptions by app label, see get_model_description
+_model_descriptions: Dict[str, Dict[str, "ModelDescription"]] = {}
+
+
+def get_model(app_name: str, model_name: str) -> Optional[type]:
+    """
+    Get an installed model class.
+
+    Args:
+        app_name: Name of the app
+        model_name: Name of the model
+
+    Returns:
+        Optional[type]: The model class, or None if it isn't installed
+    """
+    try:
+        return django_apps.get_model(app_name.rsplit(".", 1)[-1], model_name)
+    except LookupError:
+        return None
+
+
+def get_model_field_names(model: type) -> List[str]:
+    """
+    Get the names of the forward fields of a model (what a "__all__" serializer exposes).
+
+    Args:
+        model: The model class
+
+    Returns:
+        List[str]: Concrete and many-to-many field names, in declaration order
+    """
+    return [
+        field.name
+        for field in model._meta.get_fields()
+        if field.concrete or (field.many_to_many and not field.auto_created)
+    ]
+
+
+def get_serializer_fields(app_name: str, model_name: str) -> Optional[List[str]]:
+    """
+    Get the fields of the existing serializer of a model.
+
+    Args:
+        app_name: Name of the app
+        model_name: Name of the model
+
+    Returns:
+        Optional[List[str]]: Meta.fields of {model_name}Serializer, or None if
+        it can't be imported
+    """
+    try:
+        serializers = importlib.import_module(f"{get_app_import_path(app_name)}.serializers")
+        fields = getattr(serializers, f"{model_name}Serializer").Meta.fields
+    except Exception:
+        return None
+
+    if fields == "__all__":
+        model = get_model(app_name, model_name)
+        return get_model_field_names(model) if model is not None else None
+    return list(fields)
+
+
+class QueryPlan:
+    """
+    Queryset optimizations of a generated view.
+
+    Args:
+        only_fields: Fields loaded with only()
+        select_related: Relations joined with select_related()
+        prefetch_related: Relations loaded with prefetch_related()
+        create_queries: Queries of the create action besides the INSERT and
+            the serialization: unique checks and related lookups of the
+            validation, many-to-many writes
+    """
+
+    def __init__(
+        self,
+        only_fields: List[str],
+        select_related: List[str],
+        prefetch_related: List[str],
+        create_queries: int = 0,
+    ):
+        self.only_fields = only_fields
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+        self.create_queries = create_queries
+
+
+def get_view_query_plan(app_name: str, model_name: str, ordering: str) -> QueryPlan:
+    """
+    Plan the queryset of a view from its serializer fields and the model relations.
+
+    Serialized concrete fields are loaded with only(), forward relations are
+    joined and many relations are prefetched, so serializing a page runs a
+    fixed number of queries. Queries of the create validation are counted for
+    the create query budget (an upper bound: read-only fields are counted too).
+
+    Args:
+        app_name: Name of the app
+        model_name: Name of the model
+        ordering: Ordering of the pagination (its field must be loaded)
+
+    Returns:
+        QueryPlan: The queryset optimizations
+    """
+    model = get_model(app_name, model_name)
+    serializer_fields = get_serializer_fields(app_name, model_name)
+    if serializer_fields is None:
+        if model is not None:
+            serializer_fields = get_model_field_names(model)
+        else:
+            serializer_fields = list(TEMPLATE_CONFIGS["serializer"]["base_fields"])
+
+    ordering_field = ordering.lstrip("-")
+    if model is None:
+        only_fields = list(dict.fromkeys(serializer_fields + [ordering_field]))
+        return QueryPlan(only_fields, [], [])
+
+    # Reverse relations are serialized under their accessor name
+    fields = {}
+    for field in model._meta.get_fields():
+        fields[field.get_accessor_name() if field.auto_created and not field.concrete else field.name] = field
+
+    only_fields, select_related, prefetch_related = [], [], []
+    create_queries = _count_create_queries(model, [fields[name] for name in serializer_fields if name in fields])
+    for name in dict.fromkeys(serializer_fields + [ordering_field]):
+        field = fields.get(name)
+        if field is None:
+            # Serializer-only fields (methods, properties) don't change the query
+            continue
+        if field.many_to_many or field.one_to_many:
+            prefetch_related.append(name)
+        elif field.one_to_one and not field.concrete:
+            select_related.append(name)
+        else:
+            only_fields.append(name)
+            if field.many_to_one or field.one_to_one:
+                select_related.append(name)
+
+    return QueryPlan(only_fields, select_related, prefetch_related, create_queries)
+
+
+def _count_create_queries(model: type, serialized_fields: list) -> int:
+    """Count the queries a ModelSerializer runs to create a model, besides the INSERT."""
+    names = {field.name for field in serialized_fields}
+    count = 0
+    for field in serialized_fields:
+        if field.auto_created and not field.concrete or field.primary_key or not field.editable:
+            continue
+        if field.many_to_many:
+            # set() reads the current relations (none are given by the factory payload)
+            count += 1
+            continue
+        # UniqueValidator, then the lookup of the related object
+        count += int(bool(field.unique)) + int(bool(field.many_to_one or field.one_to_one))
+
+    # UniqueTogetherValidator of unique_together and unique constraints
+    unique_together = list(model._meta.unique_together) + [
+        constraint.fields for constraint in model._meta.total_unique_constraints
+    ]
+    count += sum(1 for field_names in unique_together if set(field_names) <= names)
+    return count
+
+
+class ModelDescription:
+    """
+    Fields of an installed model, as used by the serializer and factory generators.
+
+    Args:
+        fields: Forward field names (serializer fields), in declaration order
+        read_only_fields: Primary key, non-editable and base read-only fields
+        factory_declarations: Factory body lines filling the required fields
+        many_to_many: Many-to-many fields, set after creation by factories
+    """
+
+    def __init__(
+        self,
+        fields: List[str],
+        read_only_fields: List[str],
+        factory_declarations: List[str],
+        many_to_many: List[str],
+    ):
+        self.fields = fields
+        self.read_only_fields = read_only_fields
+        self.factory_declarations = factory_declarations
+        self.many_to_many = many_to_many
+
+
+def get_model_description(app_name: str, model_name: str) -> Optional[ModelDescription]:
+    """
+    Describe an installed model.
+
+    All the models of the app are described on the first call, later calls
+    are served from memory.
+
+    Args:
+        app_name: Name of the app
+        model_name: Name of the model
+
+    Returns:
+        Optional[ModelDescription]: The description, or None if the model isn't installed
+    """
+    app_label = app_name.rsplit(".", 1)[-1]
+    if app_label not in _model_descriptions:
+        try:
+            app_models = django_apps.get_app_config(app_label).get_models()
+        except LookupError:
+            return None
+        project_app_names = {name for name, _ in get_project_apps()}
+        _model_descriptions[app_label] = {
+            model.__name__: describe_model(model, project_app_names) for model in app_models
+        }
+    return _model_descriptions[app_label].get(model_name)
+
+
+def get_models_mtimes() -> Dict[str, int]:
+    """
+    Get the modification times of the model modules of the project apps.
+
+    Returns:
+        Dict[str, int]: Modification time (ns) of each models.py and models/*.py file
+    """
+    mtimes = {}
+    for _, app_path in get_project_apps():
+        file_paths = [os.path.join(app_path, "models.py")]
+        models_dir = os.path.join(app_path, "models")
+        if os.path.isdir(models_dir):
+            file_paths += [
+                os.path.join(models_dir, name) for name in sorted(os.listdir(models_dir)) if name.endswith(".py")
+            ]
+        for file_path in file_paths:
+            try:
+                mtimes[file_path] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                continue
+    return mtimes
+
+
+def clear_model_descriptions() -> None:
+    """Forget the described models (e.g. after the app registry changed)."""
+    _model_descriptions.clear()
+
+
+def describe_model(model: type, project_app_names: set) -> ModelDescription:
+    """
+    Describe a model from its _meta.
+
+    Args:
+        model: The model class
+        project_app_names: Dotted names of the project apps (their models have factories)
+
+    Returns:
+        ModelDescription: The description
+    """
+    fields = get_model_field_names(model)
+    base_read_only = TEMPLATE_CONFIGS["serializer"]["read_only_fields"]
+    read_only_fields = [
+        field.name
+        for field in model._meta.get_fields()
+        if field.name in fields
+        and (field.primary_key or not field.editable or field.name in base_read_only)
+    ]
+
+    factory_declarations = []
+    many_to_many = []
+    for field in model._meta.get_fields():
+        if field.name not in fields:
+            continue
+        if field.many_to_many:
+            many_to_many.append(field.name)
+            continue
+        declaration = _get_factory_declaration(model, field, project_app_names)
+        if declaration is not None:
+            factory_declarations.append(declaration)
+
+    return ModelDescription(fields, read_only_fields, factory_declarations, many_to_many)
+
+
+def _get_factory_declaration(model: type, field, project_app_names: set) -> Optional[str]:
+    """Get the factory line of a field, or None if the model fills it (default, null, auto)."""
+    name = field.name
+    if name == "created_at":
+        return f"{name} = factory.LazyFunction(timezone.now)"
+    if name == "deleted_at":
+        return f"{name} = None"
+    if field.primary_key or not field.editable or field.has_default() or field.null or field.blank:
+        return None
+
+    if field.is_relation:
+        related_model = field.related_model
+        related_app = related_model._meta.app_config.name
+        if related_model is model or related_app not in project_app_names:
+            return f"# {name}: no factory for {related_model._meta.label}, pass it when creating"
+        return f'{name} = factory.SubFactory("{related_app}.factories.{related_model.__name__}Factory")'
+
+    if field.choices:
+        values = ", ".join(repr(value) for value, _ in field.flatchoices)
+        return f'{name} = factory.Faker("random_element", elements=[{values}])'
+    if field.unique and isinstance(field, models.EmailField):
+        return f'{name} = factory.Sequence(lambda n: f"{name}-{{n}}@example.com")'
+    if field.unique and isinstance(field, models.CharField):
+        return f'{name} = factory.Sequence(lambda n: f"{name}-{{n}}")'
+    if isinstance(field, models.DecimalField):
+        left_digits = field.max_digits - field.decimal_places
+        return (
+            f'{name} = factory.Faker("pydecimal", left_digits={left_digits}, '
+            f"right_digits={field.decimal_places}, positive=True)"
+        )
+    for field_class, provider in FAKER_PROVIDERS:
+        if isinstance(field, field_class):
+            return f"{name} = {provider}"
+    if isinstance(field, models.CharField):
+        return f'{name} = factory.Faker("pystr", max_chars={min(field.max_length or 20, 20)})'
+    return f"# {name}: unsupported {type(field).__name__}, pass it when creating"
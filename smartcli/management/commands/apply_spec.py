@@ -0,0 +1,97 @@
+from django.core.management import call_command, load_command_class
+from django.core.management.base import BaseCommand, CommandError
+
+from smartcli.config import SPEC_COMPONENT_COMMANDS
+from smartcli.init_index import InitFileBatch
+from smartcli.profiling import VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.spec import load_spec
+from smartcli.transaction import write_transaction
+from smartcli.utils import check_file_exists, get_app_path
+
+
+class Command(ProfiledCommandMixin, BaseCommand):
+    """
+    Custom command to create modules and components from a declarative spec file.
+
+    Usage:
+        python manage.py apply_spec <spec_file>
+
+    The spec file (YAML, JSON or TOML) lists the apps to scaffold and their
+    components:
+
+        apps:
+          users:
+            models: [User, Profile]
+            serializers: [User, {name: ProfileDetail, model: Profile}]
+            services: [User]
+            views: [User]
+
+    Missing apps are created with a single create_module call, then components are generated
+    in order (models, factories, serializers, services, views) in a single
+    process. __init__.py imports and __all__ lists are updated once per file
+    at the end, and all files are committed in one write transaction: if any
+    component fails, nothing is written.
+    """
+
+    help = "Creates modules and components declared in a spec file (YAML, JSON or TOML)"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "spec_file", type=str, help="Path to the spec file (.yaml, .yml, .json or .toml)"
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        try:
+            with profile_phase(VALIDATION):
+                spec = load_spec(options["spec_file"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        batch = InitFileBatch()
+        created_count = 0
+
+        # All files of the spec are committed together, or not at all
+        with write_transaction():
+            # Missing apps are created together, with a single settings update
+            missing_apps = [app_name for app_name in spec if not check_file_exists(get_app_path(app_name))]
+            if missing_apps:
+                self._run_command("create_module", batch, *missing_apps)
+
+            for app_name, components in spec.items():
+                for section, command_name in SPEC_COMPONENT_COMMANDS.items():
+                    for item in components[section]:
+                        item_options = {"model": item["model"]} if item.get("model") else {}
+                        self._run_command(command_name, batch, item["name"], app_name, **item_options)
+                        created_count += 1
+
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully applied spec '{options['spec_file']}': "
+                f"{len(spec)} app(s), {created_count} component(s) created!"
+            )
+        )
+
+    def _run_command(self, command_name: str, batch: InitFileBatch, *args, **options) -> None:
+        """
+        Run a smartcli command in-process, sharing the __init__.py batch.
+
+        Args:
+            command_name: Name of the management command
+            batch: The InitFileBatch collecting __init__.py updates
+            *args: Positional arguments for the command
+            **options: Keyword options for the command
+        """
+        command = load_command_class("smartcli", command_name)
+        command.init_batch = batch
+        try:
+            call_command(command, *args, stdout=self.stdout, stderr=self.stderr, **options)
+        except ValueError as e:
+            # Validation helpers raise ValueError
+            raise CommandError(str(e))
@@ -3,17 +3,22 @@ from typing import List, Tuple
 
 from django.core.management.base import CommandError, BaseCommand
 
+from smartcli.init_index import InitFileBatch
+from smartcli.profiling import TEMPLATE_RENDERING, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.introspection import get_model_description
+from smartcli.project_index import ProjectIndex
+from smartcli.transaction import write_transaction
 from smartcli.templates import ModelTemplates
 from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, WARNING_MESSAGES
 from smartcli.utils import (
     validate_pascal_case_name, validate_app_exists, validate_directory_exists,
     get_app_path, pascal_to_snake_case, check_file_exists,
-    write_file_content, add_import_to_content, update_all_list, clean_up_files,
+    write_file_content,
     extract_model_name_from_name
 )
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
     Custom command to create a new Django factory with proper template and imports.
 
@@ -27,6 +32,9 @@ class Command(BaseCommand):
 
     help = "Creates a new Django factory with proper template and imports"
 
+    # Set by apply_spec to defer __init__.py updates to a single pass
+    init_batch = None
+
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
@@ -64,10 +72,14 @@ class Command(BaseCommand):
         """
         return extract_model_name_from_name(factory_name, "Factory")
 
+    @profile_phase(VALIDATION)
     def _check_model_exists(self, app_name: str, model_name: str) -> bool:
         """
         Check if the model exists in the app.
 
+        Installed models are found in the app registry, other models with the
+        project index (models created earlier in the same `apply` run included).
+
         Args:
             app_name: The app name
             model_name: The model name
@@ -75,9 +87,12 @@ class Command(BaseCommand):
         Returns:
             bool: True if model exists, False otherwise
         """
-        models_path = os.path.join(get_app_path(app_name), "models")
-        model_file = os.path.join(models_path, f"{pascal_to_snake_case(model_name)}.py")
-        return check_file_exists(model_file)
+        if get_model_description(app_name, model_name) is not None:
+            return True
+        index = ProjectIndex.load()
+        model_exists = index.has_component(get_app_path(app_name), "model", model_name)
+        index.save()
+        return model_exists
 
     def generate_main_template(self, **kwargs) -> str:
         """Generate the main template content."""
@@ -86,7 +101,13 @@ class Command(BaseCommand):
         
         # Get model name from factory name
         model_name = self._get_model_name_from_factory(name)
-        
+
+        # Declarations of the fields of the installed model, base fields otherwise
+        description = get_model_description(app_name, model_name)
+        if description is not None:
+            return ModelTemplates.factory_template(
+                name, model_name, app_name, description.factory_declarations, description.many_to_many
+            )
         return ModelTemplates.factory_template(name, model_name, app_name)
 
     def generate_test_template(self, **kwargs) -> str:
@@ -104,15 +125,17 @@ class Command(BaseCommand):
         app_name = options["app_name"]
 
         # Validate inputs using utils
-        validate_pascal_case_name(factory_name, self.get_name_type())
-        validate_app_exists(app_name)
-        validate_directory_exists(app_name, self.get_required_directory())
+        with profile_phase(VALIDATION):
+            validate_pascal_case_name(factory_name, self.get_name_type())
+            validate_app_exists(app_name)
+            validate_directory_exists(app_name, self.get_required_directory())
 
         # Get model name from factory name
         model_name = self._get_model_name_from_factory(factory_name)
 
         # Check if model exists using utils
-        if not self._check_model_exists(app_name, model_name):
+        model_exists = self._check_model_exists(app_name, model_name)
+        if not model_exists:
             self.stdout.write(
                 self.style.WARNING(
                     WARNING_MESSAGES["model_not_found"].format(
@@ -136,18 +159,17 @@ class Command(BaseCommand):
             directory = os.path.dirname(factory_file)
             raise CommandError(f"{self.get_name_type()} file '{filename}' already exists in {directory}")
 
-        # Prepare file paths for cleanup
-        file_paths = [factory_file]
-
         try:
-            # Generate factory template
-            factory_content = self.generate_main_template(name=factory_name, app_name=app_name)
+            with write_transaction():
+                # Generate factory template
+                with profile_phase(TEMPLATE_RENDERING):
+                    factory_content = self.generate_main_template(name=factory_name, app_name=app_name)
 
-            # Create factory file using utils
-            write_file_content(factory_file, factory_content)
+                # Create factory file using utils
+                write_file_content(factory_file, factory_content)
 
-            # Update __init__.py using utils
-            self._update_init_file_with_utils(factories_path, factory_name, factory_filename)
+                # Update __init__.py using utils
+                self._update_init_file_with_utils(factories_path, factory_name, factory_filename)
 
             # Success message using config
             self.stdout.write(
@@ -156,7 +178,7 @@ class Command(BaseCommand):
                 )
             )
 
-            if not self._check_model_exists(app_name, model_name):
+            if not model_exists:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Note: Model '{model_name}' was not found. "
@@ -165,25 +187,20 @@ class Command(BaseCommand):
                 )
 
         except Exception as e:
-            # Clean up on error using utils
-            clean_up_files(file_paths)
+            # Staged files are discarded by the write transaction
             raise CommandError(f"Error creating factory: {str(e)}")
 
     def _update_init_file_with_utils(self, factories_path, factory_name, factory_filename):
         """Update __init__.py file using utils functions."""
-        factories_init_file = os.path.join(factories_path, "__init__.py")
-        factories_content = self._read_or_create_init_file(factories_init_file)
-        factories_content = add_import_to_content(
-            factories_content, 
-            f"from .{factory_filename}{FILE_SUFFIXES['factory']} import {factory_name}{IMPORT_SUFFIXES['factory']}"
+        batch = self.init_batch if self.init_batch is not None else InitFileBatch()
+        batch.add(
+            os.path.join(factories_path, "__init__.py"),
+            f"from .{factory_filename}{FILE_SUFFIXES['factory']} import {factory_name}{IMPORT_SUFFIXES['factory']}",
+            [f"{factory_name}{IMPORT_SUFFIXES['factory']}"],
         )
-        factories_content = update_all_list(factories_content, f"{factory_name}{IMPORT_SUFFIXES['factory']}")
-        write_file_content(factories_init_file, factories_content)
-        self.stdout.write(f"Updated imports in: {factories_init_file}")
-
-    def _read_or_create_init_file(self, init_file_path):
-        """Read existing __init__.py file or create empty one."""
-        if os.path.exists(init_file_path):
-            with open(init_file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return ""
+
+        if self.init_batch is None:
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
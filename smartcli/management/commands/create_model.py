@@ -3,30 +3,42 @@ from typing import List, Tuple
 
 from django.core.management.base import CommandError, BaseCommand
 
+from smartcli.init_index import InitFileBatch
+from smartcli.project_index import ProjectIndex
+from smartcli.profiling import TEMPLATE_RENDERING, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.transaction import write_transaction
 from smartcli.templates import ModelTemplates
 from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, MIGRATION_MESSAGES
 from smartcli.utils import (
     validate_pascal_case_name, validate_app_exists, validate_directory_exists,
-    get_app_path, get_app_import_path, pascal_to_snake_case, check_file_exists, ensure_directory_exists,
-    write_file_content, add_import_to_content, update_all_list, clean_up_files
+    get_app_path, get_app_import_path, pascal_to_snake_case, ensure_directory_exists,
+    write_file_content
 )
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
     Custom command to create a new Django model with proper template and imports.
 
     Usage:
         python manage.py create_model <model_name> <app_name>
+        python manage.py create_model <model_name> <app_name> --cached
 
     This command creates a new model file in the specified app's models directory
     with a template that follows the project conventions, and updates the __init__.py
     file to include the new model in imports and __all__. It also creates the
     corresponding factory and test files.
+
+    With --cached, the manager's get_by_id reads through the cache framework
+    and the model invalidates its cached entry when it is saved (soft deletes
+    included) or deleted.
     """
 
     help = "Creates a new Django model with proper template and imports"
 
+    # Set by apply_spec to defer __init__.py updates to a single pass
+    init_batch = None
+
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
@@ -35,6 +47,11 @@ class Command(BaseCommand):
         parser.add_argument(
             "app_name", type=str, help="Name of the app where to create the model"
         )
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            help="Cache get_by_id lookups with the Django cache framework",
+        )
 
     def get_required_directory(self) -> str:
         """Return the required directory name for this command."""
@@ -54,12 +71,12 @@ class Command(BaseCommand):
 
     def generate_main_template(self, **kwargs) -> str:
         """Generate the main template content."""
-        return ModelTemplates.model_template(kwargs["name"])
+        return ModelTemplates.model_template(kwargs["name"], kwargs["app_name"], kwargs.get("cached", False))
 
     def generate_test_template(self, **kwargs) -> str:
         """Generate the test template content."""
         app_import_path = get_app_import_path(kwargs["app_name"])
-        return ModelTemplates.model_test_template(kwargs["name"], app_import_path)
+        return ModelTemplates.model_test_template(kwargs["name"], app_import_path, kwargs.get("cached", False))
 
     def get_additional_files(self, **kwargs) -> List[Tuple[str, str, str]]:
         """Get additional files to create."""
@@ -74,7 +91,7 @@ class Command(BaseCommand):
         # Generate factory file path and content
         factory_filename = pascal_to_snake_case(name)
         factory_file = os.path.join(factories_path, f"{factory_filename}{FILE_SUFFIXES['factory']}.py")
-        factory_content = ModelTemplates.factory_template(f"{name}Factory", name, app_import_path)
+        factory_content = ModelTemplates.factory_template(name, name, app_import_path)
         
         return [(factory_file, factory_content, "Factory")]
 
@@ -82,11 +99,13 @@ class Command(BaseCommand):
         """Handle the command execution."""
         model_name = options["model_name"]
         app_name = options["app_name"]
+        cached = options.get("cached", False)
 
         # Validate inputs using utils
-        validate_pascal_case_name(model_name, self.get_name_type())
-        validate_app_exists(app_name)
-        validate_directory_exists(app_name, self.get_required_directory())
+        with profile_phase(VALIDATION):
+            validate_pascal_case_name(model_name, self.get_name_type())
+            validate_app_exists(app_name)
+            validate_directory_exists(app_name, self.get_required_directory())
 
         # Define paths using utils
         app_path = get_app_path(app_name)
@@ -100,35 +119,37 @@ class Command(BaseCommand):
         factory_file = os.path.join(factories_path, f"{model_filename}{FILE_SUFFIXES['factory']}.py")
         test_file = os.path.join(tests_path, f"test_{model_filename}{self.get_filename_suffix()}.py")
 
-        # Check if files already exist using utils
-        if check_file_exists(model_file):
-            filename = os.path.basename(model_file)
-            directory = os.path.dirname(model_file)
-            raise CommandError(f"{self.get_name_type()} file '{filename}' already exists in {directory}")
+        # Check if the model already exists using the project index
+        index = ProjectIndex.load()
+        model_exists = index.has_component(app_path, "model", model_name)
+        index.save()
+        if model_exists:
+            raise CommandError(f"{self.get_name_type()} '{model_name}' already exists in {models_path}")
 
         # Create directories if they don't exist using utils
         ensure_directory_exists(factories_path)
         ensure_directory_exists(tests_path)
 
-        # Prepare file paths for cleanup
-        file_paths = [model_file, factory_file, test_file]
-
         try:
-            # Generate templates
-            model_content = self.generate_main_template(name=model_name, app_name=app_name)
-            factory_content = ModelTemplates.factory_template(f"{model_name}Factory", model_name, app_name)
-            test_content = self.generate_test_template(name=model_name, app_name=app_name)
-
-            # Create files using utils
-            write_file_content(model_file, model_content)
-            write_file_content(factory_file, factory_content)
-            write_file_content(test_file, test_content)
-
-            # Update __init__.py files using utils
-            self._update_init_files_with_utils(
-                models_path, factories_path, tests_path, 
-                model_name, model_filename
-            )
+            with write_transaction():
+                # Generate templates
+                with profile_phase(TEMPLATE_RENDERING):
+                    model_content = self.generate_main_template(name=model_name, app_name=app_name, cached=cached)
+                    factory_content = ModelTemplates.factory_template(
+                        model_name, model_name, get_app_import_path(app_name)
+                    )
+                    test_content = self.generate_test_template(name=model_name, app_name=app_name, cached=cached)
+
+                # Create files using utils
+                write_file_content(model_file, model_content)
+                write_file_content(factory_file, factory_content)
+                write_file_content(test_file, test_content)
+
+                # Update __init__.py files using utils
+                self._update_init_files_with_utils(
+                    models_path, factories_path, tests_path, 
+                    model_name, model_filename, cached
+                )
 
             # Success message using config
             self.stdout.write(
@@ -143,40 +164,39 @@ class Command(BaseCommand):
             self.stdout.write(MIGRATION_MESSAGES["model"].format(app_name=app_name))
 
         except Exception as e:
-            # Clean up on error using utils
-            clean_up_files(file_paths)
+            # Staged files are discarded by the write transaction
             raise CommandError(f"Error creating model: {str(e)}")
 
-    def _update_init_files_with_utils(self, models_path, factories_path, tests_path, model_name, model_filename):
+    def _update_init_files_with_utils(self, models_path, factories_path, tests_path, model_name, model_filename, cached=False):
         """Update __init__.py files using utils functions."""
+        batch = self.init_batch if self.init_batch is not None else InitFileBatch()
+
         # Update models __init__.py
-        models_init_file = os.path.join(models_path, "__init__.py")
-        models_content = self._read_or_create_init_file(models_init_file)
-        models_content = add_import_to_content(models_content, f"from .{model_filename} import {model_name}")
-        models_content = update_all_list(models_content, model_name)
-        write_file_content(models_init_file, models_content)
-        self.stdout.write(f"Updated imports in: {models_init_file}")
+        batch.add(
+            os.path.join(models_path, "__init__.py"),
+            f"from .{model_filename} import {model_name}",
+            [model_name],
+        )
 
         # Update factories __init__.py
-        factories_init_file = os.path.join(factories_path, "__init__.py")
-        factories_content = self._read_or_create_init_file(factories_init_file)
-        factories_content = add_import_to_content(factories_content, f"from .{model_filename}{FILE_SUFFIXES['factory']} import {model_name}{IMPORT_SUFFIXES['factory']}")
-        factories_content = update_all_list(factories_content, f"{model_name}{IMPORT_SUFFIXES['factory']}")
-        write_file_content(factories_init_file, factories_content)
-        self.stdout.write(f"Updated imports in: {factories_init_file}")
+        batch.add(
+            os.path.join(factories_path, "__init__.py"),
+            f"from .{model_filename}{FILE_SUFFIXES['factory']} import {model_name}{IMPORT_SUFFIXES['factory']}",
+            [f"{model_name}{IMPORT_SUFFIXES['factory']}"],
+        )
 
         # Update tests __init__.py
-        tests_init_file = os.path.join(tests_path, "__init__.py")
-        tests_content = self._read_or_create_init_file(tests_init_file)
-        tests_content = add_import_to_content(tests_content, f"from .test_{model_filename} import {model_name}ModelTest, {model_name}ManagerTest")
-        tests_content = update_all_list(tests_content, f"{model_name}ModelTest")
-        tests_content = update_all_list(tests_content, f"{model_name}ManagerTest")
-        write_file_content(tests_init_file, tests_content)
-        self.stdout.write(f"Updated imports in: {tests_init_file}")
-
-    def _read_or_create_init_file(self, init_file_path):
-        """Read existing __init__.py file or create empty one."""
-        if os.path.exists(init_file_path):
-            with open(init_file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return ""
+        test_classes = [f"{model_name}ModelTest", f"{model_name}ManagerTest"]
+        if cached:
+            test_classes.append(f"{model_name}CacheTest")
+        batch.add(
+            os.path.join(tests_path, "__init__.py"),
+            f"from .test_{model_filename} import {', '.join(test_classes)}",
+            test_classes,
+        )
+
+        if self.init_batch is None:
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
@@ -1,24 +1,30 @@
 import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from smartcli.config import DIRECTORIES, TEST_SUBDIRECTORIES, FILE_TEMPLATES, SUCCESS_MESSAGES
+from smartcli.config import DIRECTORIES, TEST_SUBDIRECTORIES, FILE_TEMPLATES, SUCCESS_MESSAGES, FILESYSTEM_MAX_WORKERS
 from smartcli.utils import (
-    check_file_exists, ensure_directory_exists,
+    check_file_exists, ensure_directory_exists, read_file_content,
     write_file_content, detect_django_project_settings, find_installed_apps_in_settings,
-    get_apps_directory, get_app_path, get_app_import_path
+    get_apps_directory, get_app_path, get_app_import_path, validate_module_name
 )
+from smartcli.profiling import FILE_IO, SETTINGS_REWRITE, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.transaction import get_active_transaction, use_transaction, write_transaction
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
-    Custom command to create a new Django app with a complete structure.
+    Custom command to create new Django apps with a complete structure.
 
     Usage:
-        python manage.py create_module <module_name>
+        python manage.py create_module <module_name> [<module_name> ...]
+        python manage.py create_module --from-file modules.txt
 
-    This command creates a new app with the following structure:
+    This command creates each new app with the following structure:
     - docs/
     - factories/
     - migrations/
@@ -34,64 +40,77 @@ class Command(BaseCommand):
     The location depends on USE_CENTRALIZED_APPS setting:
     - If True (default): apps/module_name/
     - If False: module_name/ (at project root)
+
+    When several modules are given, their structures are created in parallel
+    and INSTALLED_APPS is updated once with all of them.
     """
 
-    help = "Creates a new Django app with complete structure"
+    help = "Creates new Django apps with complete structure"
 
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
-            "module_name", type=str, help="Name of the module to create"
+            "module_names", nargs="*", type=str, help="Names of the modules to create"
+        )
+        parser.add_argument(
+            "--from-file",
+            type=str,
+            help="File listing the modules to create, one per line (# starts a comment)",
         )
 
-    def _add_app_to_settings(self, module_name: str) -> None:
+    @profile_phase(SETTINGS_REWRITE)
+    def _add_apps_to_settings(self, module_names: List[str]) -> None:
         """
-        Add the new app to INSTALLED_APPS in settings file.
+        Add the new apps to INSTALLED_APPS in settings file, in a single write.
 
         Args:
-            module_name: Name of the module to add
+            module_names: Names of the modules to add
         """
+        app_import_paths = [get_app_import_path(module_name) for module_name in module_names]
+        manual_apps = ", ".join(f"'{path}'" for path in app_import_paths)
+
         # Detect Django project and settings file
         project_dir, settings_file = detect_django_project_settings()
-        
+
         if not settings_file:
-            app_import_path = get_app_import_path(module_name)
             self.stdout.write(
                 self.style.WARNING(
                     "Could not detect Django settings file. "
-                    f"Please manually add '{app_import_path}' to INSTALLED_APPS."
+                    f"Please manually add {manual_apps} to INSTALLED_APPS."
                 )
             )
             return
 
         # Check if INSTALLED_APPS exists in settings
         has_installed_apps, content = find_installed_apps_in_settings(settings_file)
-        
+
         if not has_installed_apps:
-            app_import_path = get_app_import_path(module_name)
             self.stdout.write(
                 self.style.WARNING(
                     f"INSTALLED_APPS not found in {settings_file}. "
-                    f"Please manually add '{app_import_path}' to INSTALLED_APPS."
+                    f"Please manually add {manual_apps} to INSTALLED_APPS."
                 )
             )
             return
 
         try:
-            # Get the correct import path for the app
-            app_import_path = get_app_import_path(module_name)
-            app_entry = f'"{app_import_path}"'
-            
-            # Check if app is already in INSTALLED_APPS
-            if app_entry in content:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"App {app_entry} is already in INSTALLED_APPS"
+            # Skip apps already in INSTALLED_APPS
+            new_apps = []
+            for app_import_path in app_import_paths:
+                app_entry = f'"{app_import_path}"'
+                if app_entry in content:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"App {app_entry} is already in INSTALLED_APPS"
+                        )
                     )
-                )
+                else:
+                    new_apps.append(app_import_path)
+
+            if not new_apps:
                 return
 
-            # Find INSTALLED_APPS list and add the new app
+            # Find INSTALLED_APPS list and add the new apps
             # Pattern to match INSTALLED_APPS = [ ... ]
             pattern = r"(INSTALLED_APPS\s*=\s*\[)([^\]]*)(\])"
             match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
@@ -115,8 +134,8 @@ class Command(BaseCommand):
                         line = line.strip("\"'")
                         existing_apps.append(line)
 
-                # Add the new app
-                existing_apps.append(app_import_path)
+                # Add the new apps
+                existing_apps.extend(new_apps)
 
                 # Sort alphabetically
                 existing_apps.sort()
@@ -142,19 +161,22 @@ class Command(BaseCommand):
                     + content[match.end() :]
                 )
 
-                # Write back to file using utils
-                write_file_content(settings_file, new_content)
+                # Write back to file using utils (skipped if the list was already sorted in)
+                if not write_file_content(settings_file, new_content):
+                    self.stdout.write(f"Unchanged: {settings_file}")
+                    return
 
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Added '{app_import_path}' to INSTALLED_APPS in {settings_file}"
+                for app_import_path in new_apps:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Added '{app_import_path}' to INSTALLED_APPS in {settings_file}"
+                        )
                     )
-                )
             else:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Could not find INSTALLED_APPS list in {settings_file}. "
-                        f"Please manually add '{app_import_path}' to INSTALLED_APPS."
+                        f"Please manually add {manual_apps} to INSTALLED_APPS."
                     )
                 )
 
@@ -163,110 +185,205 @@ class Command(BaseCommand):
                 self.style.ERROR(f"Error updating settings file: {str(e)}")
             )
 
-    def handle(self, *args, **options):
-        """Handle the command execution."""
-        module_name = options["module_name"]
+    def _get_module_names(self, options) -> List[str]:
+        """
+        Collect module names from the arguments and the --from-file option.
 
-        # Validate module name
-        if not module_name.isidentifier():
-            raise CommandError(
-                f"'{module_name}' is not a valid Python identifier. "
-                "Module names must contain only letters, digits, and underscores, "
-                "and cannot start with a digit."
-            )
+        Args:
+            options: The command options
 
-        # Get the app path based on user settings
-        module_path = get_app_path(module_name)
-        apps_dir = get_apps_directory()
+        Returns:
+            List[str]: Module names, in order and without duplicates
+        """
+        module_names = list(options["module_names"])
+
+        from_file = options.get("from_file")
+        if from_file:
+            if not check_file_exists(from_file):
+                raise CommandError(f"Modules file not found: {from_file}")
+            for line in read_file_content(from_file).splitlines():
+                name = line.split("#", 1)[0].strip()
+                if name:
+                    module_names.append(name)
+
+        if not module_names:
+            raise CommandError("Provide at least one module name or --from-file")
+
+        return list(dict.fromkeys(module_names))
+
+    def _validate_module_name(self, module_name: str) -> None:
+        """
+        Validate a module name and check that the module doesn't exist yet.
+
+        Args:
+            module_name: Name of the module to validate
+        """
+        try:
+            validate_module_name(module_name)
+        except ValueError as e:
+            raise CommandError(str(e))
 
         # Check if module already exists using utils
+        module_path = get_app_path(module_name)
         if check_file_exists(module_path):
             raise CommandError(
                 f"Module '{module_name}' already exists at {module_path}"
             )
 
-        try:
-            # Create the main module directory using utils
-            ensure_directory_exists(module_path)
-            self.stdout.write(f"Created directory: {module_path}")
-
-            # Create all subdirectories using config
-            for directory in DIRECTORIES:
-                dir_path = os.path.join(module_path, directory)
-                ensure_directory_exists(dir_path)
-                self.stdout.write(f"Created directory: {dir_path}")
-
-                # Create __init__.py in each directory using utils
-                init_file = os.path.join(dir_path, "__init__.py")
-                write_file_content(init_file, "")
-                self.stdout.write(f"Created file: {init_file}")
-
-                # Create test subdirectories if this is the tests directory
-                if directory == "tests":
-                    for subdir in TEST_SUBDIRECTORIES:
-                        subdir_path = os.path.join(dir_path, subdir)
-                        ensure_directory_exists(subdir_path)
-                        self.stdout.write(f"Created directory: {subdir_path}")
-
-                        # Create __init__.py in test subdirectories using utils
-                        subdir_init_file = os.path.join(subdir_path, "__init__.py")
-                        write_file_content(subdir_init_file, "")
-                        self.stdout.write(f"Created file: {subdir_init_file}")
-
-            # Create __init__.py in the main module directory using utils
-            main_init_file = os.path.join(module_path, "__init__.py")
-            write_file_content(main_init_file, "")
-            self.stdout.write(f"Created file: {main_init_file}")
-
-            # Get the correct import path for templates
-            app_import_path = get_app_import_path(module_name)
-
-            # Create apps.py using config template
-            apps_content = FILE_TEMPLATES["apps_py"].format(
-                app_name=module_name.capitalize(),
-                app_name_lower=module_name,
-                app_import_path=app_import_path
-            )
-            apps_file = os.path.join(module_path, "apps.py")
-            write_file_content(apps_file, apps_content)
-            self.stdout.write(f"Created file: {apps_file}")
-
-            # Create urls.py using config template
-            urls_content = FILE_TEMPLATES["urls_py"].format(
-                app_name=module_name.capitalize(),
-                app_name_lower=module_name
-            )
-            urls_file = os.path.join(module_path, "urls.py")
-            write_file_content(urls_file, urls_content)
-            self.stdout.write(f"Created file: {urls_file}")
+    def _create_module_structure(self, module_name: str) -> List[str]:
+        """
+        Create the directories and files of a module.
 
-            # Add app to settings
-            self._add_app_to_settings(module_name)
+        Runs in a worker thread: log lines are returned instead of written, so
+        that modules are reported in order.
 
-            # Success message using config
-            self.stdout.write(
-                self.style.SUCCESS(
-                    SUCCESS_MESSAGES["module_created"].format(name=module_name)
-                )
-            )
-            
-            # Show structure info
-            if apps_dir:
-                self.stdout.write(
-                    f"Module '{module_name}' created in centralized structure (apps/{module_name}/)"
-                )
-            else:
+        Args:
+            module_name: Name of the module to create
+
+        Returns:
+            List[str]: Log lines for the created directories and files
+        """
+        module_path = get_app_path(module_name)
+        log = []
+
+        # Create the main module directory using utils
+        ensure_directory_exists(module_path)
+        log.append(f"Created directory: {module_path}")
+
+        # Create all subdirectories using config
+        for directory in DIRECTORIES:
+            dir_path = os.path.join(module_path, directory)
+            ensure_directory_exists(dir_path)
+            log.append(f"Created directory: {dir_path}")
+
+            # Create __init__.py in each directory using utils
+            init_file = os.path.join(dir_path, "__init__.py")
+            write_file_content(init_file, "")
+            log.append(f"Created file: {init_file}")
+
+            # Create test subdirectories if this is the tests directory
+            if directory == "tests":
+                for subdir in TEST_SUBDIRECTORIES:
+                    subdir_path = os.path.join(dir_path, subdir)
+                    ensure_directory_exists(subdir_path)
+                    log.append(f"Created directory: {subdir_path}")
+
+                    # Create __init__.py in test subdirectories using utils
+                    subdir_init_file = os.path.join(subdir_path, "__init__.py")
+                    write_file_content(subdir_init_file, "")
+                    log.append(f"Created file: {subdir_init_file}")
+
+        # Create __init__.py in the main module directory using utils
+        main_init_file = os.path.join(module_path, "__init__.py")
+        write_file_content(main_init_file, "")
+        log.append(f"Created file: {main_init_file}")
+
+        # Get the correct import path for templates
+        app_import_path = get_app_import_path(module_name)
+
+        # Create apps.py using config template
+        apps_content = FILE_TEMPLATES["apps_py"].format(
+            app_name=module_name.capitalize(),
+            app_name_lower=module_name,
+            app_import_path=app_import_path
+        )
+        apps_file = os.path.join(module_path, "apps.py")
+        write_file_content(apps_file, apps_content)
+        log.append(f"Created file: {apps_file}")
+
+        # Create urls.py using config template
+        urls_content = FILE_TEMPLATES["urls_py"].format(
+            app_name=module_name.capitalize(),
+            app_name_lower=module_name
+        )
+        urls_file = os.path.join(module_path, "urls.py")
+        write_file_content(urls_file, urls_content)
+        log.append(f"Created file: {urls_file}")
+
+        return log
+
+    def _create_modules_in_parallel(self, module_names: List[str]) -> List[List[str]]:
+        """
+        Create the structures of several modules with a thread pool.
+
+        Workers join the active write transaction, so files are still staged
+        and committed together.
+
+        Args:
+            module_names: Names of the modules to create
+
+        Returns:
+            List[List[str]]: Log lines of each module, in module order
+        """
+        transaction = get_active_transaction()
+
+        def create(module_name: str) -> List[str]:
+            with use_transaction(transaction):
+                return self._create_module_structure(module_name)
+
+        max_workers = min(len(module_names), FILESYSTEM_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(create, module_names))
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        module_names = self._get_module_names(options)
+
+        # Validate every module before creating anything
+        with profile_phase(VALIDATION):
+            for module_name in module_names:
+                self._validate_module_name(module_name)
+
+        apps_dir = get_apps_directory()
+        verbosity = options.get("verbosity", 1)
+
+        try:
+            with write_transaction():
+                # Worker threads don't record phases: count the whole creation as I/O
+                with profile_phase(FILE_IO):
+                    logs = self._create_modules_in_parallel(module_names)
+
+                for module_name, log in zip(module_names, logs):
+                    if verbosity > 1:
+                        for line in log:
+                            self.stdout.write(line)
+                    else:
+                        self.stdout.write(
+                            f"Created module structure: {get_app_path(module_name)} "
+                            f"({len(log)} directories and files)"
+                        )
+
+                # Add all apps to settings in a single update
+                self._add_apps_to_settings(module_names)
+
+            for module_name in module_names:
+                # Success message using config
                 self.stdout.write(
-                    f"Module '{module_name}' created in decentralized structure ({module_name}/)"
+                    self.style.SUCCESS(
+                        SUCCESS_MESSAGES["module_created"].format(name=module_name)
+                    )
                 )
-            
+
+                # Show structure info
+                if apps_dir:
+                    self.stdout.write(
+                        f"Module '{module_name}' created in centralized structure (apps/{module_name}/)"
+                    )
+                else:
+                    self.stdout.write(
+                        f"Module '{module_name}' created in decentralized structure ({module_name}/)"
+                    )
+
             self.stdout.write(
                 f"Module has been automatically added to INSTALLED_APPS."
+                if len(module_names) == 1
+                else f"{len(module_names)} modules have been automatically added to INSTALLED_APPS."
             )
 
         except Exception as e:
-            # Clean up on error
-            if check_file_exists(module_path):
-                import shutil
-                shutil.rmtree(module_path)
+            # Clean up on error (modules were checked not to exist beforehand)
+            for module_name in module_names:
+                module_path = get_app_path(module_name)
+                if os.path.isdir(module_path):
+                    shutil.rmtree(module_path)
             raise CommandError(f"Error creating module: {str(e)}")
@@ -3,17 +3,22 @@ from typing import List, Tuple
 
 from django.core.management.base import CommandError, BaseCommand
 
+from smartcli.init_index import InitFileBatch
+from smartcli.profiling import TEMPLATE_RENDERING, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.introspection import get_model_description
+from smartcli.project_index import ProjectIndex
+from smartcli.transaction import write_transaction
 from smartcli.templates import SerializerTemplates
 from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, WARNING_MESSAGES
 from smartcli.utils import (
     validate_pascal_case_name, validate_app_exists, validate_directory_exists,
     get_app_path, pascal_to_snake_case, check_file_exists, ensure_directory_exists,
-    write_file_content, add_import_to_content, update_all_list, clean_up_files,
+    write_file_content, use_lazy_init_files,
     extract_model_name_from_name
 )
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
     Custom command to create a new Django serializer with proper template and imports.
 
@@ -28,6 +33,9 @@ class Command(BaseCommand):
 
     help = "Creates a new Django serializer with proper template and imports"
 
+    # Set by apply_spec to defer __init__.py updates to a single pass
+    init_batch = None
+
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
@@ -72,10 +80,14 @@ class Command(BaseCommand):
         """
         return extract_model_name_from_name(serializer_name, "Serializer")
 
+    @profile_phase(VALIDATION)
     def _check_model_exists(self, app_name: str, model_name: str) -> bool:
         """
         Check if the model exists in the app.
 
+        Installed models are found in the app registry, other models with the
+        project index (models created earlier in the same `apply` run included).
+
         Args:
             app_name: The app name
             model_name: The model name
@@ -83,9 +95,12 @@ class Command(BaseCommand):
         Returns:
             bool: True if model exists, False otherwise
         """
-        models_path = os.path.join(get_app_path(app_name), "models")
-        model_file = os.path.join(models_path, f"{pascal_to_snake_case(model_name)}.py")
-        return check_file_exists(model_file)
+        if get_model_description(app_name, model_name) is not None:
+            return True
+        index = ProjectIndex.load()
+        model_exists = index.has_component(get_app_path(app_name), "model", model_name)
+        index.save()
+        return model_exists
 
     def generate_main_template(self, **kwargs) -> str:
         """Generate the main template content."""
@@ -96,7 +111,13 @@ class Command(BaseCommand):
         # Get model name - use provided model name or extract from serializer name
         if model_name is None:
             model_name = self._get_model_name_from_serializer(name)
-        
+
+        # Fields of the installed model, base fields otherwise
+        description = get_model_description(app_name, model_name)
+        if description is not None:
+            return SerializerTemplates.serializer_template(
+                name, model_name, app_name, description.fields, description.read_only_fields
+            )
         return SerializerTemplates.serializer_template(name, model_name, app_name)
 
     def generate_test_template(self, **kwargs) -> str:
@@ -108,7 +129,12 @@ class Command(BaseCommand):
         # Get model name - use provided model name or extract from serializer name
         if model_name is None:
             model_name = self._get_model_name_from_serializer(name)
-        
+
+        description = get_model_description(app_name, model_name)
+        if description is not None:
+            return SerializerTemplates.serializer_test_template(
+                name, model_name, app_name, description.fields, description.read_only_fields
+            )
         return SerializerTemplates.serializer_test_template(name, model_name, app_name)
 
     def get_additional_files(self, **kwargs) -> List[Tuple[str, str, str]]:
@@ -122,9 +148,10 @@ class Command(BaseCommand):
         model_name = options.get("model")
 
         # Validate inputs using utils
-        validate_pascal_case_name(serializer_name, self.get_name_type())
-        validate_app_exists(app_name)
-        validate_directory_exists(app_name, self.get_required_directory())
+        with profile_phase(VALIDATION):
+            validate_pascal_case_name(serializer_name, self.get_name_type())
+            validate_app_exists(app_name)
+            validate_directory_exists(app_name, self.get_required_directory())
 
         # Get model name - use provided model name or extract from serializer name
         if model_name is None:
@@ -134,7 +161,8 @@ class Command(BaseCommand):
             validate_pascal_case_name(model_name, "Model")
 
         # Check if model exists using utils
-        if not self._check_model_exists(app_name, model_name):
+        model_exists = self._check_model_exists(app_name, model_name)
+        if not model_exists:
             self.stdout.write(
                 self.style.WARNING(
                     WARNING_MESSAGES["model_not_found"].format(
@@ -167,26 +195,25 @@ class Command(BaseCommand):
         # Create directories if they don't exist using utils
         ensure_directory_exists(tests_path)
 
-        # Prepare file paths for cleanup
-        file_paths = [serializer_file, test_file]
-
         try:
-            # Generate templates
-            serializer_content = self.generate_main_template(
-                name=serializer_name, app_name=app_name, model=model_name
-            )
-            test_content = self.generate_test_template(
-                name=serializer_name, app_name=app_name, model=model_name
-            )
+            with write_transaction():
+                # Generate templates
+                with profile_phase(TEMPLATE_RENDERING):
+                    serializer_content = self.generate_main_template(
+                        name=serializer_name, app_name=app_name, model=model_name
+                    )
+                    test_content = self.generate_test_template(
+                        name=serializer_name, app_name=app_name, model=model_name
+                    )
 
-            # Create files using utils
-            write_file_content(serializer_file, serializer_content)
-            write_file_content(test_file, test_content)
+                # Create files using utils
+                write_file_content(serializer_file, serializer_content)
+                write_file_content(test_file, test_content)
 
-            # Update __init__.py files using utils
-            self._update_init_files_with_utils(
-                serializers_path, tests_path, serializer_name, serializer_filename
-            )
+                # Update __init__.py files using utils
+                self._update_init_files_with_utils(
+                    serializers_path, tests_path, serializer_name, serializer_filename
+                )
 
             # Success message using config
             self.stdout.write(
@@ -201,7 +228,7 @@ class Command(BaseCommand):
             # Show which model the serializer is attached to
             self.stdout.write(f"Serializer attached to model: '{model_name}'")
 
-            if not self._check_model_exists(app_name, model_name):
+            if not model_exists:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Note: Model '{model_name}' was not found. "
@@ -210,37 +237,30 @@ class Command(BaseCommand):
                 )
 
         except Exception as e:
-            # Clean up on error using utils
-            clean_up_files(file_paths)
+            # Staged files are discarded by the write transaction
             raise CommandError(f"Error creating serializer: {str(e)}")
 
     def _update_init_files_with_utils(self, serializers_path, tests_path, serializer_name, serializer_filename):
         """Update __init__.py files using utils functions."""
+        batch = self.init_batch if self.init_batch is not None else InitFileBatch()
+
         # Update serializers __init__.py
-        serializers_init_file = os.path.join(serializers_path, "__init__.py")
-        serializers_content = self._read_or_create_init_file(serializers_init_file)
-        serializers_content = add_import_to_content(
-            serializers_content, 
-            f"from .{serializer_filename}{FILE_SUFFIXES['serializer']} import {serializer_name}{IMPORT_SUFFIXES['serializer']}"
+        batch.add(
+            os.path.join(serializers_path, "__init__.py"),
+            f"from .{serializer_filename}{FILE_SUFFIXES['serializer']} import {serializer_name}{IMPORT_SUFFIXES['serializer']}",
+            [f"{serializer_name}{IMPORT_SUFFIXES['serializer']}"],
+            lazy=use_lazy_init_files("serializers"),
         )
-        serializers_content = update_all_list(serializers_content, f"{serializer_name}{IMPORT_SUFFIXES['serializer']}")
-        write_file_content(serializers_init_file, serializers_content)
-        self.stdout.write(f"Updated imports in: {serializers_init_file}")
 
         # Update tests __init__.py
-        tests_init_file = os.path.join(tests_path, "__init__.py")
-        tests_content = self._read_or_create_init_file(tests_init_file)
-        tests_content = add_import_to_content(
-            tests_content, 
-            f"from .test_{serializer_filename}{FILE_SUFFIXES['serializer']} import {serializer_name}{IMPORT_SUFFIXES['serializer']}Test"
+        batch.add(
+            os.path.join(tests_path, "__init__.py"),
+            f"from .test_{serializer_filename}{FILE_SUFFIXES['serializer']} import {serializer_name}{IMPORT_SUFFIXES['serializer']}Test",
+            [f"{serializer_name}{IMPORT_SUFFIXES['serializer']}Test"],
         )
-        tests_content = update_all_list(tests_content, f"{serializer_name}{IMPORT_SUFFIXES['serializer']}Test")
-        write_file_content(tests_init_file, tests_content)
-        self.stdout.write(f"Updated imports in: {tests_init_file}")
-
-    def _read_or_create_init_file(self, init_file_path):
-        """Read existing __init__.py file or create empty one."""
-        if os.path.exists(init_file_path):
-            with open(init_file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return ""
+
+        if self.init_batch is None:
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
@@ -3,30 +3,43 @@ from typing import List, Tuple
 
 from django.core.management.base import CommandError, BaseCommand
 
+from smartcli.init_index import InitFileBatch
+from smartcli.project_index import ProjectIndex
+from smartcli.profiling import TEMPLATE_RENDERING, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.transaction import write_transaction
 from smartcli.templates import ServiceTemplates
-from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES
+from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, TEMPLATE_CONFIGS
 from smartcli.utils import (
     validate_pascal_case_name, validate_app_exists, validate_directory_exists,
-    get_app_path, pascal_to_snake_case, check_file_exists, ensure_directory_exists,
-    write_file_content, add_import_to_content, update_all_list, clean_up_files
+    get_app_path, get_app_import_path, pascal_to_snake_case, ensure_directory_exists,
+    write_file_content, use_lazy_init_files
 )
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
     Custom command to create a new Django service with proper template and imports.
 
     Usage:
         python manage.py create_service <service_name> <app_name>
+        python manage.py create_service <service_name> <app_name> --bulk
 
     This command creates a new service file in the specified app's services directory
     with a template that follows the project conventions, and updates the __init__.py
     file to include the new service in imports and __all__. It also creates the
     corresponding test file.
+
+    When the app has a model of the same name, create_* creates it and its
+    query budget test runs right away. With --bulk, the service also gets
+    bulk_create_*, bulk_update_* and batched soft-delete methods for that
+    model, tested with query counts.
     """
 
     help = "Creates a new Django service with proper template and imports"
 
+    # Set by apply_spec to defer __init__.py updates to a single pass
+    init_batch = None
+
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
@@ -35,6 +48,11 @@ class Command(BaseCommand):
         parser.add_argument(
             "app_name", type=str, help="Name of the app where to create the service"
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Add batched bulk create, update and soft-delete methods for the model of the same name",
+        )
 
     def get_required_directory(self) -> str:
         """Return the required directory name for this command."""
@@ -54,11 +72,20 @@ class Command(BaseCommand):
 
     def generate_main_template(self, **kwargs) -> str:
         """Generate the main template content."""
-        return ServiceTemplates.service_template(kwargs["name"])
+        return ServiceTemplates.service_template(
+            kwargs["name"],
+            get_app_import_path(kwargs["app_name"]),
+            bulk=kwargs.get("bulk", False),
+            batch_size=TEMPLATE_CONFIGS["service"]["bulk_batch_size"],
+            with_model=kwargs.get("with_model", False),
+        )
 
     def generate_test_template(self, **kwargs) -> str:
         """Generate the test template content."""
-        return ServiceTemplates.service_test_template(kwargs["name"], kwargs["app_name"])
+        app_import_path = get_app_import_path(kwargs["app_name"])
+        return ServiceTemplates.service_test_template(
+            kwargs["name"], app_import_path, bulk=kwargs.get("bulk", False), with_model=kwargs.get("with_model", False)
+        )
 
     def get_additional_files(self, **kwargs) -> List[Tuple[str, str, str]]:
         """Get additional files to create."""
@@ -68,11 +95,13 @@ class Command(BaseCommand):
         """Handle the command execution."""
         service_name = options["service_name"]
         app_name = options["app_name"]
+        bulk = options.get("bulk", False)
 
         # Validate inputs using utils
-        validate_pascal_case_name(service_name, self.get_name_type())
-        validate_app_exists(app_name)
-        validate_directory_exists(app_name, self.get_required_directory())
+        with profile_phase(VALIDATION):
+            validate_pascal_case_name(service_name, self.get_name_type())
+            validate_app_exists(app_name)
+            validate_directory_exists(app_name, self.get_required_directory())
 
         # Define paths using utils
         app_path = get_app_path(app_name)
@@ -84,31 +113,45 @@ class Command(BaseCommand):
         service_file = os.path.join(services_path, f"{service_filename}{self.get_filename_suffix()}.py")
         test_file = os.path.join(tests_path, f"test_{service_filename}{self.get_filename_suffix()}.py")
 
-        # Check if service file already exists using utils
-        if check_file_exists(service_file):
-            filename = os.path.basename(service_file)
-            directory = os.path.dirname(service_file)
-            raise CommandError(f"{self.get_name_type()} file '{filename}' already exists in {directory}")
+        # Check if the service already exists using the project index
+        index = ProjectIndex.load()
+        service_exists = index.has_component(app_path, "service", service_name)
+        # Create (and the bulk methods) work on the model of the same name
+        model_exists = index.has_component(app_path, "model", service_name)
+        index.save()
+        if service_exists:
+            raise CommandError(f"{self.get_name_type()} '{service_name}{self.get_import_suffix()}' already exists in {services_path}")
+
+        if bulk and not model_exists:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Model '{service_name}' not found in {app_name}, the bulk methods expect it "
+                    f"(create it with create_model {service_name} {app_name})"
+                )
+            )
 
         # Create directories if they don't exist using utils
         ensure_directory_exists(tests_path)
 
-        # Prepare file paths for cleanup
-        file_paths = [service_file, test_file]
-
         try:
-            # Generate templates
-            service_content = self.generate_main_template(name=service_name, app_name=app_name)
-            test_content = self.generate_test_template(name=service_name, app_name=app_name)
-
-            # Create files using utils
-            write_file_content(service_file, service_content)
-            write_file_content(test_file, test_content)
-
-            # Update __init__.py files using utils
-            self._update_init_files_with_utils(
-                services_path, tests_path, service_name, service_filename
-            )
+            with write_transaction():
+                # Generate templates
+                with profile_phase(TEMPLATE_RENDERING):
+                    service_content = self.generate_main_template(
+                        name=service_name, app_name=app_name, bulk=bulk, with_model=model_exists
+                    )
+                    test_content = self.generate_test_template(
+                        name=service_name, app_name=app_name, bulk=bulk, with_model=model_exists
+                    )
+
+                # Create files using utils
+                write_file_content(service_file, service_content)
+                write_file_content(test_file, test_content)
+
+                # Update __init__.py files using utils
+                self._update_init_files_with_utils(
+                    services_path, tests_path, service_name, service_filename
+                )
 
             # Success message using config
             self.stdout.write(
@@ -121,37 +164,30 @@ class Command(BaseCommand):
             self.stdout.write(f"  - Test: {test_file}")
 
         except Exception as e:
-            # Clean up on error using utils
-            clean_up_files(file_paths)
+            # Staged files are discarded by the write transaction
             raise CommandError(f"Error creating service: {str(e)}")
 
     def _update_init_files_with_utils(self, services_path, tests_path, service_name, service_filename):
         """Update __init__.py files using utils functions."""
+        batch = self.init_batch if self.init_batch is not None else InitFileBatch()
+
         # Update services __init__.py
-        services_init_file = os.path.join(services_path, "__init__.py")
-        services_content = self._read_or_create_init_file(services_init_file)
-        services_content = add_import_to_content(
-            services_content, 
-            f"from .{service_filename}{FILE_SUFFIXES['service']} import {service_name}{IMPORT_SUFFIXES['service']}"
+        batch.add(
+            os.path.join(services_path, "__init__.py"),
+            f"from .{service_filename}{FILE_SUFFIXES['service']} import {service_name}{IMPORT_SUFFIXES['service']}",
+            [f"{service_name}{IMPORT_SUFFIXES['service']}"],
+            lazy=use_lazy_init_files("services"),
         )
-        services_content = update_all_list(services_content, f"{service_name}{IMPORT_SUFFIXES['service']}")
-        write_file_content(services_init_file, services_content)
-        self.stdout.write(f"Updated imports in: {services_init_file}")
 
         # Update tests __init__.py
-        tests_init_file = os.path.join(tests_path, "__init__.py")
-        tests_content = self._read_or_create_init_file(tests_init_file)
-        tests_content = add_import_to_content(
-            tests_content, 
-            f"from .test_{service_filename}{FILE_SUFFIXES['service']} import {service_name}{IMPORT_SUFFIXES['service']}Test"
+        batch.add(
+            os.path.join(tests_path, "__init__.py"),
+            f"from .test_{service_filename}{FILE_SUFFIXES['service']} import {service_name}{IMPORT_SUFFIXES['service']}Test",
+            [f"{service_name}{IMPORT_SUFFIXES['service']}Test"],
         )
-        tests_content = update_all_list(tests_content, f"{service_name}{IMPORT_SUFFIXES['service']}Test")
-        write_file_content(tests_init_file, tests_content)
-        self.stdout.write(f"Updated imports in: {tests_init_file}")
-
-    def _read_or_create_init_file(self, init_file_path):
-        """Read existing __init__.py file or create empty one."""
-        if os.path.exists(init_file_path):
-            with open(init_file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return ""
+
+        if self.init_batch is None:
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
@@ -1,33 +1,46 @@
 import os
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from django.core.management.base import CommandError, BaseCommand
 
+from smartcli.init_index import InitFileBatch
+from smartcli.profiling import TEMPLATE_RENDERING, VALIDATION, ProfiledCommandMixin, profile_phase
+from smartcli.transaction import write_transaction
 from smartcli.templates import ViewTemplates
-from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, WARNING_MESSAGES
+from smartcli.config import FILE_SUFFIXES, IMPORT_SUFFIXES, SUCCESS_MESSAGES, TEMPLATE_CONFIGS, WARNING_MESSAGES
+from smartcli.introspection import get_model, get_view_query_plan
+from smartcli.project_index import ProjectIndex
 from smartcli.utils import (
     validate_pascal_case_name, validate_app_exists, validate_directory_exists,
     get_app_path, pascal_to_snake_case, check_file_exists, ensure_directory_exists,
-    write_file_content, add_import_to_content, update_all_list, clean_up_files,
+    write_file_content, use_lazy_init_files,
     extract_model_name_from_name
 )
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """
     Custom command to create a new Django view with proper template and imports.
 
     Usage:
         python manage.py create_views <view_name> <app_name>
+        python manage.py create_views <view_name> <app_name> --implement
 
     This command creates a new view file in the specified app's views directory
     with a template that follows the project conventions, and updates the __init__.py
     file to include the new view in imports and __all__. It also creates the
     corresponding test file.
+
+    With --implement, the actions get working bodies: active objects only,
+    cursor pagination, and a queryset loading only the serialized fields with
+    select_related/prefetch_related derived from the model relations.
     """
 
     help = "Creates a new Django view with proper template and imports"
 
+    # Set by apply_spec to defer __init__.py updates to a single pass
+    init_batch = None
+
     def add_arguments(self, parser):
         """Add command arguments."""
         parser.add_argument(
@@ -41,6 +54,11 @@ class Command(BaseCommand):
             type=str,
             help="Name of the model to attach the view to (defaults to view name without 'View' suffix)",
         )
+        parser.add_argument(
+            "--implement",
+            action="store_true",
+            help="Generate working actions with cursor pagination and an optimized queryset",
+        )
 
     def get_required_directory(self) -> str:
         """Return the required directory name for this command."""
@@ -70,50 +88,25 @@ class Command(BaseCommand):
         """
         return extract_model_name_from_name(view_name, "View")
 
-    def _check_model_exists(self, app_name: str, model_name: str) -> bool:
+    @profile_phase(VALIDATION)
+    def _get_existing_components(self, app_path: str, model_name: str) -> Dict[str, bool]:
         """
-        Check if the model exists in the app.
+        Check which components of the model exist in the app, with the project index.
 
         Args:
-            app_name: The app name
+            app_path: Directory of the app
             model_name: The model name
 
         Returns:
-            bool: True if model exists, False otherwise
-        """
-        models_path = os.path.join(get_app_path(app_name), "models")
-        model_file = os.path.join(models_path, f"{pascal_to_snake_case(model_name)}.py")
-        return check_file_exists(model_file)
-
-    def _check_serializer_exists(self, app_name: str, model_name: str) -> bool:
+            Dict[str, bool]: Existence of the model, serializer and service
         """
-        Check if the serializer exists in the app.
-
-        Args:
-            app_name: The app name
-            model_name: The model name
-
-        Returns:
-            bool: True if serializer exists, False otherwise
-        """
-        serializers_path = os.path.join(get_app_path(app_name), "serializers")
-        serializer_file = os.path.join(serializers_path, f"{pascal_to_snake_case(model_name)}_serializer.py")
-        return check_file_exists(serializer_file)
-
-    def _check_service_exists(self, app_name: str, model_name: str) -> bool:
-        """
-        Check if the service exists in the app.
-
-        Args:
-            app_name: The app name
-            model_name: The model name
-
-        Returns:
-            bool: True if service exists, False otherwise
-        """
-        services_path = os.path.join(get_app_path(app_name), "services")
-        service_file = os.path.join(services_path, f"{pascal_to_snake_case(model_name)}_service.py")
-        return check_file_exists(service_file)
+        index = ProjectIndex.load()
+        existing = {
+            component_type: index.has_component(app_path, component_type, model_name)
+            for component_type in ("model", "serializer", "service")
+        }
+        index.save()
+        return existing
 
     def generate_main_template(self, **kwargs) -> str:
         """Generate the main template content."""
@@ -124,7 +117,20 @@ class Command(BaseCommand):
         # Get model name - use provided model name or extract from view name
         if model_name is None:
             model_name = self._get_model_name_from_view(name)
-        
+
+        plan = kwargs.get("query_plan")
+        if plan is not None:
+            view_config = TEMPLATE_CONFIGS["view"]
+            return ViewTemplates.implemented_view_template(
+                name,
+                model_name,
+                app_name,
+                plan.only_fields,
+                plan.select_related,
+                plan.prefetch_related,
+                view_config["page_size"],
+                view_config["ordering"],
+            )
         return ViewTemplates.view_template(name, model_name, app_name)
 
     def generate_test_template(self, **kwargs) -> str:
@@ -136,8 +142,14 @@ class Command(BaseCommand):
         # Get model name - use provided model name or extract from view name
         if model_name is None:
             model_name = self._get_model_name_from_view(name)
-        
-        return ViewTemplates.view_test_template(name, model_name, app_name)
+
+        query_budget = dict(TEMPLATE_CONFIGS["view"]["query_budget"])
+        plan = kwargs.get("query_plan")
+        if plan is not None:
+            # Each prefetched relation runs one more query
+            query_budget = {action: budget + len(plan.prefetch_related) for action, budget in query_budget.items()}
+            query_budget["create"] += plan.create_queries
+        return ViewTemplates.view_test_template(name, model_name, app_name, query_budget, implemented=plan is not None)
 
     def get_additional_files(self, **kwargs) -> List[Tuple[str, str, str]]:
         """Get additional files to create."""
@@ -150,9 +162,10 @@ class Command(BaseCommand):
         model_name = options.get("model")
 
         # Validate inputs using utils
-        validate_pascal_case_name(view_name, self.get_name_type())
-        validate_app_exists(app_name)
-        validate_directory_exists(app_name, self.get_required_directory())
+        with profile_phase(VALIDATION):
+            validate_pascal_case_name(view_name, self.get_name_type())
+            validate_app_exists(app_name)
+            validate_directory_exists(app_name, self.get_required_directory())
 
         # Get model name - use provided model name or extract from view name
         if model_name is None:
@@ -161,8 +174,11 @@ class Command(BaseCommand):
             # Validate that the provided model name follows conventions
             validate_pascal_case_name(model_name, "Model")
 
-        # Check if model exists using utils
-        if not self._check_model_exists(app_name, model_name):
+        app_path = get_app_path(app_name)
+
+        # Components the view relies on, checked once with the project index
+        existing = self._get_existing_components(app_path, model_name)
+        if not existing["model"]:
             self.stdout.write(
                 self.style.WARNING(
                     WARNING_MESSAGES["model_not_found"].format(
@@ -172,8 +188,7 @@ class Command(BaseCommand):
                 )
             )
 
-        # Check if serializer exists
-        if not self._check_serializer_exists(app_name, model_name):
+        if not existing["serializer"]:
             self.stdout.write(
                 self.style.WARNING(
                     f"Serializer '{model_name}Serializer' not found in app '{app_name}'. "
@@ -181,8 +196,7 @@ class Command(BaseCommand):
                 )
             )
 
-        # Check if service exists
-        if not self._check_service_exists(app_name, model_name):
+        if not existing["service"]:
             self.stdout.write(
                 self.style.WARNING(
                     f"Service '{model_name}Service' not found in app '{app_name}'. "
@@ -190,8 +204,19 @@ class Command(BaseCommand):
                 )
             )
 
+        # Plan the queryset of the implemented actions from the model relations
+        query_plan = None
+        if options.get("implement"):
+            query_plan = get_view_query_plan(app_name, model_name, TEMPLATE_CONFIGS["view"]["ordering"])
+            if get_model(app_name, model_name) is None:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Model '{model_name}' is not installed, relations can't be detected: "
+                        f"the queryset loads the base fields only"
+                    )
+                )
+
         # Define paths using utils
-        app_path = get_app_path(app_name)
         views_path = os.path.join(app_path, "views")
         tests_path = os.path.join(app_path, "tests", "views")
 
@@ -209,26 +234,25 @@ class Command(BaseCommand):
         # Create directories if they don't exist using utils
         ensure_directory_exists(tests_path)
 
-        # Prepare file paths for cleanup
-        file_paths = [view_file, test_file]
-
         try:
-            # Generate templates
-            view_content = self.generate_main_template(
-                name=view_name, app_name=app_name, model=model_name
-            )
-            test_content = self.generate_test_template(
-                name=view_name, app_name=app_name, model=model_name
-            )
+            with write_transaction():
+                # Generate templates
+                with profile_phase(TEMPLATE_RENDERING):
+                    view_content = self.generate_main_template(
+                        name=view_name, app_name=app_name, model=model_name, query_plan=query_plan
+                    )
+                    test_content = self.generate_test_template(
+                        name=view_name, app_name=app_name, model=model_name, query_plan=query_plan
+                    )
 
-            # Create files using utils
-            write_file_content(view_file, view_content)
-            write_file_content(test_file, test_content)
+                # Create files using utils
+                write_file_content(view_file, view_content)
+                write_file_content(test_file, test_content)
 
-            # Update __init__.py files using utils
-            self._update_init_files_with_utils(
-                views_path, tests_path, view_name, view_filename
-            )
+                # Update __init__.py files using utils
+                self._update_init_files_with_utils(
+                    views_path, tests_path, view_name, view_filename
+                )
 
             # Success message using config
             self.stdout.write(
@@ -243,7 +267,7 @@ class Command(BaseCommand):
             # Show which model the view is attached to
             self.stdout.write(f"View attached to model: '{model_name}'")
 
-            if not self._check_model_exists(app_name, model_name):
+            if not existing["model"]:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Note: Model '{model_name}' was not found. "
@@ -251,7 +275,7 @@ class Command(BaseCommand):
                     )
                 )
 
-            if not self._check_serializer_exists(app_name, model_name):
+            if not existing["serializer"]:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Note: Serializer '{model_name}Serializer' was not found. "
@@ -259,7 +283,7 @@ class Command(BaseCommand):
                     )
                 )
 
-            if not self._check_service_exists(app_name, model_name):
+            if not existing["service"]:
                 self.stdout.write(
                     self.style.WARNING(
                         f"Note: Service '{model_name}Service' was not found. "
@@ -268,37 +292,30 @@ class Command(BaseCommand):
                 )
 
         except Exception as e:
-            # Clean up on error using utils
-            clean_up_files(file_paths)
+            # Staged files are discarded by the write transaction
             raise CommandError(f"Error creating view: {str(e)}")
 
     def _update_init_files_with_utils(self, views_path, tests_path, view_name, view_filename):
         """Update __init__.py files using utils functions."""
+        batch = self.init_batch if self.init_batch is not None else InitFileBatch()
+
         # Update views __init__.py
-        views_init_file = os.path.join(views_path, "__init__.py")
-        views_content = self._read_or_create_init_file(views_init_file)
-        views_content = add_import_to_content(
-            views_content, 
-            f"from .{view_filename}{FILE_SUFFIXES['view']} import {view_name}{IMPORT_SUFFIXES['view']}"
+        batch.add(
+            os.path.join(views_path, "__init__.py"),
+            f"from .{view_filename}{FILE_SUFFIXES['view']} import {view_name}{IMPORT_SUFFIXES['view']}",
+            [f"{view_name}{IMPORT_SUFFIXES['view']}"],
+            lazy=use_lazy_init_files("views"),
         )
-        views_content = update_all_list(views_content, f"{view_name}{IMPORT_SUFFIXES['view']}")
-        write_file_content(views_init_file, views_content)
-        self.stdout.write(f"Updated imports in: {views_init_file}")
 
         # Update tests __init__.py
-        tests_init_file = os.path.join(tests_path, "__init__.py")
-        tests_content = self._read_or_create_init_file(tests_init_file)
-        tests_content = add_import_to_content(
-            tests_content, 
-            f"from .test_{view_filename}{FILE_SUFFIXES['view']} import {view_name}{IMPORT_SUFFIXES['view']}Test"
+        batch.add(
+            os.path.join(tests_path, "__init__.py"),
+            f"from .test_{view_filename}{FILE_SUFFIXES['view']} import {view_name}{IMPORT_SUFFIXES['view']}Test",
+            [f"{view_name}{IMPORT_SUFFIXES['view']}Test"],
         )
-        tests_content = update_all_list(tests_content, f"{view_name}{IMPORT_SUFFIXES['view']}Test")
-        write_file_content(tests_init_file, tests_content)
-        self.stdout.write(f"Updated imports in: {tests_init_file}")
-
-    def _read_or_create_init_file(self, init_file_path):
-        """Read existing __init__.py file or create empty one."""
-        if os.path.exists(init_file_path):
-            with open(init_file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return "" 
\ No newline at end of file
+
+        if self.init_batch is None:
+            for init_file in batch.flush():
+                self.stdout.write(f"Updated imports in: {init_file}")
+            for init_file in batch.unchanged_files:
+                self.stdout.write(f"Unchanged: {init_file}")
@@ -0,0 +1,61 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from smartcli.config import SOURCE_DIRECTORY_TYPES
+from smartcli.discovery import get_project_apps
+from smartcli.profiling import ProfiledCommandMixin
+from smartcli.project_index import ProjectIndex
+
+
+class Command(ProfiledCommandMixin, BaseCommand):
+    """
+    Custom command to list the components of the project apps.
+
+    Usage:
+        python manage.py list_components
+        python manage.py list_components <app_name>...
+
+    Components are read from the project index (.smartcli/index.json): only
+    the files changed since the last run are parsed again. Helper classes
+    (managers, paginations...) are not listed.
+    """
+
+    help = "Lists the models, serializers, services, views and factories of the project apps"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "app_names", nargs="*", type=str, help="Apps to list (label or dotted name, all apps by default)"
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        project_apps = get_project_apps()
+        app_names = options["app_names"]
+        if app_names:
+            known_names = {name for app_name, _ in project_apps for name in (app_name, app_name.rsplit(".", 1)[-1])}
+            unknown = [app_name for app_name in app_names if app_name not in known_names]
+            if unknown:
+                raise CommandError(f"Unknown project app(s): {', '.join(unknown)}")
+            project_apps = [
+                (app_name, app_path)
+                for app_name, app_path in project_apps
+                if app_name in app_names or app_name.rsplit(".", 1)[-1] in app_names
+            ]
+
+        index = ProjectIndex.load()
+        for app_name, app_path in project_apps:
+            components = index.get_components(app_path)
+            self.stdout.write(self.style.SUCCESS(f"📦 {app_name}"))
+            for directory, component_type in SOURCE_DIRECTORY_TYPES.items():
+                classes = components[component_type]
+                if not classes:
+                    continue
+                self.stdout.write(f"  {directory}:")
+                for class_name, file_path in sorted(classes.items()):
+                    self.stdout.write(f"    - {class_name} ({os.path.relpath(file_path, app_path)})")
+        index.save()
+
+        if not project_apps:
+            self.stdout.write(self.style.WARNING("No project apps found"))
@@ -1,20 +1,37 @@
-import glob
 import os
+from typing import Optional
 
 from django.core.management.base import CommandError
 from django.core.management.commands.test import Command as TestCommand
 
+from smartcli.config import SLOWEST_TESTS_COUNT
+from smartcli.discovery import TestLabelIndex, get_project_apps
+from smartcli.impact import get_changed_files, get_impacted_test_labels
+from smartcli.profiling import TEST_RUN, TEST_SELECTION, ProfiledCommandMixin, profile_phase
+from smartcli.runner import add_runner_mixin
+from smartcli.sharding import load_label_durations, shard_labels
+from smartcli.snapshot import SnapshotRunnerMixin, get_database_snapshots
+from smartcli.timings import TimingRecorder, TimingRunnerMixin
 
-class Command(TestCommand):
+
+class Command(ProfiledCommandMixin, TestCommand):
     """
     Custom command that extends Django's test command.
-    Allows filtering tests by type (models, services, serializers, views).
+    Allows filtering tests by type (models, services, serializers, views),
+    several filters running together in a single test database setup.
 
     Usage:
         python manage.py test --models
         python manage.py test --services
         python manage.py test --serializers
         python manage.py test --views
+        python manage.py test --models --services --app users
+        python manage.py test --views --shard-index 0 --shard-count 8
+        python manage.py test --models --record-timings
+        python manage.py test --changed-since origin/main
+        python manage.py test --changed-since origin/main --ignore-outside-changes
+        python manage.py test --models --snapshot-db
+        python manage.py test --models --timings
     """
 
     def add_arguments(self, parser):
@@ -42,76 +59,331 @@ class Command(TestCommand):
             action="store_true",
             help='Run only tests in "views" directories',
         )
+        parser.add_argument(
+            "--app",
+            type=str,
+            help="Run only tests of this app (label or dotted name, e.g. users)",
+        )
+
+        # Impact options
+        parser.add_argument(
+            "--changed-since",
+            type=str,
+            metavar="REF",
+            help="Run only the tests impacted by the files changed since this git ref",
+        )
+        parser.add_argument(
+            "--ignore-outside-changes",
+            action="store_true",
+            help="With --changed-since, ignore changed Python files outside the project apps "
+            "instead of running the full (filtered) suite",
+        )
+
+        # Sharding options
+        parser.add_argument(
+            "--shard-index",
+            type=int,
+            help="Index of the shard to run (0-based), requires --shard-count",
+        )
+        parser.add_argument(
+            "--shard-count",
+            type=int,
+            help="Split the test files into this many shards and run only one of them",
+        )
+        parser.add_argument(
+            "--durations-file",
+            type=str,
+            help="JSON file of known test durations ({label: seconds}) used to balance shards",
+        )
+
+        # Database options
+        parser.add_argument(
+            "--snapshot-db",
+            action="store_true",
+            help="Migrate SQLite test databases once and reuse a snapshot until migrations change "
+            "(implies --keepdb)",
+        )
+
+        # Timing options
+        parser.add_argument(
+            "--record-timings",
+            action="store_true",
+            help="Record test durations in .smartcli/test_timings.sqlite3 and print the slowest tests",
+        )
+        parser.add_argument(
+            "--slowest",
+            type=int,
+            default=SLOWEST_TESTS_COUNT,
+            help=f"Number of slowest tests printed per category (default: {SLOWEST_TESTS_COUNT})",
+        )
 
     def handle(self, *test_labels, **options):
         """Handle command execution with filtering."""
-        # Get filtering options
-        filter_options = {
-            "models": options.get("models", False),
-            "services": options.get("services", False),
-            "serializers": options.get("serializers", False),
-            "views": options.get("views", False),
-        }
-
-        # Check that only one filtering option is used
-        active_filters = [k for k, v in filter_options.items() if v]
-        if len(active_filters) > 1:
-            raise CommandError(
-                f"You can only use one filtering option at a time. "
-                f"Active options: {', '.join(active_filters)}"
-            )
+        with profile_phase(TEST_SELECTION):
+            # Get filtering options
+            filter_options = {
+                "models": options.get("models", False),
+                "services": options.get("services", False),
+                "serializers": options.get("serializers", False),
+                "views": options.get("views", False),
+            }
+
+            # Several filters run together, in a single test database setup
+            active_filters = [k for k, v in filter_options.items() if v]
+            explicit_labels = list(test_labels)
+            project_apps = self._get_app_restriction(options.get("app")) if options.get("app") else None
 
-        # If a filter is active, modify test_labels
-        if active_filters:
-            filter_type = active_filters[0]
-            filtered_labels = self._get_filtered_test_labels(filter_type)
+            # Run only the tests impacted by the changed files (None: the full suite)
+            impacted_labels = None
+            if options.get("changed_since"):
+                impacted_labels = self._get_impacted_test_labels(
+                    options["changed_since"], active_filters or None, project_apps,
+                    options.get("ignore_outside_changes", False),
+                )
+
+            if impacted_labels is not None:
+                test_labels = impacted_labels
+                if explicit_labels:
+                    test_labels = intersect_test_labels(test_labels, explicit_labels)
+                if not test_labels:
+                    self.stdout.write(
+                        self.style.WARNING(f"No tests impacted by changes since {options['changed_since']}")
+                    )
+                    return
+
+            # If a filter is active, modify test_labels
+            elif active_filters:
+                filter_type = ", ".join(active_filters)
+                filtered_labels = self._get_filtered_test_labels(active_filters, project_apps)
+                if explicit_labels:
+                    filtered_labels = intersect_test_labels(filtered_labels, explicit_labels)
 
-            if not filtered_labels:
+                if not filtered_labels:
+                    self.stdout.write(
+                        self.style.WARNING(f"No tests found for filter '{filter_type}'")
+                    )
+                    return
+
+                # Replace test_labels with filtered labels
+                test_labels = filtered_labels
                 self.stdout.write(
-                    self.style.WARNING(f"No tests found for filter '{filter_type}'")
+                    self.style.SUCCESS(
+                        f"Running tests filtered by '{filter_type}': {len(test_labels)} files with tests found"
+                    )
                 )
-                return
 
-            # Replace test_labels with filtered labels
-            test_labels = filtered_labels
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Running tests filtered by '{filter_type}': {len(test_labels)} files with tests found"
+            # Without filter, --app runs every test of the app
+            elif project_apps is not None:
+                app_labels = [app_name for app_name, _ in project_apps]
+                test_labels = intersect_test_labels(app_labels, explicit_labels) if explicit_labels else app_labels
+                if not test_labels:
+                    self.stdout.write(self.style.WARNING(f"No tests found for app '{options['app']}'"))
+                    return
+
+            # Keep only the labels of the requested shard
+            if options.get("shard_index") is not None or options.get("shard_count") is not None:
+                test_labels = self._get_shard_labels(list(test_labels), options)
+                if not test_labels:
+                    self.stdout.write(self.style.WARNING("No tests in this shard"))
+                    return
+
+        # Time tests with the project runner extended by TimingRunnerMixin
+        if options.get("record_timings"):
+            options["timing_recorder"] = TimingRecorder(self.stdout, self.style, options["slowest"])
+            add_runner_mixin(options, TimingRunnerMixin)
+
+        # Reuse migrated test databases
+        db_snapshots = []
+        if options.get("snapshot_db"):
+            db_snapshots = self._restore_database_snapshots(options)
+
+        # Call parent method with potentially modified labels
+        try:
+            with profile_phase(TEST_RUN):
+                super().handle(*test_labels, **options)
+        finally:
+            for snapshot in db_snapshots:
+                snapshot.release()
+
+    def _restore_database_snapshots(self, options: dict) -> list:
+        """
+        Restore the migrated SQLite test databases and keep all test databases.
+
+        Args:
+            options: The command options, updated for the runner
+
+        Returns:
+            List of the restored database snapshots
+        """
+        options["keepdb"] = True
+        db_snapshots = get_database_snapshots()
+        for snapshot in db_snapshots:
+            if snapshot.restore():
+                self.stdout.write(f"Using test database snapshot for alias '{snapshot.alias}'")
+            else:
+                self.stdout.write(
+                    f"No test database snapshot for alias '{snapshot.alias}' and the current migrations, "
+                    f"it will be saved after migrating"
                 )
+
+        if db_snapshots:
+            options["db_snapshots"] = db_snapshots
+            add_runner_mixin(options, SnapshotRunnerMixin)
+        return db_snapshots
+
+    def _get_shard_labels(self, test_labels: list, options: dict) -> list:
+        """
+        Get the test labels of the requested shard.
+
+        Shards are balanced by known test durations when a durations file is
+        available, otherwise by number of test files.
+
+        Args:
+            test_labels: All test labels (filtered or given explicitly)
+            options: The command options
+
+        Returns:
+            List of test labels of the shard
+        """
+        shard_index = options.get("shard_index")
+        shard_count = options.get("shard_count")
+
+        if shard_index is None or shard_count is None:
+            raise CommandError("--shard-index and --shard-count must be used together")
+        if not test_labels:
+            raise CommandError(
+                "Sharding requires a test filter (--models, --services, --serializers, --views) "
+                "or explicit test labels"
             )
 
-        # Call parent method with potentially modified labels
-        super().handle(*test_labels, **options)
+        durations = load_label_durations(options.get("durations_file"))
+        try:
+            shard = shard_labels(test_labels, shard_index, shard_count, durations)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        balancing = "known durations" if durations else "number of test files"
+        self.stdout.write(
+            f"Running shard {shard_index + 1}/{shard_count}: "
+            f"{len(shard)} of {len(test_labels)} test labels (balanced by {balancing})"
+        )
+        return shard
 
-    def _get_filtered_test_labels(self, filter_type: str) -> list:
+    def _get_app_restriction(self, app: str) -> list:
+        """
+        Get the project app selected with --app.
+
+        Args:
+            app: Label or dotted name of the app (e.g. "users" or "apps.users")
+
+        Returns:
+            List with the (dotted app name, app directory) pair of the app
+        """
+        project_apps = get_project_apps()
+        selected = [
+            (app_name, app_path)
+            for app_name, app_path in project_apps
+            if app in (app_name, app_name.rsplit(".", 1)[-1])
+        ]
+        if not selected:
+            available = ", ".join(app_name.rsplit(".", 1)[-1] for app_name, _ in project_apps) or "none"
+            raise CommandError(f"App '{app}' not found in the project apps (available: {available})")
+        return selected
+
+    def _get_impacted_test_labels(
+        self, ref: str, categories: list = None, project_apps: list = None, ignore_outside_changes: bool = False
+    ) -> Optional[list]:
+        """
+        Get the test labels impacted by the files changed since a git ref.
+
+        Changed Python files outside the project apps (settings, shared
+        modules) can impact any test: the full suite is then selected, unless
+        ignore_outside_changes is set.
+
+        Args:
+            ref: The git ref to compare with
+            categories: Only keep tests of these categories (all tests when None)
+            project_apps: Only keep tests of these apps (all project apps when None)
+            ignore_outside_changes: Only run the tests impacted by changes inside the apps
+
+        Returns:
+            List of test labels to execute, or None to run the full (filtered) suite
+        """
+        try:
+            changed_files = get_changed_files(ref)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        test_labels, unmapped = get_impacted_test_labels(changed_files, get_project_apps(), categories)
+        if project_apps is not None:
+            app_names = [app_name for app_name, _ in project_apps]
+            test_labels = intersect_test_labels(test_labels, app_names)
+
+        if unmapped and not ignore_outside_changes:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(unmapped)} changed Python files are outside the project apps "
+                    f"(e.g. {os.path.relpath(unmapped[0])}), running the full test suite "
+                    f"(use --ignore-outside-changes to run only the impacted tests)"
+                )
+            )
+            return None
+        if unmapped:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(unmapped)} changed Python files are outside the project apps and not mapped to tests"
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Running tests impacted by {len(changed_files)} changed files since {ref}: "
+                f"{len(test_labels)} files with tests found"
+            )
+        )
+        return test_labels
+
+    def _get_filtered_test_labels(self, filter_types: list, project_apps: list = None) -> list:
         """
         Get filtered test labels by type.
 
+        Labels come from the cached TestLabelIndex: only apps whose test
+        directories changed since the last run are scanned again.
+
         Args:
-            filter_type: The filter type (models, services, etc.)
+            filter_types: The filter types (models, services, etc.), combined as a union
+            project_apps: Only keep tests of these apps (all project apps when None)
 
         Returns:
             List of test labels to execute
         """
+        index = TestLabelIndex.load()
         test_labels = []
+        for filter_type in filter_types:
+            test_labels.extend(index.get_labels(filter_type, project_apps))
+        index.save()
+        return list(dict.fromkeys(test_labels))
 
-        # Iterate through all Django apps
-        from django.conf import settings
 
-        for app_config in settings.INSTALLED_APPS:
-            if app_config.startswith("apps."):
-                app_name = app_config.replace("apps.", "")
-                test_dir = f"apps/{app_name}/tests/{filter_type}"
+def intersect_test_labels(test_labels: list, selected_labels: list) -> list:
+    """
+    Keep the parts of test labels selected by other labels.
 
-                if os.path.exists(test_dir):
-                    # Find all test files in this directory
-                    test_files = glob.glob(f"{test_dir}/test_*.py")
-                    test_files.extend(glob.glob(f"{test_dir}/*/test_*.py"))
+    A label is kept if it is inside a selected label (a test file of a
+    selected app or package), and a selected label is kept if it is inside a
+    test label (a test class or method of a filtered file).
 
-                    for test_file in test_files:
-                        # Convert path to Django test label
-                        # Ex: apps/account/tests/models/test_user.py -> apps.account.tests.models.test_user
-                        relative_path = test_file.replace("/", ".").replace(".py", "")
-                        test_labels.append(relative_path)
+    Args:
+        test_labels: Labels found by the filters
+        selected_labels: Labels given explicitly (dotted modules, classes or methods)
 
-        return test_labels
+    Returns:
+        List of labels in both selections
+    """
+    intersection = []
+    for label in test_labels:
+        for selected in selected_labels:
+            if label == selected or label.startswith(f"{selected}."):
+                intersection.append(label)
+            elif selected.startswith(f"{label}."):
+                intersection.append(selected)
+    return list(dict.fromkeys(intersection))
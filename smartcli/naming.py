@@ -0,0 +1,79 @@
+"""
+Naming helpers for Django SmartCLI.
+
+This module only depends on the standard library so that the CLI can validate
+and convert names without importing Django.
+"""
+
+import re
+
+
+def validate_pascal_case_name(name: str, name_type: str) -> None:
+    """
+    Validate that a name follows PascalCase conventions.
+
+    Args:
+        name: The name to validate
+        name_type: The type of name (e.g., "Model", "Serializer", "Service")
+
+    Raises:
+        ValueError: If the name is invalid
+    """
+    if not name[0].isupper():
+        raise ValueError(
+            f"{name_type} name '{name}' must start with an uppercase letter (PascalCase)"
+        )
+
+    if not name.replace("_", "").isalnum():
+        raise ValueError(
+            f"{name_type} name '{name}' can only contain letters, numbers, and underscores"
+        )
+
+
+def validate_module_name(name: str) -> None:
+    """
+    Validate that a module name is a valid Python identifier.
+
+    Args:
+        name: The module name to validate
+
+    Raises:
+        ValueError: If the name is invalid
+    """
+    if not name.isidentifier():
+        raise ValueError(
+            f"'{name}' is not a valid Python identifier. "
+            "Module names must contain only letters, digits, and underscores, "
+            "and cannot start with a digit."
+        )
+
+
+def pascal_to_snake_case(name: str) -> str:
+    """Convert PascalCase to snake_case."""
+    # If there are already underscores, just convert to lowercase
+    if '_' in name:
+        return name.lower()
+    
+    # Convert PascalCase to snake_case
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def snake_to_pascal_case(name: str) -> str:
+    """Convert snake_case to PascalCase."""
+    return "".join(word.capitalize() for word in name.split("_"))
+
+
+def extract_model_name_from_name(name: str, suffix: str) -> str:
+    """
+    Extract model name from a name with suffix (e.g., "UserSerializer" -> "User").
+
+    Args:
+        name: The name with suffix
+        suffix: The suffix to remove
+
+    Returns:
+        str: The name without suffix
+    """
+    if name.endswith(suffix):
+        return name[:-len(suffix)]
+    return name
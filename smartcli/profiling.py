@@ -0,0 +1,193 @@
+"""
+Phase timings and profiling of SmartCLI commands.
+
+With `--timings`, a command reports the time spent in each phase: Django
+setup (CLI only), validation, template rendering, file I/O, __init__.py
+updates and settings rewrite, or test selection and test run for the test
+command. `--profile FILE` also records a cProfile run
+of the command and dumps its stats to FILE (read it with `python -m pstats`).
+
+A ProfilingSession is active for the whole process run. Code marks its phases
+with profile_phase(), which does nothing without an active session. Phases
+nest: the time of an inner phase is not counted in the outer one, so phases
+add up to the total. Only the thread that started the session records
+phases, work of worker threads is counted in the phase that waits for them.
+
+This module must stay importable without Django: it is used by the CLI.
+"""
+
+import cProfile
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Phases, in report order
+DJANGO_SETUP = "Django setup"
+VALIDATION = "validation"
+TEMPLATE_RENDERING = "template rendering"
+FILE_IO = "file I/O"
+INIT_UPDATES = "__init__ updates"
+SETTINGS_REWRITE = "settings rewrite"
+TEST_SELECTION = "test selection"
+TEST_RUN = "test run"
+PHASES = [
+    DJANGO_SETUP, VALIDATION, TEMPLATE_RENDERING, FILE_IO, INIT_UPDATES, SETTINGS_REWRITE, TEST_SELECTION, TEST_RUN,
+]
+
+# Time spent outside any phase
+OTHER_PHASE = "other"
+
+_session: Optional["ProfilingSession"] = None
+
+
+def get_active_session() -> Optional["ProfilingSession"]:
+    """
+    Get the active profiling session.
+
+    Returns:
+        Optional[ProfilingSession]: The active session, or None
+    """
+    return _session
+
+
+@contextmanager
+def profile_phase(phase: str) -> Iterator[None]:
+    """
+    Count the time of the block in a phase of the active session (if any).
+
+    Args:
+        phase: Name of the phase (see PHASES)
+    """
+    session = _session
+    if session is None or threading.get_ident() != session.thread_id:
+        yield
+        return
+    with session.phase(phase):
+        yield
+
+
+class ProfilingSession:
+    """
+    Phase timings (and optionally a cProfile run) of a command.
+
+    Usage:
+        with ProfilingSession(profile_file="create_model.pstats") as session:
+            with profile_phase(VALIDATION):
+                ...
+        for line in session.format_report():
+            print(line)
+
+    Args:
+        profile_file: Path of the pstats file to write, None to only time phases
+    """
+
+    def __init__(self, profile_file: Optional[str] = None):
+        self.profile_file = profile_file
+        self.durations: Dict[str, float] = {}
+        self.total = 0.0
+        self.thread_id = threading.get_ident()
+        # [phase, time when its current slice started] of the open phases
+        self._stack: List[list] = []
+        self._started = 0.0
+        self._profiler: Optional[cProfile.Profile] = None
+
+    def __enter__(self) -> "ProfilingSession":
+        global _session
+        _session = self
+        self.thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        if self.profile_file:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _session
+        if self._profiler is not None:
+            self._profiler.disable()
+            directory = os.path.dirname(os.path.abspath(self.profile_file))
+            os.makedirs(directory, exist_ok=True)
+            self._profiler.dump_stats(self.profile_file)
+        self.total = time.perf_counter() - self._started
+        _session = None
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """
+        Count the time of the block in a phase, pausing the enclosing phase.
+
+        Args:
+            phase: Name of the phase
+        """
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self._add(outer[0], now - outer[1])
+        self._stack.append([phase, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            name, started = self._stack.pop()
+            self._add(name, now - started)
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def _add(self, phase: str, duration: float) -> None:
+        """Add a duration to a phase."""
+        self.durations[phase] = self.durations.get(phase, 0.0) + duration
+
+    def format_report(self) -> List[str]:
+        """
+        Format the phase breakdown (and the profile file) of the session.
+
+        Returns:
+            List[str]: Report lines
+        """
+        lines = [f"⏱️  Timings (total {self.total:.3f}s):"]
+        phases = [phase for phase in PHASES if phase in self.durations]
+        phases += sorted(phase for phase in self.durations if phase not in PHASES)
+        other = max(self.total - sum(self.durations.values()), 0.0)
+        for phase, duration in [(phase, self.durations[phase]) for phase in phases] + [(OTHER_PHASE, other)]:
+            share = duration / self.total * 100 if self.total else 0.0
+            lines.append(f"    {phase:<20} {duration:8.3f}s  {share:5.1f}%")
+        if self.profile_file:
+            lines.append(f"Profile saved to {self.profile_file} (read it with: python -m pstats {self.profile_file})")
+        return lines
+
+
+class ProfiledCommandMixin:
+    """
+    Management command mixin adding the --timings and --profile options.
+
+    When the CLI already runs a session (to time the Django setup), the
+    command joins it and the CLI prints the report.
+    """
+
+    def create_parser(self, prog_name, subcommand, **kwargs):
+        parser = super().create_parser(prog_name, subcommand, **kwargs)
+        parser.add_argument(
+            "--timings",
+            action="store_true",
+            help="Report the time spent in each phase of the command",
+        )
+        parser.add_argument(
+            "--profile",
+            metavar="FILE",
+            help="Report phase timings and save a cProfile dump of the command to FILE",
+        )
+        return parser
+
+    def execute(self, *args, **options):
+        if get_active_session() is not None or not (options.get("timings") or options.get("profile")):
+            return super().execute(*args, **options)
+
+        session = ProfilingSession(options.get("profile"))
+        try:
+            with session:
+                return super().execute(*args, **options)
+        finally:
+            for line in session.format_report():
+                self.stdout.write(line)
@@ -0,0 +1,175 @@
+"""
+Django project discovery for the CLI and the commands.
+
+The project root is the nearest directory containing manage.py, found by
+walking up from the current directory, so commands also run from a
+subdirectory of the project. The settings module is read from the
+DJANGO_SETTINGS_MODULE default of manage.py and resolved to its file.
+
+Discoveries are memoized in the process and keyed by the manage.py
+modification time: the CLI looks the project up several times per command,
+and the `serve` server for every command it runs, but only walks the tree and
+parses manage.py again when it changed. Nothing is kept between processes.
+
+This module must stay importable without Django: it is used by the CLI.
+"""
+
+import os
+import re
+import sys
+from typing import Dict, Optional
+
+# Matches os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project.settings")
+SETTINGS_MODULE_PATTERN = re.compile(
+    r"""DJANGO_SETTINGS_MODULE['"]\s*,\s*['"]([\w.]+)['"]"""
+)
+
+# manage.py path found from each start directory
+_manage_py_paths: Dict[str, str] = {}
+
+# Discovered projects by manage.py path
+_projects: Dict[str, "DjangoProject"] = {}
+
+
+class DjangoProject:
+    """
+    A discovered Django project.
+
+    Args:
+        manage_py: Absolute path to manage.py
+        mtime: Modification time of manage.py (ns) when it was parsed
+        settings_module: The DJANGO_SETTINGS_MODULE default of manage.py, if any
+        settings_file: Path to the settings module file, if it was found
+    """
+
+    def __init__(
+        self,
+        manage_py: str,
+        mtime: int,
+        settings_module: Optional[str],
+        settings_file: Optional[str],
+    ):
+        self.manage_py = manage_py
+        self.mtime = mtime
+        self.settings_module = settings_module
+        self.settings_file = settings_file
+
+    @property
+    def root(self) -> str:
+        """Directory of manage.py."""
+        return os.path.dirname(self.manage_py)
+
+
+def find_manage_py(start: Optional[str] = None) -> Optional[str]:
+    """
+    Find the nearest manage.py in a directory or its parents.
+
+    Args:
+        start: Directory to start from (defaults to the current directory)
+
+    Returns:
+        Optional[str]: Absolute path to manage.py, or None outside a Django project
+    """
+    directory = os.path.abspath(start or os.getcwd())
+    while True:
+        manage_py = os.path.join(directory, "manage.py")
+        if os.path.isfile(manage_py):
+            return manage_py
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def read_settings_module(manage_py_path: str) -> Optional[str]:
+    """
+    Read the settings module declared in manage.py.
+
+    Args:
+        manage_py_path: Path to the manage.py file
+
+    Returns:
+        Optional[str]: The DJANGO_SETTINGS_MODULE value, or None if not found
+    """
+    try:
+        with open(manage_py_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    match = SETTINGS_MODULE_PATTERN.search(content)
+    if match:
+        return match.group(1)
+    return None
+
+
+def resolve_settings_file(project_root: str, settings_module: str) -> Optional[str]:
+    """
+    Resolve a settings module to its file.
+
+    An imported settings module is resolved from its __file__, otherwise the
+    module path is looked up in the project root (module.py, then
+    module/__init__.py), without importing anything.
+
+    Args:
+        project_root: Directory of manage.py
+        settings_module: Dotted path of the settings module
+
+    Returns:
+        Optional[str]: Path to the settings file, or None if it doesn't exist
+    """
+    module = sys.modules.get(settings_module)
+    if getattr(module, "__file__", None):
+        return os.path.abspath(module.__file__)
+
+    module_path = os.path.join(project_root, *settings_module.split("."))
+    for settings_file in (f"{module_path}.py", os.path.join(module_path, "__init__.py")):
+        if os.path.isfile(settings_file):
+            return settings_file
+    return None
+
+
+def get_project(start: Optional[str] = None) -> Optional[DjangoProject]:
+    """
+    Discover the Django project containing a directory.
+
+    Args:
+        start: Directory to start from (defaults to the current directory)
+
+    Returns:
+        Optional[DjangoProject]: The project, or None outside a Django project
+    """
+    start = os.path.abspath(start or os.getcwd())
+    manage_py = _manage_py_paths.get(start)
+    mtime = _get_mtime(manage_py) if manage_py else None
+    if mtime is None:
+        manage_py = find_manage_py(start)
+        mtime = _get_mtime(manage_py) if manage_py else None
+        if mtime is None:
+            _manage_py_paths.pop(start, None)
+            return None
+        _manage_py_paths[start] = manage_py
+
+    project = _projects.get(manage_py)
+    if project is None or project.mtime != mtime:
+        settings_module = read_settings_module(manage_py)
+        settings_file = None
+        if settings_module:
+            settings_file = resolve_settings_file(os.path.dirname(manage_py), settings_module)
+        project = DjangoProject(manage_py, mtime, settings_module, settings_file)
+        _projects[manage_py] = project
+    return project
+
+
+def forget_projects() -> None:
+    """Forget the projects discovered by this process."""
+    _manage_py_paths.clear()
+    _projects.clear()
+
+
+def _get_mtime(path: str) -> Optional[int]:
+    """Modification time of a file in ns, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
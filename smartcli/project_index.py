@@ -0,0 +1,275 @@
+"""
+Project component index for the generator commands.
+
+ProjectIndex records the classes defined in the component directories
+(models/, serializers/, services/, views/, factories/) of each app, found with
+an AST scan, and caches them in .smartcli/index.json. Each app entry records
+the modification times of its directories and files: a directory is listed
+again when a file is added or removed, a file is parsed again when it is
+edited, so only what changed is scanned. Lookups are then dictionary lookups.
+
+Only component classes are indexed as components: classes named after their
+component type (UserSerializer) or deriving from its base classes (a model
+derives from a *Model class). Helpers such as managers, paginations or
+choices defined next to them are not components.
+"""
+
+import ast
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from smartcli.config import (
+    CACHE_DIRECTORY, COMPONENT_BASE_SUFFIXES, FILE_SUFFIXES, IMPORT_SUFFIXES, PROJECT_INDEX_CACHE_FILE,
+    SOURCE_DIRECTORY_TYPES,
+)
+from smartcli.naming import pascal_to_snake_case
+from smartcli.transaction import get_active_transaction, write_transaction
+from smartcli.utils import read_file_content, write_file_content
+
+# Bump when the cache format changes
+CACHE_VERSION = 2
+
+# Source directory of each component type
+COMPONENT_DIRECTORIES = {component_type: directory for directory, component_type in SOURCE_DIRECTORY_TYPES.items()}
+
+
+def get_index_file() -> str:
+    """Path of the project index cache file of the current project."""
+    return os.path.join(str(settings.BASE_DIR), CACHE_DIRECTORY, PROJECT_INDEX_CACHE_FILE)
+
+
+class ProjectIndex:
+    """
+    Cached index of the component classes of the project apps.
+
+    Usage:
+        index = ProjectIndex.load()
+        exists = index.has_component(app_path, "model", "User")
+        index.save()
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, entries: Optional[Dict[str, dict]] = None):
+        self.cache_file = cache_file or get_index_file()
+        self._entries: Dict[str, dict] = entries or {}
+        # Apps checked against the disk by this instance, and their class -> file maps
+        self._components: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._changed = False
+
+    @classmethod
+    def load(cls, cache_file: Optional[str] = None) -> "ProjectIndex":
+        """
+        Load the index from the cache file (an empty index if missing or invalid).
+
+        Args:
+            cache_file: Path to the cache file (defaults to the project cache)
+
+        Returns:
+            ProjectIndex: The loaded index
+        """
+        cache_file = cache_file or get_index_file()
+        try:
+            data = json.loads(read_file_content(cache_file) or "{}")
+        except ValueError:
+            data = {}
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return cls(cache_file)
+        return cls(cache_file, data.get("entries", {}))
+
+    def get_components(self, app_path: str) -> Dict[str, Dict[str, str]]:
+        """
+        Get the component classes of an app.
+
+        The app entry is refreshed from the disk on the first call of each
+        index instance.
+
+        Args:
+            app_path: Directory of the app
+
+        Returns:
+            Dict[str, Dict[str, str]]: Class name -> file path, by component type
+        """
+        app_path = os.path.abspath(app_path)
+        components = self._components.get(app_path)
+        if components is None:
+            classes = {component_type: {} for component_type in SOURCE_DIRECTORY_TYPES.values()}
+            entry = self._refresh(app_path)
+            if entry is not None:
+                for file_path, file_entry in sorted(entry["files"].items()):
+                    component_type = SOURCE_DIRECTORY_TYPES[os.path.basename(os.path.dirname(file_path))]
+                    for class_name, bases in file_entry["classes"].items():
+                        classes[component_type].setdefault(class_name, (file_path, bases))
+            components = {
+                component_type: _get_component_classes(component_type, type_classes)
+                for component_type, type_classes in classes.items()
+            }
+            self._components[app_path] = components
+        return components
+
+    def has_component(self, app_path: str, component_type: str, model_name: str) -> bool:
+        """
+        Check if an app has the component of a model (e.g. the UserSerializer of User).
+
+        The component exists if its class is defined in the component
+        directory, or if its conventional file exists or is staged in the
+        active write transaction.
+
+        Args:
+            app_path: Directory of the app
+            component_type: The component type (model, serializer, service, view or factory)
+            model_name: Name of the model
+
+        Returns:
+            bool: True if the component exists
+        """
+        class_name = f"{model_name}{IMPORT_SUFFIXES[component_type]}"
+        if class_name in self.get_components(app_path)[component_type]:
+            return True
+
+        file_path = os.path.join(
+            os.path.abspath(app_path),
+            COMPONENT_DIRECTORIES[component_type],
+            f"{pascal_to_snake_case(model_name)}{FILE_SUFFIXES[component_type]}.py",
+        )
+        entry = self._entries.get(os.path.abspath(app_path))
+        if entry is not None and file_path in entry["files"]:
+            return True
+        transaction = get_active_transaction()
+        return transaction is not None and transaction.is_staged(file_path)
+
+    def save(self) -> None:
+        """Write the index to the cache file if it changed."""
+        if not self._changed:
+            return
+
+        content = json.dumps({"version": CACHE_VERSION, "entries": self._entries}, indent=1, sort_keys=True)
+        try:
+            with write_transaction():
+                write_file_content(self.cache_file, content)
+        except OSError:
+            # A read-only project still generates components, just without cache
+            return
+        self._changed = False
+
+    def _refresh(self, app_path: str) -> Optional[dict]:
+        """
+        Bring the entry of an app up to date with the disk.
+
+        Returns:
+            Optional[dict]: The entry (directory mtimes and files), or None if the app doesn't exist
+        """
+        entry = self._entries.get(app_path)
+        if not os.path.isdir(app_path):
+            if entry is not None:
+                del self._entries[app_path]
+                self._changed = True
+            return None
+        if entry is None:
+            entry = {"directories": {}, "files": {}}
+            self._entries[app_path] = entry
+            self._changed = True
+
+        for directory_name in SOURCE_DIRECTORY_TYPES:
+            directory = os.path.join(app_path, directory_name)
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            if directory in entry["directories"] and entry["directories"][directory] == mtime:
+                continue
+
+            # Files were added or removed: list the directory again
+            entry["directories"][directory] = mtime
+            file_paths = set(_list_component_files(directory)) if mtime is not None else set()
+            for file_path in [path for path in entry["files"] if os.path.dirname(path) == directory]:
+                if file_path not in file_paths:
+                    del entry["files"][file_path]
+            for file_path in file_paths:
+                entry["files"].setdefault(file_path, {"mtime": None, "classes": {}})
+            self._changed = True
+
+        for file_path, file_entry in list(entry["files"].items()):
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except OSError:
+                del entry["files"][file_path]
+                self._changed = True
+                continue
+            if file_entry["mtime"] != mtime:
+                entry["files"][file_path] = {"mtime": mtime, "classes": _get_classes(file_path)}
+                self._changed = True
+
+        return entry
+
+
+def _list_component_files(directory: str) -> List[str]:
+    """List the Python files of a component directory (__init__.py excluded)."""
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return []
+    return [
+        os.path.join(directory, name)
+        for name in names
+        if name.endswith(".py") and name != "__init__.py"
+    ]
+
+
+def _get_classes(file_path: str) -> Dict[str, List[str]]:
+    """Get the top-level classes of a Python file with their base names (none if it can't be parsed)."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return {}
+    return {
+        node.name: [_get_base_name(base) for base in node.bases]
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    }
+
+
+def _get_base_name(node: ast.expr) -> str:
+    """Name of a base class expression (models.Model -> Model, Generic[T] -> Generic)."""
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+
+def _get_component_classes(component_type: str, classes: Dict[str, Tuple[str, List[str]]]) -> Dict[str, str]:
+    """
+    Keep the component classes of a component directory.
+
+    A class is a component if it is named after the component type, derives
+    from one of its base classes, or derives from another component class.
+
+    Args:
+        component_type: The component type of the directory
+        classes: Class name -> (file path, base names) of the directory
+
+    Returns:
+        Dict[str, str]: Class name -> file path of the component classes
+    """
+    suffix = IMPORT_SUFFIXES[component_type]
+    base_suffixes = COMPONENT_BASE_SUFFIXES[component_type]
+    components = {
+        class_name: file_path
+        for class_name, (file_path, bases) in classes.items()
+        if (suffix and class_name.endswith(suffix)) or any(base.endswith(base_suffixes) for base in bases)
+    }
+    # Subclasses of components (class Admin(User)), to any depth
+    added = True
+    while added:
+        added = False
+        for class_name, (file_path, bases) in classes.items():
+            if class_name not in components and any(base in components for base in bases):
+                components[class_name] = file_path
+                added = True
+    return components
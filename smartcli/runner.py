@@ -0,0 +1,45 @@
+"""
+Test runner extension point of the filtered test command.
+
+Options such as `--record-timings` or `--snapshot-db` extend the project test
+runner (TEST_RUNNER or `--testrunner`) with mixins instead of replacing it:
+the command points `--testrunner` at ExtendedTestRunner and passes the
+original runner and the mixins as runner options.
+"""
+
+from typing import Optional, Sequence
+
+from django.conf import settings
+from django.test.utils import get_runner
+
+
+class ExtendedTestRunner:
+    """
+    Test runner path used by the test command when runner mixins are enabled.
+
+    Instantiating it builds the runner given by the base_runner option
+    (TEST_RUNNER by default), extended with the classes of the runner_mixins
+    option.
+    """
+
+    def __new__(cls, *args, base_runner: Optional[str] = None, runner_mixins: Sequence[type] = (), **kwargs):
+        runner = get_runner(settings, base_runner)
+        if not runner_mixins:
+            return runner(*args, **kwargs)
+        runner_class = type(f"Extended{runner.__name__}", (*runner_mixins, runner), {})
+        return runner_class(*args, **kwargs)
+
+
+def add_runner_mixin(options: dict, mixin: type) -> None:
+    """
+    Extend the test runner of a test command run with a mixin.
+
+    Args:
+        options: The test command options, passed to the runner
+        mixin: The runner mixin class
+    """
+    if options.get("testrunner") != f"{__name__}.ExtendedTestRunner":
+        options["base_runner"] = options.get("testrunner")
+        options["testrunner"] = f"{__name__}.ExtendedTestRunner"
+        options["runner_mixins"] = []
+    options["runner_mixins"].append(mixin)
@@ -0,0 +1,328 @@
+"""
+Scaffolding server for Django SmartCLI.
+
+`django-smartcli serve` keeps a process with Django already set up, listening
+on a Unix socket dedicated to the current project. The CLI forwards commands
+to it when it is running and falls back to running them itself otherwise.
+
+Protocol: the client sends one JSON line {"command": ..., "args": [...]} and
+receives JSON lines {"stdout": text} / {"stderr": text} followed by a final
+{"exit_code": code}, or a single {"unavailable": message} when the server
+can't run the command (the client then runs it itself). A {"shutdown": true}
+request stops the server.
+
+The socket lives in a directory only the current user can access
+($XDG_RUNTIME_DIR, or a 0700 smartcli-<uid> directory in the temp directory)
+and is created with mode 0600, so other local users can't connect to it or
+plant their own socket in its place.
+
+This module must stay importable without Django: it is used by the CLI client.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+from typing import List, Optional
+
+from smartcli.project import get_project
+
+
+# Commands that can be executed by the server (test keeps its own process)
+SERVED_COMMANDS = [
+    "create_module",
+    "create_model",
+    "create_serializer",
+    "create_service",
+    "create_factory",
+    "create_views",
+    "apply_spec",
+    "list_components",
+]
+
+# Commands reading the installed models: the server leaves them to the CLI
+# once a models file changed, since its model classes are not reloaded
+MODEL_COMMANDS = [
+    "create_serializer",
+    "create_factory",
+    "create_views",
+    "apply_spec",
+]
+
+STALE_MODELS_MESSAGE = (
+    "ℹ️  Models changed since the SmartCLI server started, running without it "
+    "(restart it with: django-smartcli serve --stop && django-smartcli serve)\n"
+)
+
+# Timeout (in seconds) when connecting to the server
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_directory() -> str:
+    """
+    Get the directory of the server sockets of the current user.
+
+    Returns:
+        str: $XDG_RUNTIME_DIR if set, otherwise a per-user directory in the temp directory
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    user_id = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return os.path.join(tempfile.gettempdir(), f"smartcli-{user_id}")
+
+
+def is_private_directory(directory: str) -> bool:
+    """
+    Check that a directory is owned by the current user and closed to others.
+
+    Args:
+        directory: Path to the directory
+
+    Returns:
+        bool: True if the directory is a real directory with no group/other access
+    """
+    try:
+        stat_result = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(stat_result.st_mode) or stat_result.st_mode & 0o077:
+        return False
+    return not hasattr(os, "getuid") or stat_result.st_uid == os.getuid()
+
+
+def get_socket_path(project_root: Optional[str] = None) -> str:
+    """
+    Get the server socket path for a project.
+
+    Args:
+        project_root: The project root directory (defaults to the current project,
+            or the current directory outside a project)
+
+    Returns:
+        str: Path to the Unix socket of the project server
+    """
+    if project_root is None:
+        project = get_project()
+        project_root = project.root if project is not None else os.getcwd()
+    project_root = os.path.realpath(project_root)
+    project_hash = hashlib.sha1(project_root.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+    return os.path.join(get_socket_directory(), f"smartcli-{project_hash}.sock")
+
+
+def _connect(socket_path: str) -> Optional[socket.socket]:
+    """Connect to the server socket, or return None if no server is listening."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    # Never talk to a socket another user could have planted
+    if not is_private_directory(os.path.dirname(os.path.abspath(socket_path))):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CONNECT_TIMEOUT)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+    client.settimeout(None)
+    return client
+
+
+def _send_request(client: socket.socket, request: dict) -> None:
+    """Send a JSON line request."""
+    client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+
+
+def forward_command(command: str, args: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Run a command on the project server, streaming its output.
+
+    Args:
+        command: The Django command to run
+        args: Arguments for the command
+        socket_path: Path to the server socket (defaults to the current project)
+
+    Returns:
+        Optional[int]: Exit code, or None if no server is available or it
+        can't run the command
+    """
+    client = _connect(socket_path or get_socket_path())
+    if client is None:
+        return None
+
+    exit_code = None
+    received = False
+    try:
+        _send_request(client, {"command": command, "args": args})
+        with client.makefile("r", encoding="utf-8") as responses:
+            for line in responses:
+                received = True
+                message = json.loads(line)
+                if "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                    sys.stdout.flush()
+                elif "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+                    sys.stderr.flush()
+                elif "unavailable" in message:
+                    sys.stderr.write(message["unavailable"])
+                    return None
+                elif "exit_code" in message:
+                    exit_code = message["exit_code"]
+                    break
+    except (OSError, ValueError):
+        pass
+    finally:
+        client.close()
+
+    if exit_code is None and received:
+        # The command may have partially run, don't run it a second time
+        print("❌ Error: Connection to the SmartCLI server was lost", file=sys.stderr)
+        return 1
+    return exit_code
+
+
+def stop_server(socket_path: Optional[str] = None) -> bool:
+    """
+    Ask the project server to stop.
+
+    Args:
+        socket_path: Path to the server socket (defaults to the current project)
+
+    Returns:
+        bool: True if a server was running and has been asked to stop
+    """
+    client = _connect(socket_path or get_socket_path())
+    if client is None:
+        return False
+
+    try:
+        _send_request(client, {"shutdown": True})
+        client.recv(1)
+    except OSError:
+        return False
+    finally:
+        client.close()
+    return True
+
+
+class _SocketOutput:
+    """File-like object sending written text to the client as JSON lines."""
+
+    def __init__(self, wfile, stream_name: str):
+        self.wfile = wfile
+        self.stream_name = stream_name
+
+    def write(self, text: str) -> None:
+        if text:
+            self.wfile.write((json.dumps({self.stream_name: text}) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _CommandRequestHandler(socketserver.StreamRequestHandler):
+    """Execute one command request with the warm Django setup."""
+
+    def handle(self):
+        from smartcli.cli import execute_django_command
+
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        if request.get("shutdown"):
+            self.server.stop_requested = True
+            self.wfile.write(b"\n")
+            return
+
+        command = request.get("command")
+        if command in MODEL_COMMANDS:
+            from smartcli.introspection import get_models_mtimes
+
+            if get_models_mtimes() != self.server.models_mtimes:
+                self.wfile.write((json.dumps({"unavailable": STALE_MODELS_MESSAGE}) + "\n").encode("utf-8"))
+                return
+
+        stdout = _SocketOutput(self.wfile, "stdout")
+        stderr = _SocketOutput(self.wfile, "stderr")
+
+        if command not in SERVED_COMMANDS:
+            stderr.write(f"❌ Error: Command '{command}' cannot be run by the server\n")
+            exit_code = 1
+        else:
+            try:
+                exit_code = execute_django_command(command, request.get("args", []), stdout, stderr)
+            except Exception as e:
+                stderr.write(f"❌ Error running Django command: {str(e)}\n")
+                exit_code = 1
+
+        self.wfile.write((json.dumps({"exit_code": exit_code}) + "\n").encode("utf-8"))
+
+
+def serve(socket_path: Optional[str] = None) -> int:
+    """
+    Serve commands for the current project until stopped (Django must be set up).
+
+    Args:
+        socket_path: Path to the server socket (defaults to the current project)
+
+    Returns:
+        int: Exit code
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ Error: The SmartCLI server requires Unix domain sockets")
+        return 1
+
+    socket_path = socket_path or get_socket_path()
+    socket_directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_directory, mode=0o700, exist_ok=True)
+    if not is_private_directory(socket_directory):
+        print(f"❌ Error: {socket_directory} must be a directory only you can access (mode 0700)")
+        return 1
+
+    if os.path.exists(socket_path):
+        client = _connect(socket_path)
+        if client is not None:
+            client.close()
+            print(f"❌ Error: A SmartCLI server is already running on {socket_path}")
+            return 1
+        # Stale socket left by a server that did not shut down cleanly
+        os.remove(socket_path)
+
+    # Create the socket with mode 0600 rather than restricting it after bind()
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, _CommandRequestHandler)
+    finally:
+        os.umask(umask)
+    server.stop_requested = False
+    # The model classes were imported by the Django setup, from these files
+    from smartcli.introspection import get_models_mtimes
+    server.models_mtimes = get_models_mtimes()
+
+    print(f"🚀 SmartCLI server listening on {socket_path}")
+    print("   Stop it with Ctrl+C or: django-smartcli serve --stop")
+
+    try:
+        while not server.stop_requested:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+    print("✅ SmartCLI server stopped")
+    return 0
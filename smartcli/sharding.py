@@ -0,0 +1,87 @@
+"""
+Deterministic sharding of test labels for the filtered test command.
+
+Labels are spread over shards with a greedy longest-first assignment: each
+label, from the slowest to the fastest, goes to the shard with the smallest
+total duration so far. Without known durations every label weighs the same,
+which balances shards by number of test files. The assignment only depends
+on the labels and durations, so every CI runner computes the same split.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from smartcli.config import CACHE_DIRECTORY, TEST_DURATIONS_FILE
+from smartcli.utils import read_file_content
+
+# Weight of a label without known duration when no duration is known at all
+DEFAULT_LABEL_DURATION = 1.0
+
+
+def shard_labels(
+    labels: List[str],
+    shard_index: int,
+    shard_count: int,
+    durations: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """
+    Get the labels of one shard.
+
+    Args:
+        labels: All test labels
+        shard_index: Index of the shard (0-based)
+        shard_count: Total number of shards
+        durations: Known durations of the labels, in seconds
+
+    Returns:
+        List[str]: Labels of the shard, in their original order
+
+    Raises:
+        ValueError: If the shard index or count is invalid
+    """
+    if shard_count < 1:
+        raise ValueError(f"Shard count must be at least 1 (got {shard_count})")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index must be between 0 and {shard_count - 1} (got {shard_index})")
+
+    durations = durations or {}
+    known = [durations[label] for label in labels if label in durations]
+    # Unknown labels are assumed to take an average time
+    default_duration = sum(known) / len(known) if known else DEFAULT_LABEL_DURATION
+
+    loads = [0.0] * shard_count
+    assigned = set()
+    for label in sorted(set(labels), key=lambda label: (-durations.get(label, default_duration), label)):
+        shard = min(range(shard_count), key=lambda index: (loads[index], index))
+        loads[shard] += durations.get(label, default_duration)
+        if shard == shard_index:
+            assigned.add(label)
+
+    return [label for label in labels if label in assigned]
+
+
+def load_label_durations(durations_file: Optional[str] = None) -> Dict[str, float]:
+    """
+    Load known test label durations from a JSON file ({label: seconds}).
+
+    Args:
+        durations_file: Path to the file (defaults to .smartcli/test_durations.json)
+
+    Returns:
+        Dict[str, float]: Durations by label (empty if the file is missing or invalid)
+    """
+    durations_file = durations_file or os.path.join(str(settings.BASE_DIR), CACHE_DIRECTORY, TEST_DURATIONS_FILE)
+    try:
+        data = json.loads(read_file_content(durations_file) or "{}")
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        label: float(duration)
+        for label, duration in data.items()
+        if isinstance(duration, (int, float)) and duration >= 0
+    }
@@ -0,0 +1,194 @@
+"""
+Migrated test database snapshots for the filtered test command.
+
+With `test --snapshot-db`, SQLite test databases are migrated once and saved
+as templates in .smartcli/test_db/, keyed by a hash of every migration file of
+the installed apps. Later runs copy the template in place and keep it
+(`--keepdb`), so migrations only run again when a migration file changes.
+Other database backends reuse their test database with `--keepdb`.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import os
+import shutil
+import sqlite3
+import tempfile
+from typing import List, Optional
+
+import django
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db import connections
+from django.db.migrations.loader import MigrationLoader
+
+from smartcli.config import CACHE_DIRECTORY, TEST_DB_SNAPSHOT_DIRECTORY
+
+
+def get_migrations_directory(app_label: str) -> Optional[str]:
+    """
+    Get the migrations directory of an app (MIGRATION_MODULES is honored).
+
+    Args:
+        app_label: Label of the app
+
+    Returns:
+        Optional[str]: Path to the directory, or None if the app has no migrations
+    """
+    module_name, _ = MigrationLoader.migrations_module(app_label)
+    if module_name is None:
+        return None
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ImportError:
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+def get_migrations_hash() -> str:
+    """
+    Hash the migration files of all installed apps.
+
+    Returns:
+        str: Hex digest changing whenever a migration is added, removed or edited
+    """
+    digest = hashlib.sha256(django.get_version().encode())
+    for app_config in sorted(django_apps.get_app_configs(), key=lambda app_config: app_config.label):
+        directory = get_migrations_directory(app_config.label)
+        if directory is None or not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".py"):
+                continue
+            digest.update(f"{app_config.label}/{name}\0".encode())
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def get_snapshot_directory() -> str:
+    """Path of the test database snapshot directory of the current project."""
+    return os.path.join(str(settings.BASE_DIR), CACHE_DIRECTORY, TEST_DB_SNAPSHOT_DIRECTORY)
+
+
+class DatabaseSnapshot:
+    """
+    Migrated test database template of a SQLite database alias.
+
+    The test database of the alias is redirected to a file next to the
+    template, restored from the template before the run.
+
+    Args:
+        alias: Database alias
+        migrations_hash: Hash of the migration files (see get_migrations_hash)
+        directory: Directory of the templates (defaults to .smartcli/test_db/)
+    """
+
+    def __init__(self, alias: str, migrations_hash: str, directory: Optional[str] = None):
+        self.alias = alias
+        self.directory = directory or get_snapshot_directory()
+        self.template_path = os.path.join(self.directory, f"{alias}-{migrations_hash}.sqlite3")
+        self.database_path = os.path.join(self.directory, f"{alias}.sqlite3")
+        self.restored = False
+        self._test_settings: Optional[dict] = None
+
+    def restore(self) -> bool:
+        """
+        Point the test database of the alias to a copy of the template.
+
+        Without template, the test database starts empty and is migrated by
+        the run, then saved with save().
+
+        Returns:
+            bool: True if the template was restored
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Clones of --parallel runs are kept with --keepdb, they must be rebuilt
+        root, ext = os.path.splitext(self.database_path)
+        for path in [self.database_path] + glob.glob(f"{glob.escape(root)}_*{ext}"):
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.restored = os.path.exists(self.template_path)
+        if self.restored:
+            shutil.copyfile(self.template_path, self.database_path)
+
+        settings_dict = connections[self.alias].settings_dict
+        self._test_settings = dict(settings_dict.get("TEST") or {})
+        settings_dict["TEST"] = {**self._test_settings, "NAME": self.database_path}
+        return self.restored
+
+    def release(self) -> None:
+        """Restore the test settings of the alias."""
+        if self._test_settings is not None:
+            connections[self.alias].settings_dict["TEST"] = self._test_settings
+            self._test_settings = None
+
+    def save(self) -> bool:
+        """
+        Save the migrated test database of the alias as template.
+
+        Templates of older migration states are removed.
+
+        Returns:
+            bool: True if the template was saved (the test database was set up)
+        """
+        connection = connections[self.alias]
+        if connection.settings_dict["NAME"] != self.database_path:
+            return False
+
+        connection.ensure_connection()
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            target = sqlite3.connect(temp_path)
+            try:
+                connection.connection.backup(target)
+            finally:
+                target.close()
+            os.replace(temp_path, self.template_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        for path in glob.glob(os.path.join(glob.escape(self.directory), f"{self.alias}-*.sqlite3")):
+            if path != self.template_path:
+                os.remove(path)
+        return True
+
+
+def get_database_snapshots(directory: Optional[str] = None) -> List[DatabaseSnapshot]:
+    """
+    Get a snapshot for each SQLite database alias.
+
+    Args:
+        directory: Directory of the templates (defaults to .smartcli/test_db/)
+
+    Returns:
+        List[DatabaseSnapshot]: Snapshots of the SQLite aliases
+    """
+    aliases = [alias for alias in connections if connections[alias].vendor == "sqlite"]
+    if not aliases:
+        return []
+    migrations_hash = get_migrations_hash()
+    return [DatabaseSnapshot(alias, migrations_hash, directory) for alias in aliases]
+
+
+class SnapshotRunnerMixin:
+    """Test runner mixin saving the migrated test databases of the db_snapshots option."""
+
+    def __init__(self, *args, db_snapshots: Optional[List[DatabaseSnapshot]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db_snapshots = db_snapshots or []
+
+    def setup_databases(self, **kwargs):
+        old_config = super().setup_databases(**kwargs)
+        for snapshot in self.db_snapshots:
+            if not snapshot.restored and snapshot.save():
+                self.log(f"Saved test database snapshot {snapshot.template_path}")
+        return old_config
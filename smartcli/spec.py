@@ -0,0 +1,154 @@
+"""
+Spec file loading for Django SmartCLI.
+
+This module reads the declarative spec files used by the apply_spec command
+(YAML, JSON or TOML) and normalizes them into a plain dictionary.
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+from smartcli.config import SPEC_COMPONENT_COMMANDS, SPEC_MODEL_COMPONENTS
+
+
+def load_spec(spec_path: str) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """
+    Load and normalize a spec file.
+
+    Args:
+        spec_path: Path to a .yaml/.yml, .json or .toml spec file
+
+    Returns:
+        dict: {app_name: {section: [{"name": ..., "model": ...}, ...]}}
+
+    Raises:
+        ValueError: If the file cannot be read or the spec is invalid
+    """
+    if not os.path.exists(spec_path):
+        raise ValueError(f"Spec file '{spec_path}' does not exist")
+
+    with open(spec_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    extension = os.path.splitext(spec_path)[1].lower()
+    data = parse_spec_content(content, extension)
+    return normalize_spec(data)
+
+
+def parse_spec_content(content: str, extension: str) -> Any:
+    """
+    Parse raw spec content according to the file extension.
+
+    Args:
+        content: Raw file content
+        extension: File extension (".yaml", ".yml", ".json" or ".toml")
+
+    Returns:
+        The parsed data
+
+    Raises:
+        ValueError: If the format is unsupported or the content is invalid
+    """
+    if extension == ".json":
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON spec: {str(e)}")
+
+    if extension in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(
+                "PyYAML is required to read YAML spec files. "
+                "Install it with: pip install django-smartcli[yaml]"
+            )
+        try:
+            return yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML spec: {str(e)}")
+
+    if extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    "tomli is required to read TOML spec files on Python < 3.11. "
+                    "Install it with: pip install tomli"
+                )
+        try:
+            return tomllib.loads(content)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid TOML spec: {str(e)}")
+
+    raise ValueError(
+        f"Unsupported spec format '{extension}'. Use a .yaml, .yml, .json or .toml file"
+    )
+
+
+def normalize_spec(data: Any) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """
+    Validate parsed spec data and normalize every section to a list of dicts.
+
+    Args:
+        data: Parsed spec data, expected as {"apps": {app_name: {section: [...]}}}
+
+    Returns:
+        dict: {app_name: {section: [{"name": ..., "model": ...}, ...]}}
+
+    Raises:
+        ValueError: If the spec structure is invalid
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("apps"), dict):
+        raise ValueError("Spec must define an 'apps' mapping of app names to components")
+
+    spec = {}
+    for app_name, app_spec in data["apps"].items():
+        if not isinstance(app_name, str) or not app_name.isidentifier():
+            raise ValueError(f"'{app_name}' is not a valid Python identifier")
+
+        app_spec = app_spec or {}
+        if not isinstance(app_spec, dict):
+            raise ValueError(f"Components of app '{app_name}' must be a mapping")
+
+        unknown_sections = set(app_spec) - set(SPEC_COMPONENT_COMMANDS)
+        if unknown_sections:
+            raise ValueError(
+                f"Unknown section(s) in app '{app_name}': {', '.join(sorted(unknown_sections))}. "
+                f"Allowed sections: {', '.join(SPEC_COMPONENT_COMMANDS)}"
+            )
+
+        spec[app_name] = {
+            section: [
+                _normalize_item(item, app_name, section)
+                for item in (app_spec.get(section) or [])
+            ]
+            for section in SPEC_COMPONENT_COMMANDS
+        }
+
+    return spec
+
+
+def _normalize_item(item: Any, app_name: str, section: str) -> Dict[str, str]:
+    """Normalize a spec entry given as a name or as a mapping."""
+    if isinstance(item, str):
+        return {"name": item}
+
+    if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+        raise ValueError(
+            f"Entries of '{section}' in app '{app_name}' must be a name or a mapping with a 'name' key"
+        )
+
+    allowed_keys = {"name", "model"} if section in SPEC_MODEL_COMPONENTS else {"name"}
+    unknown_keys = set(item) - allowed_keys
+    if unknown_keys:
+        raise ValueError(
+            f"Unknown option(s) for '{item['name']}' in '{section}' of app '{app_name}': "
+            f"{', '.join(sorted(unknown_keys))}"
+        )
+
+    return dict(item)
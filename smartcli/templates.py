@@ -4,18 +4,102 @@ Templates for Django SmartCLI commands.
 This module contains all the template strings used by the generator commands.
 """
 
+import hashlib
+from typing import Dict, List, Optional
+
+from smartcli.config import TEMPLATE_CONFIGS
+from smartcli.naming import pascal_to_snake_case
+
+# Maximum length of index names (Index.max_name_length)
+MAX_INDEX_NAME_LENGTH = 30
+
 
 class ModelTemplates:
     """Templates for model generation."""
     
     @staticmethod
-    def model_template(model_name: str) -> str:
-        """Generate model template."""
+    def model_template(model_name: str, app_name: Optional[str] = None, cached: bool = False) -> str:
+        """Generate model template (with the Meta.indexes of TEMPLATE_CONFIGS["model"], get_by_id cached if cached)."""
+        meta = ModelTemplates._model_meta(model_name, app_name)
+        name = model_name.lower()
+        if not cached:
+            imports = "from django.db import models\n"
+            get_by_id = f'''    def get_by_id(self, {name}_id: str):
+        """
+        Get a {name} by its ID.
+
+        Args:
+            {name}_id: The ID of the {name} to get
+        """
+        try:
+            {name} = self.get(id={name}_id)
+        except self.model.DoesNotExist:
+            raise ObjectDoesNotExist("{model_name} not found")
+        return {name}
+'''
+            methods = ""
+        else:
+            imports = "from django.db import models, transaction\n"
+            get_by_id = f'''    # Bump cache_version when the fields change, so that cached objects of the
+    # previous version aren't unpickled
+    cache_version = 1
+    cache_timeout = {TEMPLATE_CONFIGS["model"]["cache_timeout"]}
+
+    def get_cache_key(self, {name}_id) -> str:
+        """Cache key of a {name}."""
+        return f"{{self.model._meta.label_lower}}:{{{name}_id}}"
+
+    def get_by_id(self, {name}_id: str):
+        """
+        Get a {name} by its ID, from the cache when possible.
+
+        Args:
+            {name}_id: The ID of the {name} to get
+        """
+        key = self.get_cache_key({name}_id)
+        {name} = cache.get(key, version=self.cache_version)
+        if {name} is None:
+            try:
+                {name} = self.get(id={name}_id)
+            except self.model.DoesNotExist:
+                raise ObjectDoesNotExist("{model_name} not found")
+            cache.set(key, {name}, self.cache_timeout, version=self.cache_version)
+        return {name}
+
+    def invalidate(self, *{name}_ids) -> None:
+        """
+        Remove {name}s from the cache.
+
+        save() and delete() invalidate their {name}, call it after queryset
+        update() or bulk operations, which bypass them.
+        """
+        keys = [self.get_cache_key({name}_id) for {name}_id in {name}_ids]
+
+        def delete_keys():
+            cache.delete_many(keys, version=self.cache_version)
+
+        # Again after commit, in case a concurrent read cached the previous state
+        delete_keys()
+        transaction.on_commit(delete_keys)
+'''
+            methods = f'''
+    def save(self, *args, **kwargs):
+        """Save the {name} and remove it from the get_by_id cache (soft deletes included)."""
+        super().save(*args, **kwargs)
+        {model_name}.objects.invalidate(self.pk)
+
+    def delete(self, *args, **kwargs):
+        """Delete the {name} and remove it from the get_by_id cache."""
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        {model_name}.objects.invalidate(pk)
+        return result
+'''
+        cache_import = "from django.core.cache import cache\n" if cached else ""
         return f'''import uuid
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
-from django.utils import timezone
+{cache_import}from django.core.exceptions import ObjectDoesNotExist
+{imports}from django.utils import timezone
 
 
 class {model_name}Manager(models.Manager):
@@ -26,23 +110,11 @@ class {model_name}Manager(models.Manager):
 
     def get_active(self):
         """
-        Get all {model_name.lower()}s that are not deleted.
+        Get all {name}s that are not deleted.
         """
         return self.filter(deleted_at__isnull=True)
 
-    def get_by_id(self, {model_name.lower()}_id: str):
-        """
-        Get a {model_name.lower()} by its ID.
-
-        Args:
-            {model_name.lower()}_id: The ID of the {model_name.lower()} to get
-        """
-        try:
-            {model_name.lower()} = self.get(id={model_name.lower()}_id)
-        except self.model.DoesNotExist:
-            raise ObjectDoesNotExist("{model_name} not found")
-        return {model_name.lower()}
-
+{get_by_id}
 
 class {model_name}(models.Model):
     """
@@ -55,14 +127,138 @@ class {model_name}(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     
     objects = {model_name}Manager()
+{meta}
+    def __str__(self):
+        """Represent the {name} by its ID."""
+        return str(self.id)
+{methods}'''
+
+    @staticmethod
+    def _model_cache_test_template(model_name: str) -> str:
+        """Generate the get_by_id cache tests of a cached model, against the locmem cache."""
+        name = model_name.lower()
+        return f'''
+
+@override_settings(
+    CACHES={{"default": {{"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "{name}-tests"}}}}
+)
+class {model_name}CacheTest(TestCase):
+    """Tests for the cached {model_name}Manager.get_by_id."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared across all test methods."""
+        super().setUpTestData()
+        cls.{name} = {model_name}.objects.create()
+
+    def setUp(self):
+        """Start each test with an empty cache."""
+        cache.clear()
+
+    def test_get_by_id_miss_then_hit(self):
+        """Test that the first lookup queries the database and the next ones the cache."""
+        with self.assertNumQueries(1):
+            {model_name}.objects.get_by_id(self.{name}.id)
+        with self.assertNumQueries(0):
+            cached_{name} = {model_name}.objects.get_by_id(self.{name}.id)
+        self.assertEqual(cached_{name}, self.{name})
+
+    def test_save_invalidates_cache(self):
+        """Test that saving a {name} removes it from the cache."""
+        {model_name}.objects.get_by_id(self.{name}.id)
+        self.{name}.save()
+        with self.assertNumQueries(1):
+            {model_name}.objects.get_by_id(self.{name}.id)
+
+    def test_soft_delete_invalidates_cache(self):
+        """Test that a soft-deleted {name} isn't served from the cache as active."""
+        {model_name}.objects.get_by_id(self.{name}.id)
+        self.{name}.deleted_at = timezone.now()
+        self.{name}.save()
+        self.assertIsNotNone({model_name}.objects.get_by_id(self.{name}.id).deleted_at)
+
+    def test_delete_invalidates_cache(self):
+        """Test that a deleted {name} isn't served from the cache."""
+        {name}_id = self.{name}.id
+        {model_name}.objects.get_by_id({name}_id)
+        self.{name}.delete()
+        with self.assertRaises(ObjectDoesNotExist):
+            {model_name}.objects.get_by_id({name}_id)
+
+    def test_cache_version(self):
+        """Test that bumping cache_version ignores the cached {name}s."""
+        {model_name}.objects.get_by_id(self.{name}.id)
+        {model_name}.objects.cache_version += 1
+        self.addCleanup(setattr, {model_name}.objects, "cache_version", {model_name}.objects.cache_version - 1)
+        with self.assertNumQueries(1):
+            {model_name}.objects.get_by_id(self.{name}.id)
 '''
 
     @staticmethod
-    def factory_template(factory_name: str, model_name: str, app_name: str) -> str:
-        """Generate factory template."""
-        return f'''import factory
-from django.utils import timezone
+    def _model_meta(model_name: str, app_name: Optional[str] = None) -> str:
+        """Generate the Meta class of a model template, or nothing without indexes."""
+        config = TEMPLATE_CONFIGS["model"]
+        prefix = pascal_to_snake_case(model_name)
+        if app_name:
+            prefix = f"{app_name.rsplit('.', 1)[-1]}_{prefix}"
+
+        indexes = ""
+        if config["active_index_fields"]:
+            fields = ", ".join(f'"{field}"' for field in config["active_index_fields"])
+            indexes += f'''            models.Index(
+                fields=[{fields}],
+                condition=models.Q(deleted_at__isnull=True),
+                name="{ModelTemplates._index_name(prefix, "active_idx")}",
+            ),
+'''
+        if config["created_at_index"]:
+            indexes += (
+                f'            models.Index(fields=["created_at"], '
+                f'name="{ModelTemplates._index_name(prefix, "created_idx")}"),\n'
+            )
+        if not indexes:
+            return ""
+        return f'''
+    class Meta:
+        indexes = [
+{indexes}        ]
+'''
 
+    @staticmethod
+    def _index_name(prefix: str, suffix: str) -> str:
+        """Index name fitting MAX_INDEX_NAME_LENGTH, shortened prefixes keep a hash to stay unique."""
+        name = f"{prefix}_{suffix}"
+        if len(name) <= MAX_INDEX_NAME_LENGTH:
+            return name
+        digest = hashlib.md5(prefix.encode(), usedforsecurity=False).hexdigest()[:6]
+        return f"{prefix[:MAX_INDEX_NAME_LENGTH - len(suffix) - 8]}_{digest}_{suffix}"
+
+    @staticmethod
+    def factory_template(
+        factory_name: str,
+        model_name: str,
+        app_name: str,
+        declarations: Optional[List[str]] = None,
+        many_to_many: Optional[List[str]] = None,
+    ) -> str:
+        """Generate factory template of {factory_name}Factory (declarations of the base fields by default)."""
+        if declarations is None:
+            declarations = ["created_at = factory.LazyFunction(timezone.now)", "deleted_at = None"]
+        imports = "import factory\n"
+        if any("timezone." in declaration for declaration in declarations):
+            imports += "from django.utils import timezone\n"
+        body = "".join(f"    {declaration}\n" for declaration in declarations)
+
+        # Many-to-many relations can only be set once the object is saved
+        for name in many_to_many or []:
+            body += f'''
+    @factory.post_generation
+    def {name}(self, create, extracted, **kwargs):
+        """Set {name} when given, e.g. {factory_name}Factory({name}=[...])."""
+        if create and extracted:
+            self.{name}.set(extracted)
+'''
+        return f'''{imports}
 from {app_name}.models import {model_name}
 
 
@@ -73,19 +269,25 @@ class {factory_name}Factory(factory.django.DjangoModelFactory):
     class Meta:
         model = {model_name}
 
-    created_at = factory.LazyFunction(timezone.now)
-    deleted_at = None
-''' 
+{body}''' 
 
     @staticmethod
-    def model_test_template(model_name: str, app_name: str) -> str:
-        """Generate model test template."""
+    def model_test_template(model_name: str, app_name: str, cached: bool = False) -> str:
+        """Generate model test template (with get_by_id cache tests if cached)."""
+        imports = "from django.test import TestCase\n"
+        cache_tests = ""
+        if cached:
+            imports = (
+                "from django.core.cache import cache\n"
+                "from django.core.exceptions import ObjectDoesNotExist\n"
+                "from django.test import TestCase, override_settings\n"
+            )
+            cache_tests = ModelTemplates._model_cache_test_template(model_name)
         return f'''from django.db import models
 from django.db.utils import IntegrityError
 from django.utils import timezone
-
+{imports}
 from {app_name}.models import {model_name}
-from rest_framework.test import TestCase
 
 
 class {model_name}ModelTest(TestCase):
@@ -163,15 +365,26 @@ class {model_name}ManagerTest(TestCase):
         """Test getting a {model_name.lower()} by non-existent ID."""
         with self.assertRaises(Exception):
             {model_name}.objects.get_by_id("non-existent-id")
-'''
+{cache_tests}'''
 
 
 class SerializerTemplates:
     """Templates for serializer generation."""
     
     @staticmethod
-    def serializer_template(serializer_name: str, model_name: str, app_name: str) -> str:
-        """Generate serializer template."""
+    def serializer_template(
+        serializer_name: str,
+        model_name: str,
+        app_name: str,
+        fields: Optional[List[str]] = None,
+        read_only_fields: Optional[List[str]] = None,
+    ) -> str:
+        """Generate serializer template (base fields by default)."""
+        fields = fields if fields is not None else TEMPLATE_CONFIGS["serializer"]["base_fields"]
+        if read_only_fields is None:
+            read_only_fields = TEMPLATE_CONFIGS["serializer"]["read_only_fields"]
+        field_lines = "".join(f'            "{field}",\n' for field in fields)
+        read_only_lines = "".join(f'            "{field}",\n' for field in read_only_fields)
         return f'''from rest_framework import serializers
 
 from {app_name}.models import {model_name}
@@ -185,23 +398,29 @@ class {serializer_name}Serializer(serializers.ModelSerializer):
     class Meta:
         model = {model_name}
         fields = [
-            "id",
-            "created_at",
-            "deleted_at",
-        ]
+{field_lines}        ]
         read_only_fields = [
-            "id",
-            "created_at",
-        ]
+{read_only_lines}        ]
 '''
 
     @staticmethod
-    def serializer_test_template(serializer_name: str, model_name: str, app_name: str) -> str:
-        """Generate serializer test template."""
+    def serializer_test_template(
+        serializer_name: str,
+        model_name: str,
+        app_name: str,
+        fields: Optional[List[str]] = None,
+        read_only_fields: Optional[List[str]] = None,
+    ) -> str:
+        """Generate serializer test template (base fields by default)."""
+        fields = fields if fields is not None else TEMPLATE_CONFIGS["serializer"]["base_fields"]
+        if read_only_fields is None:
+            read_only_fields = TEMPLATE_CONFIGS["serializer"]["read_only_fields"]
+        expected_fields = ", ".join(f'"{field}"' for field in fields)
+        expected_read_only = ", ".join(f'"{field}"' for field in read_only_fields)
         return f'''from {app_name}.factories import {model_name}Factory
 from {app_name}.models import {model_name}
 from {app_name}.serializers import {serializer_name}Serializer
-from rest_framework.test import TestCase
+from django.test import TestCase
 
 
 class {serializer_name}SerializerTest(TestCase):
@@ -212,19 +431,20 @@ class {serializer_name}SerializerTest(TestCase):
         """Set up test data shared across all test methods."""
         super().setUpTestData()
         cls.{model_name.lower()} = {model_name}Factory()
+        cls.serializer = {serializer_name}Serializer(cls.{model_name.lower()})
 
     def test_serializer_contains_expected_fields(self):
         """Test that the serializer contains the expected fields."""
         data = self.serializer.data
         
-        expected_fields = ["id", "created_at", "deleted_at"]
+        expected_fields = [{expected_fields}]
         for field in expected_fields:
             self.assertIn(field, data)
 
     def test_serializer_read_only_fields(self):
         """Test that read-only fields are properly set."""
         read_only_fields = self.serializer.Meta.read_only_fields
-        expected_read_only = ["id", "created_at"]
+        expected_read_only = [{expected_read_only}]
         
         for field in expected_read_only:
             self.assertIn(field, read_only_fields)
@@ -239,28 +459,110 @@ class ServiceTemplates:
     """Templates for service generation."""
     
     @staticmethod
-    def service_template(service_name: str) -> str:
-        """Generate service template."""
+    def service_template(
+        service_name: str, app_name: str = None, bulk: bool = False, batch_size: int = 500, with_model: bool = False
+    ) -> str:
+        """
+        Generate service template.
+
+        With the model of the same name (with_model, implied by bulk), create
+        creates it from the given fields; bulk also adds the bulk methods.
+        """
         import re
         method_name = re.sub(r"(?<!^)(?=[A-Z])", "_", service_name).lower()
-        
-        return f'''from django.db import transaction
 
-class {service_name}Service:
-    """
-    Service for {service_name} operations.
-    """
-    
+        imports = "from django.db import transaction\n"
+        if with_model:
+            imports = f"from django.db import transaction\n\nfrom {app_name}.models import {service_name}\n\n"
+        bulk_methods = ""
+        if bulk:
+            imports = f'''from typing import Iterable, List, Sequence
+
+from django.db import transaction
+from django.utils import timezone
+
+from {app_name}.models import {service_name}
+
+'''
+            bulk_methods = f'''
+    @classmethod
+    @transaction.atomic
+    def bulk_create_{method_name}s(cls, {method_name}s: Iterable[{service_name}]) -> List[{service_name}]:
+        """
+        Create {service_name.lower()}s with one INSERT query per batch.
+
+        Args:
+            {method_name}s: The unsaved {service_name.lower()}s
+
+        Returns:
+            The created {service_name.lower()}s
+        """
+        return {service_name}.objects.bulk_create({method_name}s, batch_size=cls.BATCH_SIZE)
+
+    @classmethod
+    @transaction.atomic
+    def bulk_update_{method_name}s(cls, {method_name}s: Sequence[{service_name}], fields: Sequence[str]) -> int:
+        """
+        Update fields of {service_name.lower()}s with one UPDATE query per batch.
+
+        Args:
+            {method_name}s: The modified {service_name.lower()}s
+            fields: Names of the fields to update
+
+        Returns:
+            The number of updated {service_name.lower()}s
+        """
+        return {service_name}.objects.bulk_update({method_name}s, fields, batch_size=cls.BATCH_SIZE)
+
     @classmethod
     @transaction.atomic
-    def create_{method_name}(cls):
+    def bulk_delete_{method_name}s(cls, {method_name}_ids: Iterable[str]) -> int:
+        """
+        Soft delete {service_name.lower()}s with a single UPDATE query.
+
+        Args:
+            {method_name}_ids: The IDs of the {service_name.lower()}s to delete
+
+        Returns:
+            The number of deleted {service_name.lower()}s
+        """
+        return {service_name}.objects.get_active().filter(id__in=list({method_name}_ids)).update(
+            deleted_at=timezone.now()
+        )
+'''
+
+        batch_size_attribute = f"\n    BATCH_SIZE = {batch_size}\n" if bulk else ""
+
+        create_method = f'''    def create_{method_name}(cls):
         """
         Create a new {service_name.lower()}.
         
         Returns:
             The created {service_name.lower()}
         """
-        pass
+        pass'''
+        if with_model or bulk:
+            create_method = f'''    def create_{method_name}(cls, **fields) -> {service_name}:
+        """
+        Create a new {service_name.lower()}.
+
+        Args:
+            **fields: Field values of the {service_name.lower()}
+
+        Returns:
+            The created {service_name.lower()}
+        """
+        return {service_name}.objects.create(**fields)'''
+
+        return f'''{imports}
+class {service_name}Service:
+    """
+    Service for {service_name} operations.
+    """
+    {batch_size_attribute}
+    @classmethod
+    @transaction.atomic
+{create_method}
         
     @classmethod
     @transaction.atomic
@@ -277,17 +579,161 @@ class {service_name}Service:
         Delete a {service_name.lower()}.
         """
         pass
-'''
+{bulk_methods}'''
 
     @staticmethod
-    def service_test_template(service_name: str, app_name: str) -> str:
-        """Generate service test template."""
+    def service_test_template(
+        service_name: str,
+        app_name: str,
+        bulk: bool = False,
+        query_budget: Optional[Dict[str, int]] = None,
+        with_model: bool = False,
+    ) -> str:
+        """
+        Generate service test template (with query count tests of the bulk methods if bulk).
+
+        With the model of the same name (with_model, implied by bulk), the
+        create query budget test runs against the generated create method,
+        otherwise it is skipped until the method is implemented.
+        """
         import re
         method_name = re.sub(r"(?<!^)(?=[A-Z])", "_", service_name).lower()
-        
-        return f'''from {app_name}.services import {service_name}Service
-from rest_framework.test import TestCase
+        query_budget = query_budget or TEMPLATE_CONFIGS["service"]["query_budget"]
+        with_model = with_model or bulk
+
+        imports = f'''from unittest import skip
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from {app_name}.services import {service_name}Service
+'''
+        if with_model:
+            imports = f'''from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from {app_name}.factories import {service_name}Factory
+from {app_name}.models import {service_name}
+from {app_name}.services import {service_name}Service
+'''
+        bulk_tests = ""
+        if bulk:
+            imports = f'''from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from {app_name}.factories import {service_name}Factory
+from {app_name}.models import {service_name}
+from {app_name}.services import {service_name}Service
+'''
+            bulk_tests = f'''
+
+class {service_name}ServiceBulkTest(TestCase):
+    """
+    Query count tests for the bulk methods of {service_name}Service.
+
+    Expected counts include the SAVEPOINT and RELEASE SAVEPOINT queries of
+    transaction.atomic inside the test transaction.
+    """
+
+    def test_bulk_create_{method_name}s_queries(self):
+        """Test that bulk creation runs one INSERT query per batch."""
+        # Valid instances (required fields and relations set), removed from the table
+        {method_name}s = {service_name}Factory.create_batch(10)
+        {service_name}.objects.filter(pk__in=[{method_name}.pk for {method_name} in {method_name}s]).delete()
+
+        with patch.object({service_name}Service, "BATCH_SIZE", 4), self.assertNumQueries(2 + 3):
+            created = {service_name}Service.bulk_create_{method_name}s({method_name}s)
+
+        self.assertEqual(len(created), 10)
+        self.assertEqual({service_name}.objects.count(), 10)
+
+    def test_bulk_update_{method_name}s_queries(self):
+        """Test that bulk update runs a single UPDATE query per batch."""
+        {method_name}s = {service_name}Factory.create_batch(10)
+
+        with self.assertNumQueries(2 + 1):
+            updated = {service_name}Service.bulk_update_{method_name}s({method_name}s, ["created_at"])
+
+        self.assertEqual(updated, 10)
+
+    def test_bulk_delete_{method_name}s_queries(self):
+        """Test that batched soft deletion runs a single UPDATE query."""
+        {method_name}s = {service_name}Factory.create_batch(10)
+
+        with self.assertNumQueries(2 + 1):
+            deleted = {service_name}Service.bulk_delete_{method_name}s([{method_name}.id for {method_name} in {method_name}s])
 
+        self.assertEqual(deleted, 10)
+        self.assertFalse({service_name}.objects.get_active().exists())
+'''
+
+        if with_model:
+            budget_tests = f'''class {service_name}ServiceQueryBudgetTest(TestCase):
+    """
+    Query budget of the {service_name}Service methods.
+
+    Budgets are upper bounds and include the SAVEPOINT and RELEASE SAVEPOINT
+    queries of transaction.atomic inside the test transaction: the create
+    budget allows a single INSERT. Keep it when create_{method_name} grows.
+    """
+
+    CREATE_QUERIES = {query_budget["create"]}
+
+    def test_create_{method_name}_queries(self):
+        """Test that creating a {service_name.lower()} stays within the query budget."""
+        fields = self._get_create_fields()
+
+        with CaptureQueriesContext(connection) as queries:
+            {service_name}Service.create_{method_name}(**fields)
+
+        self.assertLessEqual(
+            len(queries), self.CREATE_QUERIES, "\\n".join(query["sql"] for query in queries.captured_queries)
+        )
+
+    @staticmethod
+    def _get_create_fields() -> dict:
+        """Field values of a valid {service_name.lower()}, made by its factory and removed from the table."""
+        {method_name} = {service_name}Factory.create()
+        fields = {{
+            field.attname: getattr({method_name}, field.attname)
+            for field in {service_name}._meta.concrete_fields
+            if not field.primary_key
+        }}
+        {service_name}.objects.filter(pk={method_name}.pk).delete()
+        return fields
+'''
+        else:
+            budget_tests = f'''class {service_name}ServiceQueryBudgetTest(TestCase):
+    """
+    Query budget of the {service_name}Service methods.
+
+    Budgets are upper bounds and include the SAVEPOINT and RELEASE SAVEPOINT
+    queries of transaction.atomic inside the test transaction: the create
+    budget allows a single INSERT.
+
+    create_{method_name} is a stub, so this test is skipped and no query guard
+    runs in CI until you implement the method and remove @skip.
+    """
+
+    CREATE_QUERIES = {query_budget["create"]}
+
+    @skip("Implement create_{method_name}, then enable its query budget test")
+    def test_create_{method_name}_queries(self):
+        """Test that creating a {service_name.lower()} stays within the query budget."""
+        with CaptureQueriesContext(connection) as queries:
+            {service_name}Service.create_{method_name}()
+
+        self.assertLessEqual(
+            len(queries), self.CREATE_QUERIES, "\\n".join(query["sql"] for query in queries.captured_queries)
+        )
+'''
+
+        return f'''{imports}
 
 class {service_name}ServiceTest(TestCase):
     """Tests for the {service_name}Service."""
@@ -303,7 +749,9 @@ class {service_name}ServiceTest(TestCase):
     def test_delete_{method_name}_success(self):
         """Test successful deletion of {service_name.lower()}."""
         pass
-'''
+
+
+{budget_tests}{bulk_tests}'''
 
 class ViewTemplates:
     """Templates for view generation."""
@@ -351,17 +799,138 @@ class {view_name}ViewSet(ViewSet):
 '''
 
     @staticmethod
-    def view_test_template(view_name: str, model_name: str, app_name: str) -> str:
-        """Generate view test template."""
+    def implemented_view_template(
+        view_name: str,
+        model_name: str,
+        app_name: str,
+        only_fields: List[str],
+        select_related: List[str],
+        prefetch_related: List[str],
+        page_size: int,
+        ordering: str,
+    ) -> str:
+        """Generate view template with working actions and an optimized queryset."""
+        def arguments(names: List[str]) -> str:
+            return ", ".join(f'"{name}"' for name in names)
+
+        queryset = [f"{model_name}.objects.get_active()"]
+        if select_related:
+            queryset.append(f".select_related({arguments(select_related)})")
+        if prefetch_related:
+            queryset.append(f".prefetch_related({arguments(prefetch_related)})")
+        queryset.append(f".only({arguments(only_fields)})")
+        queryset_lines = "\n            ".join(queryset)
+
+        return f'''from http import HTTPStatus
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.generics import get_object_or_404
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from {app_name}.models import {model_name}
+from {app_name}.serializers import {model_name}Serializer
+
+
+class {view_name}Pagination(CursorPagination):
+    """Cursor pagination of {model_name.lower()}s (no COUNT query, stable pages)."""
+
+    page_size = {page_size}
+    ordering = "{ordering}"
+
+
+class {view_name}ViewSet(ViewSet):
+    """ViewSet for managing {model_name.lower()} operations."""
+
+    permission_classes = [IsAdminUser]
+    serializer_class = {model_name}Serializer
+    pagination_class = {view_name}Pagination
+
+    def get_queryset(self) -> QuerySet:
+        """Active {model_name.lower()}s, loading only the serialized fields and their relations."""
+        return (
+            {queryset_lines}
+        )
+
+    def get_object(self, pk: str) -> {model_name}:
+        """Get an active {model_name.lower()} by its ID or raise a 404 error."""
+        return get_object_or_404(self.get_queryset(), pk=pk)
+
+    def list(self, request: Request) -> Response:
+        """List active {model_name.lower()}s, one page at a time."""
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(self.get_queryset(), request, view=self)
+        serializer = self.serializer_class(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    def retrieve(self, request: Request, pk: str) -> Response:
+        """Get a {model_name.lower()} by its ID."""
+        serializer = self.serializer_class(self.get_object(pk))
+        return Response(serializer.data)
+
+    def create(self, request: Request) -> Response:
+        """Create a new {model_name.lower()}."""
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        return Response(serializer.data, status=HTTPStatus.CREATED)
+
+    def partial_update(self, request: Request, pk: str = None) -> Response:
+        """Update a {model_name.lower()} with the provided data."""
+        serializer = self.serializer_class(self.get_object(pk), data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        return Response(serializer.data)
+
+    def destroy(self, request: Request, pk: str) -> Response:
+        """Soft delete a {model_name.lower()}."""
+        {model_name.lower()} = get_object_or_404({model_name}.objects.get_active().only("id"), pk=pk)
+        {model_name.lower()}.deleted_at = timezone.now()
+        {model_name.lower()}.save(update_fields=["deleted_at"])
+        return Response(status=HTTPStatus.NO_CONTENT)
+'''
+
+    @staticmethod
+    def view_test_template(
+        view_name: str,
+        model_name: str,
+        app_name: str,
+        query_budget: Optional[Dict[str, int]] = None,
+        implemented: bool = False,
+    ) -> str:
+        """Generate view test template (query budget tests are skipped unless the actions are implemented)."""
+        import re
+        view_filename = re.sub(r"(?<!^)(?=[A-Z])", "_", view_name).lower()
+        query_budget = query_budget or TEMPLATE_CONFIGS["view"]["query_budget"]
+        name = model_name.lower()
+        skip_budget = (
+            "" if implemented
+            else f'@skip("Implement the {view_name}ViewSet actions, then enable their query budget tests")\n'
+        )
+
         return f'''from http import HTTPStatus
+from unittest import skip
 from unittest.mock import patch
 
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 from {app_name}.factories import {model_name}Factory
 from {app_name}.models import {model_name}
+from {app_name}.serializers import {model_name}Serializer
+from {app_name}.views.{view_filename}_view import {view_name}ViewSet
 
 
 class {view_name}ViewSetTest(TestCase):
@@ -395,4 +964,73 @@ class {view_name}ViewSetTest(TestCase):
     def test_destroy_{model_name.lower()}_success(self):
         """Test successful deletion of a {model_name.lower()}."""
         pass
-'''
\ No newline at end of file
+
+
+{skip_budget}class {view_name}ViewSetQueryBudgetTest(TestCase):
+    """
+    Query budget of the {view_name}ViewSet endpoints.
+
+    Several {name}s exist, so a query per {name} (N+1) exceeds the budget.
+    Budgets are upper bounds and include the SAVEPOINT and RELEASE SAVEPOINT
+    queries of transaction.atomic inside the test transaction.
+    """
+
+    LIST_QUERIES = {query_budget["list"]}
+    RETRIEVE_QUERIES = {query_budget["retrieve"]}
+    CREATE_QUERIES = {query_budget["create"]}
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared across all test methods."""
+        super().setUpTestData()
+        cls.admin = get_user_model()(is_staff=True, is_superuser=True)
+        cls.{name}s = {model_name}Factory.create_batch(3)
+
+    def _call(self, method: str, action: str, data: dict = None, **kwargs):
+        """Call an action of the viewset as an admin user."""
+        request = getattr(APIRequestFactory(), method)("/", data, format="json")
+        force_authenticate(request, user=self.admin)
+        return {view_name}ViewSet.as_view({{method: action}})(request, **kwargs)
+
+    def _create_payload(self) -> dict:
+        """Writable fields of a new {name}, made by the factory (with its related objects) then removed."""
+        {name} = {model_name}Factory.create()
+        serializer = {model_name}Serializer({name})
+        payload = {{
+            field_name: value
+            for field_name, value in serializer.data.items()
+            if not serializer.fields[field_name].read_only
+        }}
+        {model_name}.objects.filter(pk={name}.pk).delete()
+        return payload
+
+    def assertWithinBudget(self, queries: CaptureQueriesContext, budget: int) -> None:
+        """Assert that the captured queries don't exceed a budget."""
+        self.assertLessEqual(len(queries), budget, "\\n".join(query["sql"] for query in queries.captured_queries))
+
+    def test_list_{name}s_queries(self):
+        """Test that listing {name}s stays within the query budget."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self._call("get", "list")
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertWithinBudget(queries, self.LIST_QUERIES)
+
+    def test_retrieve_{name}_queries(self):
+        """Test that retrieving a {name} stays within the query budget."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self._call("get", "retrieve", pk=str(self.{name}s[0].pk))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertWithinBudget(queries, self.RETRIEVE_QUERIES)
+
+    def test_create_{name}_queries(self):
+        """Test that creating a {name} stays within the query budget."""
+        payload = self._create_payload()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._call("post", "create", payload)
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED, response.data)
+        self.assertWithinBudget(queries, self.CREATE_QUERIES)
+'''
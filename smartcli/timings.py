@@ -0,0 +1,290 @@
+"""
+Test duration history for the filtered test command.
+
+With `test --record-timings`, the project test runner is extended with
+TimingRunnerMixin (see smartcli.runner) to time each test. Durations are appended to a SQLite history
+(.smartcli/test_timings.sqlite3), the slowest tests of each category are
+printed, and the average duration of each test file over the recent runs is
+exported to .smartcli/test_durations.json, which balances test shards.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+import time
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from smartcli.config import (
+    CACHE_DIRECTORY, TEST_DURATIONS_FILE, TEST_SUBDIRECTORIES, TEST_TIMINGS_DATABASE, TIMING_HISTORY_RUNS,
+)
+from smartcli.transaction import write_transaction
+from smartcli.utils import write_file_content
+
+# Category of tests outside tests/<category>/ directories
+OTHER_CATEGORY = "other"
+
+
+def get_test_label(test_id: str) -> str:
+    """
+    Get the test file label of a test id (e.g. "app.tests.test_x.XTest.test_y" -> "app.tests.test_x").
+
+    Args:
+        test_id: Id of the test (module.Class.method)
+
+    Returns:
+        str: The dotted label of the test module
+    """
+    return test_id.rsplit(".", 2)[0]
+
+
+def get_test_category(label: str) -> str:
+    """
+    Get the test category of a test label from its tests/<category>/ package.
+
+    Args:
+        label: Dotted test label (e.g. "apps.users.tests.models.test_user")
+
+    Returns:
+        str: The category (models, serializers, services, views or other)
+    """
+    parts = label.split(".")
+    for position, part in enumerate(parts[:-1]):
+        if part == "tests" and parts[position + 1] in TEST_SUBDIRECTORIES:
+            return parts[position + 1]
+    return OTHER_CATEGORY
+
+
+class TimingHistory:
+    """
+    SQLite history of test durations.
+
+    Usage:
+        history = TimingHistory()
+        history.record_run([("module.Class.test_x", 0.12)])
+        durations = history.get_label_durations()
+    """
+
+    def __init__(self, database: Optional[str] = None):
+        self.database = database or os.path.join(str(settings.BASE_DIR), CACHE_DIRECTORY, TEST_TIMINGS_DATABASE)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the history database, creating its tables if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.database)), exist_ok=True)
+        connection = sqlite3.connect(self.database)
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recorded_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS test_timings (
+                run_id INTEGER NOT NULL REFERENCES runs (id),
+                test_id TEXT NOT NULL,
+                label TEXT NOT NULL,
+                category TEXT NOT NULL,
+                duration REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS test_timings_label ON test_timings (label, run_id);
+            """
+        )
+        return connection
+
+    def record_run(self, test_durations: List[Tuple[str, float]]) -> int:
+        """
+        Append the durations of a test run.
+
+        Args:
+            test_durations: (test id, duration in seconds) of each test
+
+        Returns:
+            int: Id of the recorded run
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO runs (recorded_at) VALUES (?)",
+                    (datetime.datetime.now().isoformat(timespec="seconds"),),
+                )
+                run_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT INTO test_timings (run_id, test_id, label, category, duration) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (run_id, test_id, get_test_label(test_id), get_test_category(test_id), duration)
+                        for test_id, duration in test_durations
+                    ],
+                )
+        finally:
+            connection.close()
+        return run_id
+
+    def get_slowest_tests(self, run_id: int, limit: int) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Get the slowest tests of a run for each category.
+
+        Args:
+            run_id: Id of the run
+            limit: Number of tests per category
+
+        Returns:
+            Dict[str, List[Tuple[str, float]]]: (test id, duration) by category, slowest first
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT category, test_id, duration FROM test_timings WHERE run_id = ? "
+                "ORDER BY duration DESC, test_id",
+                (run_id,),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        slowest: Dict[str, List[Tuple[str, float]]] = {}
+        for category, test_id, duration in rows:
+            tests = slowest.setdefault(category, [])
+            if len(tests) < limit:
+                tests.append((test_id, duration))
+        return slowest
+
+    def get_label_durations(self, runs: int = TIMING_HISTORY_RUNS) -> Dict[str, float]:
+        """
+        Get the average duration of each test file over its most recent runs.
+
+        Args:
+            runs: Number of recent runs of each file to average
+
+        Returns:
+            Dict[str, float]: Average duration in seconds by test label
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT label, run_id, SUM(duration) FROM test_timings "
+                "GROUP BY label, run_id ORDER BY label, run_id DESC"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        file_durations: Dict[str, List[float]] = {}
+        for label, _, duration in rows:
+            durations = file_durations.setdefault(label, [])
+            if len(durations) < runs:
+                durations.append(duration)
+        return {label: sum(durations) / len(durations) for label, durations in file_durations.items()}
+
+    def export_label_durations(self, durations_file: Optional[str] = None) -> str:
+        """
+        Write the average file durations to the JSON file used for sharding.
+
+        Args:
+            durations_file: Path to the JSON file (defaults to .smartcli/test_durations.json)
+
+        Returns:
+            str: Path to the written file
+        """
+        durations_file = durations_file or os.path.join(
+            str(settings.BASE_DIR), CACHE_DIRECTORY, TEST_DURATIONS_FILE
+        )
+        durations = {label: round(duration, 4) for label, duration in self.get_label_durations().items()}
+        with write_transaction():
+            write_file_content(durations_file, json.dumps(durations, indent=1, sort_keys=True))
+        return durations_file
+
+
+class TimingRecorder:
+    """
+    Collect test durations during a run, then store and report them.
+
+    Args:
+        stdout: Output used for the report (the command stdout)
+        style: Style of the command, for colored output
+        slowest: Number of slowest tests printed per category
+        history: History receiving the durations
+    """
+
+    def __init__(self, stdout, style, slowest: int, history: Optional[TimingHistory] = None):
+        self.stdout = stdout
+        self.style = style
+        self.slowest = slowest
+        self.history = history or TimingHistory()
+        self.durations: List[Tuple[str, float]] = []
+        self._started: Dict[str, float] = {}
+
+    def start(self, test) -> None:
+        """Mark the start of a test."""
+        self._started[test.id()] = time.perf_counter()
+
+    def stop(self, test) -> None:
+        """Mark the end of a test and keep its duration."""
+        started = self._started.pop(test.id(), None)
+        # Modules failing to import are reported as unittest.loader._FailedTest
+        if started is not None and not test.id().startswith("unittest."):
+            self.durations.append((test.id(), time.perf_counter() - started))
+
+    def save(self) -> None:
+        """Store the durations, refresh the durations file and print the slowest tests."""
+        if not self.durations:
+            return
+
+        run_id = self.history.record_run(self.durations)
+        durations_file = self.history.export_label_durations()
+
+        for category, tests in sorted(self.history.get_slowest_tests(run_id, self.slowest).items()):
+            self.stdout.write(self.style.WARNING(f"⏱️  Slowest {category} tests:"))
+            for test_id, duration in tests:
+                self.stdout.write(f"    {duration:8.3f}s  {test_id}")
+        self.stdout.write(f"Recorded {len(self.durations)} test durations, updated {durations_file}")
+
+
+class TimingRunnerMixin:
+    """Test runner mixin timing each test with the timing_recorder option."""
+
+    def __init__(self, *args, timing_recorder: Optional[TimingRecorder] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timing_recorder = timing_recorder
+
+    def _is_parallel(self) -> bool:
+        """Whether tests run in several processes (their events are replayed, not timed)."""
+        return (getattr(self, "parallel", 1) or 1) > 1
+
+    def get_resultclass(self):
+        result_class = super().get_resultclass() or unittest.TextTestResult
+        if self.timing_recorder is None or self._is_parallel():
+            return result_class
+
+        recorder = self.timing_recorder
+
+        class TimingTestResult(result_class):
+            def startTest(self, test):
+                recorder.start(test)
+                super().startTest(test)
+
+            def stopTest(self, test):
+                super().stopTest(test)
+                recorder.stop(test)
+
+        return TimingTestResult
+
+    def run_tests(self, *args, **kwargs):
+        try:
+            return super().run_tests(*args, **kwargs)
+        finally:
+            if self.timing_recorder is not None:
+                self._save_timings()
+
+    def _save_timings(self) -> None:
+        """Save the recorded durations (the runner may lower parallel while building the suite)."""
+        recorder = self.timing_recorder
+        if self._is_parallel():
+            recorder.stdout.write(
+                recorder.style.WARNING(
+                    "Test durations are not recorded with --parallel, run without it to record them"
+                )
+            )
+            return
+        recorder.save()
+
@@ -0,0 +1,291 @@
+"""
+Transactional file writes for Django SmartCLI commands.
+
+While a WriteTransaction is active, write_file_content only stages content in
+memory (read_file_content and check_file_exists see the staged files). On
+commit, every staged file is written to a temporary file next to its target,
+synced to disk and then atomically renamed over the target; files whose bytes
+would not change are left untouched (and keep their mtime). If anything fails,
+files already replaced are restored and created directories are removed, so a
+command either applies all of its changes or none of them.
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from smartcli.config import FILESYSTEM_MAX_WORKERS
+from smartcli.profiling import FILE_IO, profile_phase
+
+
+_state = threading.local()
+
+
+def get_active_transaction() -> Optional["WriteTransaction"]:
+    """
+    Get the transaction active in the current thread.
+
+    Returns:
+        Optional[WriteTransaction]: The active transaction, or None
+    """
+    return getattr(_state, "transaction", None)
+
+
+@contextmanager
+def write_transaction() -> Iterator["WriteTransaction"]:
+    """
+    Stage file writes and commit them atomically when the block succeeds.
+
+    Nested blocks join the outermost transaction, which is the only one
+    committing or rolling back.
+
+    Yields:
+        WriteTransaction: The active transaction
+    """
+    active = get_active_transaction()
+    if active is not None:
+        yield active
+        return
+
+    transaction = WriteTransaction()
+    _state.transaction = transaction
+    try:
+        yield transaction
+    except BaseException:
+        _state.transaction = None
+        transaction.rollback()
+        raise
+    _state.transaction = None
+    transaction.commit()
+
+
+@contextmanager
+def use_transaction(transaction: "WriteTransaction") -> Iterator["WriteTransaction"]:
+    """
+    Make an existing transaction active in the current thread (e.g. a worker).
+
+    The transaction is neither committed nor rolled back when the block exits.
+
+    Args:
+        transaction: The transaction to activate
+
+    Yields:
+        WriteTransaction: The activated transaction
+    """
+    previous = get_active_transaction()
+    _state.transaction = transaction
+    try:
+        yield transaction
+    finally:
+        _state.transaction = previous
+
+
+class WriteTransaction:
+    """
+    Set of staged file writes committed together.
+
+    Usage:
+        transaction = WriteTransaction()
+        transaction.stage("/path/to/file.py", "content")
+        transaction.commit()
+    """
+
+    def __init__(self):
+        self._staged: Dict[str, str] = {}
+        self._created_directories: List[str] = []
+        # Staged files whose content was already on disk at the last commit
+        self.unchanged_files: List[str] = []
+        # Worker threads may stage files in the same transaction
+        self._lock = threading.Lock()
+
+    @property
+    def staged_files(self) -> List[str]:
+        """Paths of the staged files, in staging order."""
+        return list(self._staged)
+
+    def stage(self, file_path: str, content: str) -> None:
+        """
+        Stage the new content of a file.
+
+        Args:
+            file_path: Path to the file
+            content: Content to write on commit
+        """
+        with self._lock:
+            self._staged[os.path.abspath(file_path)] = content
+
+    def is_staged(self, file_path: str) -> bool:
+        """
+        Check if a file has staged content.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            bool: True if the file is staged
+        """
+        return os.path.abspath(file_path) in self._staged
+
+    def get_staged_content(self, file_path: str) -> Optional[str]:
+        """
+        Get the staged content of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Optional[str]: The staged content, or None if the file isn't staged
+        """
+        return self._staged.get(os.path.abspath(file_path))
+
+    def track_directory(self, directory_path: str) -> None:
+        """
+        Record the directories that creating directory_path will add.
+
+        Args:
+            directory_path: Directory about to be created
+        """
+        missing = []
+        path = os.path.abspath(directory_path)
+        while path and not os.path.exists(path):
+            missing.append(path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        with self._lock:
+            self._created_directories.extend(reversed(missing))
+
+    @profile_phase(FILE_IO)
+    def commit(self) -> List[str]:
+        """
+        Write all staged files atomically.
+
+        Files already holding their staged content are skipped and listed in
+        unchanged_files.
+
+        Returns:
+            List[str]: Paths of the written files
+
+        Raises:
+            OSError: If a file cannot be written (changes are rolled back)
+        """
+        temp_files: Dict[str, str] = {}
+        backups: Dict[str, Optional[bytes]] = {}
+        replaced: List[str] = []
+        mode = _default_file_mode()
+        self.unchanged_files = [
+            file_path for file_path, content in self._staged.items() if _has_content(file_path, content)
+        ]
+        for file_path in self.unchanged_files:
+            del self._staged[file_path]
+
+        try:
+            # Write and sync every file before touching any target, in parallel
+            # since each fsync mostly waits on the disk (or network mount)
+            for file_path in self._staged:
+                directory = os.path.dirname(file_path)
+                self.track_directory(directory)
+                os.makedirs(directory, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(
+                    dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+                )
+                os.close(fd)
+                temp_files[file_path] = temp_path
+
+            if len(temp_files) > 1:
+                with ThreadPoolExecutor(max_workers=FILESYSTEM_MAX_WORKERS) as executor:
+                    list(executor.map(self._write_temp_file, temp_files.keys(), temp_files.values()))
+            else:
+                for file_path, temp_path in temp_files.items():
+                    self._write_temp_file(file_path, temp_path)
+
+            # Swap them in with atomic renames
+            for file_path, temp_path in temp_files.items():
+                if os.path.exists(file_path):
+                    with open(file_path, "rb") as f:
+                        backups[file_path] = f.read()
+                    os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+                else:
+                    backups[file_path] = None
+                    os.chmod(temp_path, mode)
+                os.replace(temp_path, file_path)
+                replaced.append(file_path)
+
+            _sync_directories({os.path.dirname(file_path) for file_path in replaced})
+
+        except BaseException:
+            for file_path in reversed(replaced):
+                _restore(file_path, backups[file_path])
+            for temp_path in temp_files.values():
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            self._remove_created_directories()
+            raise
+
+        written_files = list(self._staged)
+        self._staged = {}
+        self._created_directories = []
+        return written_files
+
+    def _write_temp_file(self, file_path: str, temp_path: str) -> None:
+        """Write the staged content of file_path to its temp file and sync it."""
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self._staged[file_path])
+            f.flush()
+            os.fsync(f.fileno())
+
+    def rollback(self) -> None:
+        """Discard staged files and remove the directories created meanwhile."""
+        self._staged = {}
+        self._remove_created_directories()
+
+    def _remove_created_directories(self) -> None:
+        """Remove tracked directories that are still empty (deepest first)."""
+        for directory in sorted(set(self._created_directories), key=len, reverse=True):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+        self._created_directories = []
+
+
+def _default_file_mode() -> int:
+    """File mode of a newly created file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _has_content(file_path: str, content: str) -> bool:
+    """Check if a file exists and already holds exactly this content."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read() == content.encode("utf-8")
+    except OSError:
+        return False
+
+
+def _restore(file_path: str, content: Optional[bytes]) -> None:
+    """Restore a replaced file to its original content (or remove it)."""
+    if content is None:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        return
+    with open(file_path, "wb") as f:
+        f.write(content)
+
+
+def _sync_directories(directories) -> None:
+    """Sync directory entries so the renames are durable (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    for directory in directories:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
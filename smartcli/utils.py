@@ -10,27 +10,16 @@ from typing import Optional
 
 from django.conf import settings
 
+from smartcli.config import LAZY_INIT_DIRECTORIES
 
-def validate_pascal_case_name(name: str, name_type: str) -> None:
-    """
-    Validate that a name follows PascalCase conventions.
-
-    Args:
-        name: The name to validate
-        name_type: The type of name (e.g., "Model", "Serializer", "Service")
-
-    Raises:
-        ValueError: If the name is invalid
-    """
-    if not name[0].isupper():
-        raise ValueError(
-            f"{name_type} name '{name}' must start with an uppercase letter (PascalCase)"
-        )
-
-    if not name.replace("_", "").isalnum():
-        raise ValueError(
-            f"{name_type} name '{name}' can only contain letters, numbers, and underscores"
-        )
+# Naming helpers don't need Django, they live in smartcli.naming for the CLI
+from smartcli.naming import (  # noqa: F401
+    extract_model_name_from_name, pascal_to_snake_case, snake_to_pascal_case,
+    validate_module_name, validate_pascal_case_name,
+)
+from smartcli.profiling import FILE_IO, profile_phase
+from smartcli.project import get_project, resolve_settings_file
+from smartcli.transaction import get_active_transaction
 
 
 def validate_app_exists(app_name: str) -> None:
@@ -67,6 +56,19 @@ def get_apps_directory() -> str:
         return ""
 
 
+def use_lazy_init_files(directory: str) -> bool:
+    """
+    Check if the __init__.py file of a package directory is generated as a lazy registry.
+
+    Args:
+        directory: Name of the package directory of an app (e.g. "services")
+
+    Returns:
+        bool: True if USE_LAZY_INIT_FILES is enabled and the directory supports it
+    """
+    return getattr(settings, "USE_LAZY_INIT_FILES", False) and directory in LAZY_INIT_DIRECTORIES
+
+
 def get_app_path(app_name: str) -> str:
     """
     Get the full path to an app directory.
@@ -108,37 +110,7 @@ def get_app_import_path(app_name: str) -> str:
         return app_name
 
 
-def pascal_to_snake_case(name: str) -> str:
-    """Convert PascalCase to snake_case."""
-    # If there are already underscores, just convert to lowercase
-    if '_' in name:
-        return name.lower()
-    
-    # Convert PascalCase to snake_case
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-
-
-def snake_to_pascal_case(name: str) -> str:
-    """Convert snake_case to PascalCase."""
-    return "".join(word.capitalize() for word in name.split("_"))
-
-
-def extract_model_name_from_name(name: str, suffix: str) -> str:
-    """
-    Extract model name from a name with suffix (e.g., "UserSerializer" -> "User").
-
-    Args:
-        name: The name with suffix
-        suffix: The suffix to remove
-
-    Returns:
-        str: The name without suffix
-    """
-    if name.endswith(suffix):
-        return name[:-len(suffix)]
-    return name
-
-
+@profile_phase(FILE_IO)
 def check_file_exists(file_path: str) -> bool:
     """
     Check if a file exists.
@@ -149,9 +121,13 @@ def check_file_exists(file_path: str) -> bool:
     Returns:
         bool: True if file exists, False otherwise
     """
+    transaction = get_active_transaction()
+    if transaction is not None and transaction.is_staged(file_path):
+        return True
     return os.path.exists(file_path)
 
 
+@profile_phase(FILE_IO)
 def ensure_directory_exists(directory_path: str) -> None:
     """
     Ensure a directory exists, create it if it doesn't.
@@ -159,9 +135,14 @@ def ensure_directory_exists(directory_path: str) -> None:
     Args:
         directory_path: Path to the directory
     """
+    transaction = get_active_transaction()
+    if transaction is not None:
+        # Let the transaction remove it again on rollback
+        transaction.track_directory(directory_path)
     os.makedirs(directory_path, exist_ok=True)
 
 
+@profile_phase(FILE_IO)
 def read_file_content(file_path: str) -> str:
     """
     Read content from a file.
@@ -172,23 +153,44 @@ def read_file_content(file_path: str) -> str:
     Returns:
         str: File content
     """
+    transaction = get_active_transaction()
+    if transaction is not None and transaction.is_staged(file_path):
+        return transaction.get_staged_content(file_path)
+
     if os.path.exists(file_path):
         with open(file_path, "r", encoding="utf-8") as f:
             return f.read()
     return ""
 
 
-def write_file_content(file_path: str, content: str) -> None:
+@profile_phase(FILE_IO)
+def write_file_content(file_path: str, content: str) -> bool:
     """
-    Write content to a file.
+    Write content to a file, unless it already has this content.
+
+    Inside a write transaction, the content is staged and written on commit.
+    Files left unchanged keep their mtime, so autoreloaders and file watchers
+    don't restart for a no-op.
 
     Args:
         file_path: Path to the file
         content: Content to write
+
+    Returns:
+        bool: True if the file was written (or staged), False if it was unchanged
     """
+    if check_file_exists(file_path) and read_file_content(file_path) == content:
+        return False
+
+    transaction = get_active_transaction()
+    if transaction is not None:
+        transaction.stage(file_path, content)
+        return True
+
     ensure_directory_exists(os.path.dirname(file_path))
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(content)
+    return True
 
 
 def find_import_section_end(content: str) -> int:
@@ -289,44 +291,42 @@ def clean_up_files(file_paths: list) -> None:
 def detect_django_project_settings() -> tuple[Optional[str], Optional[str]]:
     """
     Detect the Django project directory and settings file.
-    
+
+    The settings file is the file of the settings module in use
+    (settings.SETTINGS_MODULE), or else of the DJANGO_SETTINGS_MODULE declared
+    in the manage.py of the project. Split settings (e.g. core.settings.dev
+    importing core.settings.base) define INSTALLED_APPS in a base module: when
+    the resolved file doesn't define it, the base.py next to it, then
+    settings/base.py and core/settings/base.py are looked up.
+
     Returns:
         tuple: (project_dir_name, settings_file_path) or (None, None) if not found
     """
-    base_dir = settings.BASE_DIR
-    
-    # Look for common settings file patterns
-    possible_settings_files = [
-        # Standard Django project structure (project_name/project_name/settings.py)
-        os.path.join(base_dir, os.path.basename(base_dir), "settings.py"),
-        # Direct settings.py in base directory
-        os.path.join(base_dir, "settings.py"),
-        # Project with settings module
-        os.path.join(base_dir, "settings", "__init__.py"),
-        # Project with settings/base.py (common pattern)
-        os.path.join(base_dir, "settings", "base.py"),
-        # Project with core/settings/base.py
-        os.path.join(base_dir, "core", "settings", "base.py"),
-    ]
-    
-    # Check if any of these files exist
-    for settings_file in possible_settings_files:
-        if os.path.exists(settings_file):
-            # Extract project directory name from the path
-            if settings_file.endswith("settings.py"):
-                # Direct settings.py file
-                project_dir = os.path.basename(base_dir)
-                return project_dir, settings_file
-            elif settings_file.endswith("__init__.py"):
-                # settings/__init__.py
-                project_dir = os.path.basename(base_dir)
-                return project_dir, settings_file
-            elif settings_file.endswith("base.py"):
-                # settings/base.py or core/settings/base.py
-                project_dir = os.path.basename(base_dir)
-                return project_dir, settings_file
-    
-    return None, None
+    base_dir = str(settings.BASE_DIR)
+    project = get_project(base_dir)
+    project_root = project.root if project is not None else base_dir
+
+    settings_module = getattr(settings, "SETTINGS_MODULE", None)
+    if settings_module:
+        settings_file = resolve_settings_file(project_root, settings_module)
+    else:
+        settings_file = project.settings_file if project is not None else None
+
+    if settings_file is None or not find_installed_apps_in_settings(settings_file)[0]:
+        base_settings_files = [
+            os.path.join(project_root, "settings", "base.py"),
+            os.path.join(project_root, "core", "settings", "base.py"),
+        ]
+        if settings_file is not None:
+            base_settings_files.insert(0, os.path.join(os.path.dirname(settings_file), "base.py"))
+        for base_settings_file in base_settings_files:
+            if find_installed_apps_in_settings(base_settings_file)[0]:
+                settings_file = base_settings_file
+                break
+
+    if settings_file is None:
+        return None, None
+    return os.path.basename(base_dir), settings_file
 
 
 def find_installed_apps_in_settings(settings_file_path: str) -> tuple[bool, Optional[str]]:
@@ -339,12 +339,12 @@ def find_installed_apps_in_settings(settings_file_path: str) -> tuple[bool, Opti
     Returns:
         tuple: (found, content) - whether INSTALLED_APPS was found and the file content
     """
-    if not os.path.exists(settings_file_path):
+    if not check_file_exists(settings_file_path):
         return False, None
     
     try:
-        with open(settings_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Read through the active transaction to see staged settings edits
+        content = read_file_content(settings_file_path)
         
         # Look for INSTALLED_APPS
         if "INSTALLED_APPS" in content:
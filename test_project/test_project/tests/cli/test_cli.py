@@ -1,3 +1,4 @@
+import os
 import sys
 import builtins
 from unittest import TestCase
@@ -48,6 +49,8 @@ class CLIMainTest(TestCase):
             ("create-service", "create_service"),
             ("create-factory", "create_factory"),
             ("create-views", "create_views"),
+            ("apply", "apply_spec"),
+            ("list", "list_components"),
             ("test", "test"),
         ]
         for cli_cmd, django_cmd in commands:
@@ -56,6 +59,43 @@ class CLIMainTest(TestCase):
                 exit_code = cli.main([cli_cmd, "foo", "bar"])
                 mock_run_django.assert_called_once_with(django_cmd, ["foo", "bar"])
 
+    @patch("smartcli.cli.is_django_project")
+    def test_run_django_command_invalid_args_rejected_early(self, mock_is_django):
+        with patch("builtins.print") as mock_print:
+            exit_code = cli.run_django_command("create_model", ["user", "users"])
+            self.assertEqual(exit_code, 1)
+            mock_print.assert_any_call(
+                "❌ Error: Model name 'user' must start with an uppercase letter (PascalCase)"
+            )
+        mock_is_django.assert_not_called()
+
+    def test_validate_command_args(self):
+        cases = [
+            ("create_model", ["User", "users"], None),
+            ("create_model", ["User"], "Usage: django-smartcli create-model <name> <app>"),
+            ("create_service", ["User-Service", "users"], "can only contain"),
+            ("create_serializer", ["User", "users", "--model", "user"], "Model name 'user'"),
+            ("create_views", ["--model=User", "UserView", "users"], None),
+            ("create_views", ["UserView", "users", "--model"], "--model requires a model name"),
+            ("create_module", ["users", "orders"], None),
+            ("create_module", ["--from-file", "modules.txt"], None),
+            ("create_module", [], "at least one module name"),
+            ("create_module", ["users", "123invalid"], "is not a valid Python identifier"),
+            ("create_model", ["--help"], None),
+            ("test", ["--models"], None),
+        ]
+        for command, args, expected in cases:
+            with self.subTest(command=command, args=args):
+                error = cli.validate_command_args(command, args)
+                if expected is None:
+                    self.assertIsNone(error)
+                else:
+                    self.assertIn(expected, error)
+
+    def test_get_positional_args_skips_option_values(self):
+        args = ["UserSerializer", "--model", "User", "-v", "2", "--traceback", "users"]
+        self.assertEqual(cli.get_positional_args(args), ["UserSerializer", "users"])
+
     @patch("smartcli.cli.print_help")
     def test_main_unknown_command(self, mock_print_help):
         with patch("builtins.print") as mock_print:
@@ -71,9 +111,10 @@ class CLIMainTest(TestCase):
             self.assertEqual(exit_code, 1)
             mock_print.assert_any_call("❌ Error: Not in a Django project directory")
 
+    @patch("smartcli.cli.get_settings_module", return_value=None)
     @patch("smartcli.cli.is_django_project", return_value=True)
     @patch("subprocess.run")
-    def test_run_django_command_success(self, mock_subprocess, mock_is_django):
+    def test_run_django_command_success(self, mock_subprocess, mock_is_django, mock_settings_module):
         mock_result = MagicMock()
         mock_result.returncode = 0
         mock_result.stdout = "output"
@@ -84,30 +125,162 @@ class CLIMainTest(TestCase):
             self.assertEqual(exit_code, 0)
             mock_print.assert_any_call("output")
 
+    @patch("smartcli.cli.get_settings_module", return_value=None)
     @patch("smartcli.cli.is_django_project", return_value=True)
     @patch("subprocess.run", side_effect=FileNotFoundError)
-    def test_run_django_command_python_not_found(self, mock_subprocess, mock_is_django):
+    def test_run_django_command_python_not_found(self, mock_subprocess, mock_is_django, mock_settings_module):
         with patch("builtins.print") as mock_print:
             exit_code = cli.run_django_command("create_model", ["User", "users"])
             self.assertEqual(exit_code, 1)
             mock_print.assert_any_call("❌ Error: 'python' command not found")
 
+    @patch("smartcli.cli.get_settings_module", return_value=None)
     @patch("smartcli.cli.is_django_project", return_value=True)
     @patch("subprocess.run", side_effect=Exception("fail"))
-    def test_run_django_command_other_exception(self, mock_subprocess, mock_is_django):
+    def test_run_django_command_other_exception(self, mock_subprocess, mock_is_django, mock_settings_module):
         with patch("builtins.print") as mock_print:
             exit_code = cli.run_django_command("create_model", ["User", "users"])
             self.assertEqual(exit_code, 1)
             mock_print.assert_any_call("❌ Error running Django command: fail")
 
+    @patch("smartcli.cli.run_django_command_in_process", return_value=0)
+    @patch("smartcli.cli.get_settings_module", return_value="test_project.settings")
+    @patch("smartcli.cli.is_django_project", return_value=True)
+    @patch("subprocess.run")
+    def test_run_django_command_in_process(self, mock_subprocess, mock_is_django, mock_settings_module, mock_in_process):
+        exit_code = cli.run_django_command("create_model", ["User", "users"])
+        self.assertEqual(exit_code, 0)
+        mock_in_process.assert_called_once_with("create_model", ["User", "users"], "test_project.settings")
+        mock_subprocess.assert_not_called()
+
+    @patch("smartcli.cli.run_django_command_in_process")
+    @patch("smartcli.server.forward_command", return_value=0)
+    @patch("smartcli.cli.is_django_project", return_value=True)
+    def test_run_django_command_forwarded_to_server(self, mock_is_django, mock_forward, mock_in_process):
+        exit_code = cli.run_django_command("create_model", ["User", "users"])
+        self.assertEqual(exit_code, 0)
+        mock_forward.assert_called_once_with("create_model", ["User", "users"])
+        mock_in_process.assert_not_called()
+
+    @patch("smartcli.server.forward_command")
+    @patch("smartcli.cli.run_django_command_in_process", return_value=0)
+    @patch("smartcli.cli.get_settings_module", return_value="test_project.settings")
+    @patch("smartcli.cli.is_django_project", return_value=True)
+    def test_run_django_command_test_not_forwarded(self, mock_is_django, mock_settings_module, mock_in_process, mock_forward):
+        cli.run_django_command("test", ["--models"])
+        mock_forward.assert_not_called()
+        mock_in_process.assert_called_once_with("test", ["--models"], "test_project.settings")
+
+    @patch("smartcli.cli.run_server", return_value=0)
+    def test_main_serve_command(self, mock_run_server):
+        exit_code = cli.main(["serve", "--stop"])
+        self.assertEqual(exit_code, 0)
+        mock_run_server.assert_called_once_with(["--stop"])
+
+    @patch("smartcli.server.stop_server", return_value=False)
+    @patch("smartcli.cli.is_django_project", return_value=True)
+    def test_run_server_stop_without_server(self, mock_is_django, mock_stop):
+        with patch("builtins.print") as mock_print:
+            exit_code = cli.run_server(["--stop"])
+            self.assertEqual(exit_code, 1)
+            mock_print.assert_any_call("❌ Error: No SmartCLI server running for this project")
+
+    @patch("smartcli.cli.run_django_command_in_process")
+    @patch("smartcli.cli.get_settings_module", return_value="test_project.settings")
+    @patch("smartcli.cli.is_django_project", return_value=True)
+    @patch("subprocess.run")
+    def test_run_django_command_subprocess_forced(self, mock_subprocess, mock_is_django, mock_settings_module, mock_in_process):
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        with patch.dict("os.environ", {cli.SUBPROCESS_ENV_VAR: "1"}):
+            exit_code = cli.run_django_command("create_model", ["User", "users"])
+        self.assertEqual(exit_code, 0)
+        mock_in_process.assert_not_called()
+        mock_subprocess.assert_called_once()
+
+    @patch("smartcli.cli.setup_django")
+    @patch("django.core.management.call_command")
+    def test_run_django_command_in_process_success(self, mock_call_command, mock_setup):
+        exit_code = cli.run_django_command_in_process("create_model", ["User", "users"], "test_project.settings")
+        self.assertEqual(exit_code, 0)
+        mock_setup.assert_called_once_with("test_project.settings")
+        mock_call_command.assert_called_once_with("create_model", "User", "users")
+
+    @patch("smartcli.cli.setup_django")
+    @patch("django.core.management.call_command")
+    def test_run_django_command_in_process_timings(self, mock_call_command, mock_setup):
+        with patch("builtins.print") as mock_print:
+            exit_code = cli.run_django_command_in_process(
+                "create_model", ["User", "users", "--timings"], "test_project.settings"
+            )
+        self.assertEqual(exit_code, 0)
+        mock_setup.assert_called_once_with("test_project.settings")
+        mock_call_command.assert_called_once_with("create_model", "User", "users", "--timings")
+        lines = [call.args[0] for call in mock_print.call_args_list]
+        self.assertTrue(lines[0].startswith("⏱️  Timings (total"))
+        self.assertTrue(any(line.strip().startswith("Django setup") for line in lines))
+
+    @patch("smartcli.cli.setup_django")
+    @patch("django.core.management.call_command", side_effect=SystemExit(1))
+    def test_run_django_command_in_process_test_timings(self, mock_call_command, mock_setup):
+        with patch("builtins.print") as mock_print:
+            exit_code = cli.run_django_command_in_process("test", ["--models", "--timings"], "test_project.settings")
+        self.assertEqual(exit_code, 1)
+        lines = [call.args[0] for call in mock_print.call_args_list]
+        self.assertTrue(lines[0].startswith("⏱️  Timings (total"))
+
+    @patch("smartcli.cli.setup_django")
+    @patch("django.core.management.call_command")
+    def test_run_django_command_in_process_command_error(self, mock_call_command, mock_setup):
+        from django.core.management.base import CommandError
+        mock_call_command.side_effect = CommandError("boom")
+        with patch("builtins.print") as mock_print:
+            exit_code = cli.run_django_command_in_process("create_model", ["User", "users"], "test_project.settings")
+            self.assertEqual(exit_code, 1)
+            mock_print.assert_any_call("CommandError: boom", file=sys.stderr)
+
+    @patch("smartcli.cli.setup_django")
+    @patch("django.core.management.call_command", side_effect=SystemExit(3))
+    def test_run_django_command_in_process_system_exit(self, mock_call_command, mock_setup):
+        exit_code = cli.run_django_command_in_process("test", [], "test_project.settings")
+        self.assertEqual(exit_code, 3)
+
+    def test_get_settings_module(self):
+        import tempfile
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write("os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings.base')\n")
+        try:
+            self.assertEqual(cli.get_settings_module(f.name), "core.settings.base")
+        finally:
+            os.remove(f.name)
+
+    def test_get_settings_module_missing_file(self):
+        self.assertIsNone(cli.get_settings_module("/nonexistent/manage.py"))
+
     def test_is_django_project_true(self):
-        with patch("os.path.exists", return_value=True):
+        with patch("smartcli.cli.get_project", return_value=MagicMock()):
             self.assertTrue(cli.is_django_project())
 
     def test_is_django_project_false(self):
-        with patch("os.path.exists", return_value=False):
+        with patch("smartcli.cli.get_project", return_value=None):
             self.assertFalse(cli.is_django_project())
 
+    def test_is_django_project_from_subdirectory(self):
+        import shutil
+        import tempfile
+        from smartcli.project import forget_projects
+        temp_dir = tempfile.mkdtemp()
+        subdirectory = os.path.join(temp_dir, "apps", "users")
+        os.makedirs(subdirectory)
+        open(os.path.join(temp_dir, "manage.py"), "w").close()
+        cwd = os.getcwd()
+        try:
+            os.chdir(subdirectory)
+            self.assertTrue(cli.is_django_project())
+        finally:
+            os.chdir(cwd)
+            forget_projects()
+            shutil.rmtree(temp_dir)
+
     def test_print_help(self):
         with patch("builtins.print") as mock_print:
             cli.print_help()
@@ -118,22 +291,33 @@ USAGE:
     django-smartcli <command> [options]
 
 COMMANDS:
-    create-module <name>           Create a new Django module with complete structure
+    create-module <name>...        Create new Django modules with complete structure
     create-model <name> <app>      Create a Django model with best practices
     create-serializer <name> <app> Create a DRF serializer
     create-service <name> <app>    Create a business logic service
     create-factory <name> <app>    Create a factory_boy factory
     create-views <name> <app>      Create a DRF ViewSet
+    apply <spec_file>              Create modules and components from a spec file
+    list [<app>...]                List the components of the project apps
+    serve [--stop]                 Keep a warm process to run commands faster
 
 OPTIONS:
-    -h, --help     Show this help message
-    -v, --version  Show version information
+    -h, --help        Show this help message
+    -v, --version     Show version information
+    --timings         Report the time spent in each phase of a command
+    --profile FILE    Also save a cProfile dump of the command to FILE
 
 EXAMPLES:
     django-smartcli create-module users
+    django-smartcli create-module users orders billing
     django-smartcli create-model UserProfile users
+    django-smartcli create-model Product catalog --cached
     django-smartcli create-serializer UserProfileSerializer users
     django-smartcli create-service UserProfileService users
+    django-smartcli create-service OrderLine orders --bulk
+    django-smartcli apply scaffold.yaml
+    django-smartcli list users
+    django-smartcli create-views ProductViewSet catalog --profile create_views.pstats
 
 For more information, visit: https://github.com/nathanrenard3/django-smartcli
 """)
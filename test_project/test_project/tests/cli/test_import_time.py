@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import smartcli
+
+
+# Cumulative import time budget of smartcli.cli, in microseconds
+CLI_IMPORT_TIME_BUDGET_US = 50_000
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(smartcli.__file__)))
+
+
+def run_python(*args):
+    """Run a Python snippet in a fresh interpreter using this smartcli package."""
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, cwd=PACKAGE_ROOT
+    )
+
+
+class CLIImportTimeTest(TestCase):
+    """The CLI fast path must not import Django."""
+
+    def test_import_time_budget(self):
+        """Test that importing smartcli.cli stays within budget and imports no Django module."""
+        result = run_python("-X", "importtime", "-c", "import smartcli.cli")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        imported = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                imported[name.strip()] = int(cumulative)
+
+        self.assertFalse([name for name in imported if name.split(".")[0] in ("django", "rest_framework")])
+        self.assertLess(imported["smartcli.cli"], CLI_IMPORT_TIME_BUDGET_US)
+
+    def test_fast_path_does_not_import_django(self):
+        """Test that help, version and argument validation run without Django."""
+        script = (
+            "import sys\n"
+            "from smartcli import cli\n"
+            "cli.main(['--help'])\n"
+            "cli.main(['--version'])\n"
+            "cli.main(['create-model', 'user', 'users'])\n"
+            "cli.main(['create-module', '123invalid'])\n"
+            "print('DJANGO_IMPORTED' if 'django' in sys.modules else 'DJANGO_NOT_IMPORTED')\n"
+        )
+        result = run_python("-c", script)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("must start with an uppercase letter", result.stdout)
+        self.assertIn("is not a valid Python identifier", result.stdout)
+        self.assertIn("DJANGO_NOT_IMPORTED", result.stdout)
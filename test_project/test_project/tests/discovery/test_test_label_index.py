@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+
+from smartcli.discovery import TestLabelIndex, get_project_apps
+
+
+class TestLabelIndexTest(TestCase):
+    """Test TestLabelIndex discovery and caching."""
+
+    def setUp(self):
+        """Set up a temporary project with one app."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, ".smartcli", "test_labels.json")
+        self.app_path = os.path.join(self.temp_dir, "apps", "users")
+        self.project_apps = [("apps.users", self.app_path)]
+        self._touch("tests/models/test_user.py")
+        self._touch("tests/models/profile/test_profile.py")
+        self._touch("tests/models/helpers.py")
+        self._touch("tests/views/test_user_view.py")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _touch(self, relative_path):
+        path = os.path.join(self.app_path, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+        return path
+
+    def _bump_mtime(self, relative_path):
+        path = os.path.join(self.app_path, relative_path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _labels(self, category="models"):
+        index = TestLabelIndex.load(self.cache_file)
+        labels = index.get_labels(category, self.project_apps)
+        index.save()
+        return labels
+
+    def test_discovers_labels(self):
+        """Test that test files of the category and its subdirectories are found."""
+        self.assertEqual(
+            self._labels(),
+            ["apps.users.tests.models.test_user", "apps.users.tests.models.profile.test_profile"],
+        )
+        self.assertEqual(self._labels("views"), ["apps.users.tests.views.test_user_view"])
+        self.assertEqual(self._labels("services"), [])
+
+    def test_cached_labels_skip_scan(self):
+        """Test that a second run reuses the cache without scanning directories."""
+        self._labels()
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        with patch("smartcli.discovery.os.scandir") as mock_scandir:
+            labels = self._labels()
+
+        mock_scandir.assert_not_called()
+        self.assertIn("apps.users.tests.models.test_user", labels)
+
+    def test_new_test_file_invalidates_entry(self):
+        """Test that adding a test file is picked up on the next run."""
+        self._labels()
+
+        self._touch("tests/models/test_address.py")
+        self._bump_mtime("tests/models")
+
+        self.assertIn("apps.users.tests.models.test_address", self._labels())
+
+    def test_new_category_directory_invalidates_entry(self):
+        """Test that creating a missing category directory is picked up."""
+        self.assertEqual(self._labels("services"), [])
+
+        self._touch("tests/services/test_user_service.py")
+        self._bump_mtime("tests")
+
+        self.assertEqual(self._labels("services"), ["apps.users.tests.services.test_user_service"])
+
+    def test_invalid_cache_file_is_ignored(self):
+        """Test that a corrupted cache file is rebuilt."""
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertIn("apps.users.tests.models.test_user", self._labels())
+
+    def test_decentralized_labels(self):
+        """Test labels of an app at the project root."""
+        self.project_apps = [("users", self.app_path)]
+
+        self.assertIn("users.tests.models.test_user", self._labels())
+
+
+class GetProjectAppsTest(TestCase):
+    """Test get_project_apps function."""
+
+    def _app_config(self, name, path):
+        app_config = type("AppConfig", (), {})()
+        app_config.name = name
+        app_config.path = path
+        return app_config
+
+    def _get_project_apps(self, use_centralized):
+        app_configs = [
+            self._app_config("django.contrib.auth", "/venv/django/contrib/auth"),
+            self._app_config("apps.users", "/project/apps/users"),
+            self._app_config("orders", "/project/orders"),
+        ]
+        with override_settings(BASE_DIR="/project", USE_CENTRALIZED_APPS=use_centralized):
+            with patch("smartcli.discovery.django_apps.get_app_configs", return_value=app_configs):
+                return get_project_apps()
+
+    def test_centralized_apps(self):
+        """Test that only apps of the apps directory are kept."""
+        self.assertEqual(self._get_project_apps(True), [("apps.users", "/project/apps/users")])
+
+    def test_decentralized_apps(self):
+        """Test that apps located in the project are kept."""
+        self.assertEqual(
+            self._get_project_apps(False),
+            [("apps.users", "/project/apps/users"), ("orders", "/project/orders")],
+        )
@@ -0,0 +1,183 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from django.test import TestCase
+
+from smartcli.impact import (
+    ImportGraph, get_changed_files, get_impacted_test_labels, get_test_candidates, module_name_for_path,
+)
+
+
+class ImpactTestCase(TestCase):
+    """Base test case with a temporary project containing one app."""
+
+    def setUp(self):
+        """Set up a temporary app with models, services and their tests."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.app_path = os.path.join(self.temp_dir, "apps", "users")
+        self.project_apps = [("apps.users", self.app_path)]
+        self._write("__init__.py")
+        self._write("models/__init__.py", "from .user import User\n")
+        self._write("models/user.py")
+        self._write("models/profile.py", "from apps.users.models.user import User\n")
+        self._write("services/user_service.py", "from ..models import User\n")
+        self._write("factories/user_factory.py", "from apps.users.models import User\n")
+        self._write("tests/models/test_user.py", "from apps.users.factories.user_factory import x\n")
+        self._write("tests/models/test_profile.py", "from apps.users.models.profile import Profile\n")
+        self._write("tests/services/test_user_service.py", "from apps.users.services import user_service\n")
+        self._write("tests/views/test_other_view.py")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative_path, content=""):
+        path = os.path.join(self.app_path, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def _path(self, relative_path):
+        return os.path.join(self.app_path, relative_path)
+
+
+class ImportGraphTest(ImpactTestCase):
+    """Test the static import graph."""
+
+    def test_module_name_for_path(self):
+        """Test module names of modules and packages."""
+        self.assertEqual(
+            module_name_for_path(self._path("models/user.py"), "apps.users", self.app_path), "apps.users.models.user"
+        )
+        self.assertEqual(
+            module_name_for_path(self._path("models/__init__.py"), "apps.users", self.app_path), "apps.users.models"
+        )
+
+    def test_relative_and_transitive_dependents(self):
+        """Test that dependents are found through relative imports and packages."""
+        graph = ImportGraph.build(self.project_apps)
+
+        dependents = graph.get_dependents({"apps.users.models.user"})
+
+        self.assertIn("apps.users.models", dependents)
+        self.assertIn("apps.users.services.user_service", dependents)
+        self.assertIn("apps.users.tests.models.test_profile", dependents)
+        self.assertIn("apps.users.tests.models.test_user", dependents)
+        self.assertNotIn("apps.users.tests.views.test_other_view", dependents)
+
+
+class TestCandidatesTest(ImpactTestCase):
+    """Test the naming convention mapping of components to tests."""
+
+    def test_component_test_files(self):
+        """Test the conventional test file of each component type."""
+        self.assertEqual(
+            get_test_candidates(self._path("services/user_service.py"), self.app_path),
+            [self._path("tests/services/test_user_service.py")],
+        )
+        self.assertEqual(
+            get_test_candidates(self._path("models/user.py"), self.app_path),
+            [self._path("tests/models/test_user.py")],
+        )
+
+    def test_factory_maps_to_model_tests(self):
+        """Test that factories map to the tests of their model."""
+        self.assertEqual(
+            get_test_candidates(self._path("factories/user_factory.py"), self.app_path),
+            [self._path("tests/models/test_user.py")],
+        )
+
+    def test_other_files_have_no_candidates(self):
+        """Test that package and non component files are not mapped."""
+        self.assertEqual(get_test_candidates(self._path("models/__init__.py"), self.app_path), [])
+        self.assertEqual(get_test_candidates(self._path("apps.py"), self.app_path), [])
+
+
+class ImpactedTestLabelsTest(ImpactTestCase):
+    """Test get_impacted_test_labels."""
+
+    def test_changed_model(self):
+        """Test that a changed model impacts the tests importing it, directly or not."""
+        labels, unmapped = get_impacted_test_labels([self._path("models/user.py")], self.project_apps)
+
+        self.assertEqual(
+            labels,
+            [
+                "apps.users.tests.models.test_profile",
+                "apps.users.tests.models.test_user",
+                "apps.users.tests.services.test_user_service",
+            ],
+        )
+        self.assertEqual(unmapped, [])
+
+    def test_naming_convention_without_import(self):
+        """Test that a component impacts its conventional test even without import."""
+        self._write("tests/services/test_user_service.py")
+
+        labels, _ = get_impacted_test_labels([self._path("services/user_service.py")], self.project_apps)
+
+        self.assertEqual(labels, ["apps.users.tests.services.test_user_service"])
+
+    def test_changed_test_file(self):
+        """Test that a changed test file impacts itself."""
+        labels, _ = get_impacted_test_labels([self._path("tests/views/test_other_view.py")], self.project_apps)
+
+        self.assertEqual(labels, ["apps.users.tests.views.test_other_view"])
+
+    def test_category_filter(self):
+        """Test that impacted tests can be restricted to categories."""
+        labels, _ = get_impacted_test_labels([self._path("models/user.py")], self.project_apps, ["services"])
+
+        self.assertEqual(labels, ["apps.users.tests.services.test_user_service"])
+
+    def test_deleted_and_unmapped_files(self):
+        """Test deleted modules, non Python files and files outside the apps."""
+        outside = os.path.join(self.temp_dir, "scripts", "tool.py")
+        labels, unmapped = get_impacted_test_labels(
+            [self._path("models/removed.py"), self._path("README.md"), outside], self.project_apps
+        )
+
+        self.assertEqual(labels, [])
+        self.assertEqual(unmapped, [outside])
+
+    def test_deleted_module_impacts_its_importers(self):
+        """Test that the tests still importing a deleted module are impacted."""
+        self._write("tests/models/test_legacy.py", "from apps.users.models.legacy import Legacy\n")
+        self._write("tests/services/test_cleanup.py", "from apps.users.services import cleanup\n")
+
+        labels, _ = get_impacted_test_labels(
+            [self._path("models/legacy.py"), self._path("services/cleanup.py")], self.project_apps
+        )
+
+        self.assertEqual(labels, ["apps.users.tests.models.test_legacy", "apps.users.tests.services.test_cleanup"])
+
+
+class ChangedFilesTest(ImpactTestCase):
+    """Test get_changed_files with a git repository."""
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.temp_dir, check=True, capture_output=True)
+
+    def test_committed_modified_and_untracked_files(self):
+        """Test that changes since the ref, uncommitted and untracked files are found."""
+        self._git("init", "-q")
+        self._git("add", ".")
+        self._git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+        self._write("models/user.py", "# changed\n")
+        self._write("models/address.py")
+
+        changed = get_changed_files("HEAD", cwd=self.temp_dir)
+
+        self.assertEqual(
+            [os.path.realpath(path) for path in changed],
+            [os.path.realpath(self._path("models/address.py")), os.path.realpath(self._path("models/user.py"))],
+        )
+
+    def test_invalid_ref(self):
+        """Test that git errors raise ValueError."""
+        self._git("init", "-q")
+
+        with self.assertRaises(ValueError):
+            get_changed_files("unknown-ref", cwd=self.temp_dir)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest.mock import patch
+from django.test import TestCase
+
+from smartcli import init_index, utils
+
+
+class InitFileBatchTest(TestCase):
+    """Test InitFileBatch class."""
+
+    def setUp(self):
+        """Set up temporary directory for __init__.py files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.init_file = os.path.join(self.temp_dir, "__init__.py")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        if os.path.exists(self.init_file):
+            os.remove(self.init_file)
+        os.rmdir(self.temp_dir)
+
+    def test_flush_applies_all_updates(self):
+        """Test that all queued updates are applied."""
+        batch = init_index.InitFileBatch()
+        batch.add(self.init_file, "from .user import User", ["User"])
+        batch.add(self.init_file, "from .profile import Profile", ["Profile"])
+
+        updated_files = batch.flush()
+
+        self.assertEqual(updated_files, [self.init_file])
+        content = utils.read_file_content(self.init_file)
+        self.assertIn("from .user import User", content)
+        self.assertIn("from .profile import Profile", content)
+        self.assertIn('__all__ = [\n    "Profile",\n    "User"\n]', content)
+
+    def test_flush_writes_each_file_once(self):
+        """Test that each __init__.py file is written only once."""
+        batch = init_index.InitFileBatch()
+        for name in ["User", "Profile", "Address"]:
+            batch.add(self.init_file, f"from .{name.lower()} import {name}", [name])
+
+        with patch("smartcli.init_index.write_file_content") as mock_write:
+            batch.flush()
+
+        mock_write.assert_called_once()
+
+    def test_flush_skips_unchanged_files(self):
+        """Test that a file already holding the imports is reported unchanged."""
+        batch = init_index.InitFileBatch()
+        batch.add(self.init_file, "from .user import User", ["User"])
+        batch.flush()
+        os.utime(self.init_file, (1000000000, 1000000000))
+
+        batch.add(self.init_file, "from .user import User", ["User"])
+
+        self.assertEqual(batch.flush(), [])
+        self.assertEqual(batch.unchanged_files, [self.init_file])
+        self.assertEqual(os.path.getmtime(self.init_file), 1000000000)
+
+    def test_flush_clears_updates(self):
+        """Test that a flushed batch is empty."""
+        batch = init_index.InitFileBatch()
+        batch.add(self.init_file, "from .user import User", ["User"])
+        batch.flush()
+
+        self.assertEqual(batch.flush(), [])
@@ -0,0 +1,145 @@
+from django.test import TestCase
+
+from smartcli.init_index import InitFileIndex
+
+
+class InitFileIndexTest(TestCase):
+    """Test InitFileIndex class."""
+
+    def test_render_empty_file(self):
+        """Test adding an import and a name to an empty file."""
+        index = InitFileIndex("")
+        index.add_import("from .user import User")
+        index.add_to_all("User")
+
+        self.assertEqual(index.render(), 'from .user import User\n\n__all__ = [\n    "User"\n]\n')
+
+    def test_render_existing_file(self):
+        """Test adding imports and names to a generated file."""
+        content = 'from .user import User\n\n__all__ = [\n    "User"\n]\n'
+        index = InitFileIndex(content)
+        index.add_import("from .profile import Profile")
+        index.add_import("from .address import Address")
+        index.add_to_all("Profile")
+        index.add_to_all("Address")
+
+        expected = (
+            "from .user import User\n"
+            "from .profile import Profile\n"
+            "from .address import Address\n"
+            "\n"
+            '__all__ = [\n    "Address",\n    "Profile",\n    "User"\n]\n'
+        )
+        self.assertEqual(index.render(), expected)
+
+    def test_render_without_changes(self):
+        """Test that content is unchanged when nothing is added."""
+        content = 'from .user import User\n\n__all__ = [\n    "User"\n]\n'
+        index = InitFileIndex(content)
+
+        self.assertFalse(index.add_import("from .user import User"))
+        self.assertFalse(index.add_to_all("User"))
+        self.assertFalse(index.has_changes)
+        self.assertEqual(index.render(), content)
+
+    def test_parenthesised_imports(self):
+        """Test that multi-line imports are detected and kept intact."""
+        content = "from .user import (\n    User,\n    UserManager,\n)\n\n__all__ = [\"User\", \"UserManager\"]\n"
+        index = InitFileIndex(content)
+
+        self.assertFalse(index.add_import("from .user import UserManager"))
+        index.add_import("from .profile import Profile")
+        index.add_to_all("Profile")
+
+        result = index.render()
+        self.assertTrue(result.startswith("from .user import (\n    User,\n    UserManager,\n)\nfrom .profile import Profile\n"))
+        self.assertIn('__all__ = [\n    "Profile",\n    "User",\n    "UserManager"\n]', result)
+
+    def test_import_not_matched_by_substring(self):
+        """Test that an import is not considered present because of a longer one."""
+        index = InitFileIndex("from .user_profile import UserProfile\n")
+
+        self.assertTrue(index.add_import("from .user import User"))
+
+    def test_all_with_comments_is_preserved(self):
+        """Test that comments inside __all__ are kept."""
+        content = '__all__ = [\n    "User",  # main model\n]\n'
+        index = InitFileIndex(content)
+        index.add_to_all("Profile")
+
+        self.assertEqual(index.render(), '__all__ = [\n    "User",  # main model\n    "Profile",\n]\n')
+
+    def test_imports_after_docstring(self):
+        """Test that imports are added after the module docstring."""
+        index = InitFileIndex('"""Models package."""\n\n__all__ = []\n')
+        index.add_import("from .user import User")
+        index.add_to_all("User")
+
+        self.assertEqual(
+            index.render(),
+            '"""Models package."""\nfrom .user import User\n\n__all__ = [\n    "User"\n]\n',
+        )
+
+    def test_all_directly_after_imports(self):
+        """Test adding to an __all__ that starts right where the imports end."""
+        index = InitFileIndex('from .a import A\n__all__ = ["A"]\n')
+        index.add_import("from .c import C")
+        index.add_to_all("C")
+
+        self.assertEqual(index.render(), 'from .a import A\nfrom .c import C\n__all__ = [\n    "A",\n    "C"\n]\n')
+
+    def test_all_only_file(self):
+        """Test adding an import and a name to a file with only __all__."""
+        index = InitFileIndex("__all__ = []\n")
+        index.add_import("from .c import C")
+        index.add_to_all("C")
+
+        self.assertEqual(index.render(), 'from .c import C\n__all__ = [\n    "C"\n]\n')
+
+    def test_all_directly_after_docstring(self):
+        """Test adding to an __all__ that directly follows the module docstring."""
+        index = InitFileIndex('"""Models package."""\n__all__ = ["A"]\n')
+        index.add_import("from .c import C")
+        index.add_to_all("C")
+
+        self.assertEqual(
+            index.render(),
+            '"""Models package."""\nfrom .c import C\n__all__ = [\n    "A",\n    "C"\n]\n',
+        )
+
+    def test_tuple_all_directly_after_imports(self):
+        """Test adding to a tuple __all__ right after the imports."""
+        index = InitFileIndex('from .a import A\n__all__ = ("A",)\n')
+        index.add_import("from .c import C")
+        index.add_to_all("C")
+
+        self.assertEqual(index.render(), 'from .a import A\nfrom .c import C\n__all__ = ("A",\n    "C",\n)\n')
+
+    def test_dynamic_all_is_untouched(self):
+        """Test that a computed __all__ is not rewritten or duplicated."""
+        content = "from .user import User\n\n__all__ = [name for name in dir() if name[0].isupper()]\n"
+        index = InitFileIndex(content)
+        index.add_import("from .profile import Profile")
+        index.add_to_all("Profile")
+
+        result = index.render()
+        self.assertEqual(result.count("__all__"), 1)
+        self.assertIn("from .profile import Profile", result)
+
+    def test_syntax_error_fallback(self):
+        """Test that unparsable files are updated with the text-based helpers."""
+        content = "from .user import User\nthis is not python\n"
+        index = InitFileIndex(content)
+        index.add_import("from .profile import Profile")
+        index.add_to_all("Profile")
+
+        result = index.render()
+        self.assertIn("from .profile import Profile", result)
+        self.assertIn('"Profile"', result)
+
+    def test_all_items(self):
+        """Test that all_items includes pending additions."""
+        index = InitFileIndex('__all__ = ["User"]\n')
+        index.add_to_all("Profile")
+
+        self.assertEqual(index.all_items, ["User", "Profile"])
@@ -0,0 +1,119 @@
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from django.test import TestCase
+
+from smartcli.init_index import InitFileBatch, InitFileIndex
+from smartcli.utils import read_file_content
+
+
+class LazyInitFileTest(TestCase):
+    """Test lazy (PEP 562) __init__.py files."""
+
+    def test_render_empty_file(self):
+        """Test that an empty file becomes a lazy registry."""
+        index = InitFileIndex("", lazy=True)
+        index.add_import("from .user_service import UserService")
+        index.add_to_all("UserService")
+        content = index.render()
+
+        self.assertTrue(index.is_lazy)
+        self.assertIn('_LAZY_IMPORTS = {\n    "UserService": ".user_service",\n}', content)
+        self.assertIn('__all__ = [\n    "UserService"\n]', content)
+        self.assertIn("def __getattr__(name):", content)
+        self.assertIn("def __dir__():", content)
+        self.assertNotIn("from .user_service import", content)
+
+    def test_lazy_file_is_maintained(self):
+        """Test that additions to a lazy file update its table and __all__ only."""
+        index = InitFileIndex("", lazy=True)
+        index.add_import("from .user_service import UserService")
+        index.add_to_all("UserService")
+        content = index.render()
+
+        # Lazy files stay lazy, whatever the setting
+        index = InitFileIndex(content)
+        self.assertFalse(index.add_import("from .user_service import UserService"))
+        self.assertTrue(index.add_import("from .address_service import AddressService"))
+        index.add_to_all("AddressService")
+        updated = index.render()
+
+        self.assertIn(
+            '_LAZY_IMPORTS = {\n    "AddressService": ".address_service",\n    "UserService": ".user_service",\n}',
+            updated,
+        )
+        self.assertIn('__all__ = [\n    "AddressService",\n    "UserService"\n]', updated)
+        self.assertEqual(updated.count("def __getattr__"), 1)
+
+    def test_table_with_comments_is_preserved(self):
+        """Test that commented tables get new entries before the closing brace."""
+        content = (
+            'import importlib\n\n_LAZY_IMPORTS = {\n    # Users\n    "UserService": ".user_service"\n}\n\n'
+            '__all__ = ["UserService"]\n'
+        )
+        index = InitFileIndex(content)
+        index.add_import("from .address_service import AddressService")
+
+        self.assertIn(
+            '    # Users\n    "UserService": ".user_service",\n    "AddressService": ".address_service",\n}',
+            index.render(),
+        )
+
+    def test_eager_file_is_converted(self):
+        """Test that generated eager files are converted, docstring included."""
+        content = '"""Services."""\nfrom .user_service import UserService\n\n__all__ = [\n    "UserService"\n]\n'
+        index = InitFileIndex(content, lazy=True)
+        index.add_import("from .address_service import AddressService")
+        index.add_to_all("AddressService")
+        rendered = index.render()
+
+        self.assertTrue(rendered.startswith('"""Services."""\n\nimport importlib\n'))
+        self.assertIn('    "UserService": ".user_service",', rendered)
+        self.assertIn('    "AddressService": ".address_service",', rendered)
+        self.assertNotIn("from .user_service import", rendered)
+
+    def test_custom_eager_file_is_not_converted(self):
+        """Test that files with other statements stay eager."""
+        content = "from django.conf import settings\nfrom .user_service import UserService\n"
+        index = InitFileIndex(content, lazy=True)
+        index.add_import("from .address_service import AddressService")
+
+        self.assertFalse(index.is_lazy)
+        self.assertIn("from .address_service import AddressService", index.render())
+
+    def test_generated_package_imports_lazily(self):
+        """Test that a generated package imports a submodule on first access only."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        package_path = os.path.join(temp_dir, "lazy_services")
+        os.makedirs(package_path)
+        for name in ["user", "address"]:
+            with open(os.path.join(package_path, f"{name}_service.py"), "w") as f:
+                f.write(f"class {name.title()}Service:\n    pass\n")
+
+        batch = InitFileBatch()
+        for name in ["user", "address"]:
+            batch.add(
+                os.path.join(package_path, "__init__.py"),
+                f"from .{name}_service import {name.title()}Service",
+                [f"{name.title()}Service"],
+                lazy=True,
+            )
+        batch.flush()
+        self.assertIn("_LAZY_IMPORTS", read_file_content(os.path.join(package_path, "__init__.py")))
+
+        sys.path.insert(0, temp_dir)
+        self.addCleanup(sys.path.remove, temp_dir)
+        self.addCleanup(lambda: [sys.modules.pop(name) for name in list(sys.modules) if name.startswith("lazy_services")])
+        package = importlib.import_module("lazy_services")
+
+        self.assertNotIn("lazy_services.user_service", sys.modules)
+        from lazy_services import UserService
+        self.assertIn("lazy_services.user_service", sys.modules)
+        self.assertNotIn("lazy_services.address_service", sys.modules)
+        self.assertEqual(UserService.__name__, "UserService")
+        self.assertIn("AddressService", dir(package))
+        with self.assertRaises(AttributeError):
+            package.MissingService
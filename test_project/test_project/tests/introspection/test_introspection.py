@@ -0,0 +1,219 @@
+import os
+import shutil
+import tempfile
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+from django.apps import apps
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.test import SimpleTestCase
+from django.test.utils import isolate_apps
+from django.utils import timezone
+
+from smartcli.introspection import (
+    clear_model_descriptions, describe_model, get_model, get_model_description, get_model_field_names,
+    get_models_mtimes, get_serializer_fields, get_view_query_plan,
+)
+
+
+def fake_serializers_module(model_name, fields):
+    """Build a serializers module exposing {model_name}Serializer with Meta.fields."""
+    serializer = type(f"{model_name}Serializer", (), {"Meta": SimpleNamespace(fields=fields)})
+    return SimpleNamespace(**{f"{model_name}Serializer": serializer})
+
+
+class ModelIntrospectionTest(SimpleTestCase):
+    """Test model and serializer lookups."""
+
+    def test_get_model(self):
+        """Test that installed models are found by app name and model name."""
+        self.assertIs(get_model("auth", "Permission"), Permission)
+        self.assertIs(get_model("django.contrib.auth", "Group"), Group)
+        self.assertIsNone(get_model("auth", "Missing"))
+        self.assertIsNone(get_model("missing", "Permission"))
+
+    def test_get_model_field_names(self):
+        """Test that forward fields are listed, reverse relations are not."""
+        self.assertEqual(get_model_field_names(Group), ["id", "name", "permissions"])
+        self.assertEqual(get_model_field_names(Permission), ["id", "name", "content_type", "codename"])
+
+    def test_get_serializer_fields(self):
+        """Test reading the fields of an existing serializer."""
+        module = fake_serializers_module("Group", ["id", "name"])
+        with patch("smartcli.introspection.importlib.import_module", return_value=module):
+            self.assertEqual(get_serializer_fields("auth", "Group"), ["id", "name"])
+
+    def test_get_serializer_fields_all(self):
+        """Test that "__all__" serializers expose the forward fields."""
+        module = fake_serializers_module("Group", "__all__")
+        with patch("smartcli.introspection.importlib.import_module", return_value=module):
+            self.assertEqual(get_serializer_fields("auth", "Group"), ["id", "name", "permissions"])
+
+    def test_missing_serializer(self):
+        """Test that a missing serializer returns None."""
+        self.assertIsNone(get_serializer_fields("auth", "Group"))
+
+
+class ViewQueryPlanTest(SimpleTestCase):
+    """Test get_view_query_plan."""
+
+    def _plan(self, app_name, model_name, fields=None, ordering="-id"):
+        module = fake_serializers_module(model_name, fields) if fields is not None else None
+        side_effect = None if module else ImportError
+        with patch("smartcli.introspection.importlib.import_module", return_value=module, side_effect=side_effect):
+            return get_view_query_plan(app_name, model_name, ordering)
+
+    def test_forward_relations_are_joined(self):
+        """Test that foreign keys are loaded with only() and select_related()."""
+        plan = self._plan("auth", "Permission")
+
+        self.assertEqual(plan.only_fields, ["id", "name", "content_type", "codename"])
+        self.assertEqual(plan.select_related, ["content_type"])
+        self.assertEqual(plan.prefetch_related, [])
+
+    def test_many_relations_are_prefetched(self):
+        """Test that many-to-many and reverse relations are prefetched, not loaded with only()."""
+        plan = self._plan("auth", "Group", ["id", "name", "permissions", "user_set"])
+
+        self.assertEqual(plan.only_fields, ["id", "name"])
+        self.assertEqual(plan.prefetch_related, ["permissions", "user_set"])
+
+    def test_serializer_fields_restrict_the_query(self):
+        """Test that unserialized fields and relations are left out, serializer-only fields ignored."""
+        plan = self._plan("auth", "Permission", ["id", "codename", "display_name"], ordering="-name")
+
+        self.assertEqual(plan.only_fields, ["id", "codename", "name"])
+        self.assertEqual(plan.select_related, [])
+
+    def test_create_queries(self):
+        """Test that unique checks, related lookups and many-to-many writes are counted for create."""
+        # Permission: content_type lookup, unique_together (content_type, codename)
+        self.assertEqual(self._plan("auth", "Permission").create_queries, 2)
+        # Group: unique name, permissions set()
+        self.assertEqual(self._plan("auth", "Group").create_queries, 2)
+        # Without the codename, unique_together isn't validated
+        self.assertEqual(self._plan("auth", "Permission", ["id", "name", "content_type"]).create_queries, 1)
+
+    def test_unknown_model_uses_base_fields(self):
+        """Test the fallback when the model isn't installed."""
+        plan = self._plan("auth", "Missing", ordering="-created_at")
+
+        self.assertEqual(plan.only_fields, ["id", "created_at", "deleted_at"])
+        self.assertEqual(plan.select_related, [])
+        self.assertEqual(plan.prefetch_related, [])
+        self.assertEqual(plan.create_queries, 0)
+
+
+class ModelsMtimesTest(SimpleTestCase):
+    """Test get_models_mtimes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def _write(self, relative_path):
+        path = os.path.join(self.temp_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("")
+        return path
+
+    def test_models_files(self):
+        """Test that models.py and the modules of a models package are listed."""
+        models_py = self._write("blog/models.py")
+        user_py = self._write("users/models/user.py")
+        init_py = self._write("users/models/__init__.py")
+        self._write("users/models/README.md")
+        apps = [("blog", os.path.join(self.temp_dir, "blog")), ("users", os.path.join(self.temp_dir, "users"))]
+
+        with patch("smartcli.introspection.get_project_apps", return_value=apps):
+            mtimes = get_models_mtimes()
+
+        self.assertEqual(sorted(mtimes), sorted([models_py, user_py, init_py]))
+        self.assertEqual(mtimes[user_py], os.stat(user_py).st_mtime_ns)
+
+    def test_edited_file_changes_mtimes(self):
+        """Test that editing a models file changes the result."""
+        user_py = self._write("users/models/user.py")
+        apps = [("users", os.path.join(self.temp_dir, "users"))]
+
+        with patch("smartcli.introspection.get_project_apps", return_value=apps):
+            before = get_models_mtimes()
+            os.utime(user_py, ns=(0, before[user_py] + 1))
+            self.assertNotEqual(get_models_mtimes(), before)
+
+
+class ModelDescriptionTest(SimpleTestCase):
+    """Test get_model_description and describe_model."""
+
+    def setUp(self):
+        clear_model_descriptions()
+        self.addCleanup(clear_model_descriptions)
+
+    def test_get_model_description(self):
+        """Test that serializer fields and factory declarations come from _meta."""
+        description = get_model_description("auth", "Group")
+
+        self.assertEqual(description.fields, ["id", "name", "permissions"])
+        self.assertEqual(description.read_only_fields, ["id"])
+        self.assertEqual(description.factory_declarations, ['name = factory.Sequence(lambda n: f"name-{n}")'])
+        self.assertEqual(description.many_to_many, ["permissions"])
+
+    def test_unknown_model(self):
+        """Test that models that aren't installed aren't described."""
+        self.assertIsNone(get_model_description("auth", "Missing"))
+        self.assertIsNone(get_model_description("missing", "Group"))
+
+    def test_models_are_described_once_per_app(self):
+        """Test that the models of an app are introspected on the first call only."""
+        with patch("smartcli.introspection.describe_model", wraps=describe_model) as mock_describe:
+            for _ in range(50):
+                get_model_description("auth", "Group")
+                get_model_description("auth", "Permission")
+
+        self.assertEqual(mock_describe.call_count, len(list(apps.get_app_config("auth").get_models())))
+
+    @isolate_apps("smartcli")
+    def test_factory_declarations(self):
+        """Test the factory declaration of each kind of field."""
+
+        class Category(models.Model):
+            name = models.CharField(max_length=50, unique=True)
+
+            class Meta:
+                app_label = "smartcli"
+
+        class Product(models.Model):
+            id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+            title = models.CharField(max_length=100)
+            status = models.CharField(max_length=10, choices=[("draft", "Draft"), ("live", "Live")])
+            price = models.DecimalField(max_digits=8, decimal_places=2)
+            stock = models.PositiveIntegerField(default=0)
+            notes = models.TextField(blank=True)
+            category = models.ForeignKey(Category, on_delete=models.CASCADE)
+            owner = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+            related = models.ManyToManyField("self")
+            created_at = models.DateTimeField(default=timezone.now)
+            deleted_at = models.DateTimeField(null=True, blank=True)
+
+            class Meta:
+                app_label = "smartcli"
+
+        description = describe_model(Product, {"smartcli"})
+
+        self.assertEqual(description.read_only_fields, ["id", "created_at"])
+        self.assertEqual(description.many_to_many, ["related"])
+        self.assertEqual(
+            description.factory_declarations,
+            [
+                'title = factory.Faker("pystr", max_chars=20)',
+                'status = factory.Faker("random_element", elements=[\'draft\', \'live\'])',
+                'price = factory.Faker("pydecimal", left_digits=6, right_digits=2, positive=True)',
+                'category = factory.SubFactory("smartcli.factories.CategoryFactory")',
+                "# owner: no factory for contenttypes.ContentType, pass it when creating",
+                "created_at = factory.LazyFunction(timezone.now)",
+                "deleted_at = None",
+            ],
+        )
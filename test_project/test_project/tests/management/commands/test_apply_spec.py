@@ -0,0 +1,68 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from unittest import TestCase
+from unittest.mock import patch
+
+
+class ApplySpecCommandTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.spec_file = os.path.join(self.temp_dir, "spec.json")
+        self.settings_override = override_settings(BASE_DIR=self.temp_dir, USE_CENTRALIZED_APPS=True)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.temp_dir)
+
+    def _write_spec(self, data):
+        with open(self.spec_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_apply_spec_creates_module_and_components(self):
+        self._write_spec({
+            "apps": {"users": {"models": ["User", "Profile"], "services": ["User"]}}
+        })
+
+        out = StringIO()
+        call_command("apply_spec", self.spec_file, stdout=out)
+
+        app_path = os.path.join(self.temp_dir, "apps", "users")
+        self.assertTrue(os.path.exists(os.path.join(app_path, "models", "user.py")))
+        self.assertTrue(os.path.exists(os.path.join(app_path, "models", "profile.py")))
+        self.assertTrue(os.path.exists(os.path.join(app_path, "services", "user_service.py")))
+        with open(os.path.join(app_path, "models", "__init__.py"), encoding="utf-8") as f:
+            models_init = f.read()
+        self.assertIn("from .user import User", models_init)
+        self.assertIn("from .profile import Profile", models_init)
+        self.assertIn("1 app(s), 3 component(s) created", out.getvalue())
+
+    def test_apply_spec_updates_each_init_file_once(self):
+        self._write_spec({"apps": {"users": {"models": ["User", "Profile", "Address"]}}})
+
+        with patch("smartcli.init_index.InitFileBatch.flush", autospec=True, return_value=[]) as mock_flush:
+            call_command("apply_spec", self.spec_file, stdout=StringIO())
+
+        mock_flush.assert_called_once()
+
+    def test_apply_spec_invalid_spec(self):
+        self._write_spec({"models": ["User"]})
+
+        with self.assertRaises(CommandError) as cm:
+            call_command("apply_spec", self.spec_file)
+        self.assertIn("'apps' mapping", str(cm.exception))
+
+    def test_apply_spec_failure_writes_nothing(self):
+        self._write_spec({"apps": {"users": {"models": ["User", "invalid"]}}})
+
+        with self.assertRaises(CommandError):
+            call_command("apply_spec", self.spec_file, stdout=StringIO())
+
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "apps", "users")))
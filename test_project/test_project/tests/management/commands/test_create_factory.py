@@ -4,6 +4,12 @@ from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 class CreateFactoryCommandTest(TestCase):
+    def setUp(self):
+        # Keep the project index cache out of the test project
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("smartcli.management.commands.create_factory.write_file_content")
     @patch("smartcli.management.commands.create_factory.get_app_path", return_value="/fake/path/apps/users")
     @patch("smartcli.management.commands.create_factory.check_file_exists", return_value=False)
@@ -52,4 +58,19 @@ class CreateFactoryCommandTest(TestCase):
             with patch("builtins.print") as mock_print:
                 call_command("create_factory", "UserFactory", "users")
                 # Verify that a warning message is displayed
-                mock_print.assert_any_call("Note: Model 'User' was not found. Make sure the model exists before using this factory.") 
\ No newline at end of file
+                mock_print.assert_any_call("Note: Model 'User' was not found. Make sure the model exists before using this factory.")
+
+    @patch("smartcli.management.commands.create_factory.write_file_content")
+    @patch("smartcli.management.commands.create_factory.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.management.commands.create_factory.check_file_exists", return_value=False)
+    @patch("smartcli.management.commands.create_factory.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_factory.validate_app_exists")
+    @patch("smartcli.management.commands.create_factory.validate_directory_exists")
+    def test_create_factory_from_installed_model(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file):
+        # Test that the declarations of the installed model are used
+        with patch("builtins.print"):
+            call_command("create_factory", "GroupFactory", "auth")
+
+        content = mock_write_file.call_args.args[1]
+        self.assertIn('name = factory.Sequence(lambda n: f"name-{n}")', content)
+        self.assertIn("def permissions(self, create, extracted, **kwargs):", content)
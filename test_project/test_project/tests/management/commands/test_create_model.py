@@ -1,14 +1,29 @@
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+
+from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.test import override_settings
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 class CreateModelCommandTest(TestCase):
+    def setUp(self):
+        # Keep the project index cache out of the test project
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("smartcli.management.commands.create_model.ensure_directory_exists")
     @patch("smartcli.management.commands.create_model.write_file_content")
     @patch("smartcli.management.commands.create_model.get_app_path", return_value="/fake/path/apps/users")
     @patch("smartcli.management.commands.create_model.get_app_import_path", return_value="apps.users")
-    @patch("smartcli.management.commands.create_model.check_file_exists", return_value=False)
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=False)
     @patch("smartcli.management.commands.create_model.validate_pascal_case_name")
     @patch("smartcli.management.commands.create_model.validate_app_exists")
     @patch("smartcli.management.commands.create_model.validate_directory_exists")
@@ -25,7 +40,7 @@ class CreateModelCommandTest(TestCase):
             mock_validate_dir.assert_called_once_with("users", "models")
 
     @patch("smartcli.management.commands.create_model.get_app_path", return_value="/fake/path/apps/users")
-    @patch("smartcli.management.commands.create_model.check_file_exists", return_value=True)
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=True)
     def test_create_model_already_exists(self, mock_check_exists, mock_get_app_path):
         with self.assertRaises(CommandError) as cm:
             call_command("create_model", "User", "users")
@@ -41,4 +56,64 @@ class CreateModelCommandTest(TestCase):
     def test_create_model_app_not_found(self, mock_validate_app):
         with self.assertRaises(CommandError) as cm:
             call_command("create_model", "User", "nonexistent")
-        self.assertIn("App 'nonexistent' does not exist", str(cm.exception)) 
\ No newline at end of file
+        self.assertIn("App 'nonexistent' does not exist", str(cm.exception))
+
+    @patch("smartcli.management.commands.create_model.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_model.write_file_content")
+    @patch("smartcli.management.commands.create_model.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.management.commands.create_model.get_app_import_path", return_value="apps.users")
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=False)
+    @patch("smartcli.management.commands.create_model.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_model.validate_app_exists")
+    @patch("smartcli.management.commands.create_model.validate_directory_exists")
+    def test_create_model_cached(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_import, mock_get_app_path, mock_write_file, mock_ensure_dir):
+        # Test that --cached generates the cached manager and its tests
+        with patch("smartcli.management.commands.create_model.InitFileBatch") as mock_batch:
+            mock_batch.return_value.flush.return_value = []
+            call_command("create_model", "User", "users", cached=True)
+
+        contents = {call.args[0]: call.args[1] for call in mock_write_file.call_args_list}
+        self.assertIn("cache.get(key, version=self.cache_version)", contents["/fake/path/apps/users/models/user.py"])
+        self.assertIn("class UserCacheTest(TestCase):", contents["/fake/path/apps/users/tests/models/test_user.py"])
+        mock_batch.return_value.add.assert_any_call(
+            "/fake/path/apps/users/tests/models/__init__.py",
+            "from .test_user import UserModelTest, UserManagerTest, UserCacheTest",
+            ["UserModelTest", "UserManagerTest", "UserCacheTest"],
+        )
+
+
+class CreateModelGeneratedFilesTest(TestCase):
+    """Create a model in a temporary app and import the generated files."""
+
+    def setUp(self):
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.app_name = f"generated_{uuid.uuid4().hex[:8]}"
+        self.app_path = os.path.join(self.temp_dir, self.app_name)
+        for package in ("", "models", "factories"):
+            os.makedirs(os.path.join(self.app_path, package), exist_ok=True)
+            open(os.path.join(self.app_path, package, "__init__.py"), "w").close()
+
+        sys.path.insert(0, self.temp_dir)
+        self.addCleanup(sys.path.remove, self.temp_dir)
+        self.addCleanup(self._unload_app)
+
+    def _unload_app(self):
+        for module in [module for module in sys.modules if module.split(".")[0] == self.app_name]:
+            del sys.modules[module]
+
+    def test_generated_factories_package_imports(self):
+        """Test that the factories package of a new model imports {Model}Factory."""
+        with override_settings(BASE_DIR=self.temp_dir, USE_CENTRALIZED_APPS=False):
+            call_command("create_model", "Author", self.app_name, stdout=open(os.devnull, "w"))
+
+        with override_settings(INSTALLED_APPS=settings.INSTALLED_APPS + [self.app_name]):
+            factories = importlib.import_module(f"{self.app_name}.factories")
+
+            self.assertTrue(hasattr(factories, "AuthorFactory"))
+            self.assertFalse(hasattr(factories, "AuthorFactoryFactory"))
+            self.assertEqual(factories.AuthorFactory._meta.model.__name__, "Author")
@@ -1,5 +1,11 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.test import override_settings
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
@@ -14,13 +20,13 @@ class CreateModuleCommandTest(TestCase):
     @patch("smartcli.management.commands.create_module.find_installed_apps_in_settings", return_value=(True, "INSTALLED_APPS = [\n    'django.contrib.admin',\n]") )
     def test_create_module_success(self, mock_find_installed, mock_detect_settings, mock_get_import, mock_check_exists, mock_get_apps_dir, mock_get_app_path, mock_write_file, mock_ensure_dir):
         # Test successful module creation without errors
-        with patch("builtins.print") as mock_print:
-            call_command("create_module", "users")
-            # Verify that directories and files are created
-            self.assertTrue(mock_ensure_dir.called)
-            self.assertTrue(mock_write_file.called)
-            # Verify that a success message is displayed
-            mock_print.assert_any_call("Module 'users' created in centralized structure (apps/users/)")
+        out = StringIO()
+        call_command("create_module", "users", stdout=out)
+        # Verify that directories and files are created
+        self.assertTrue(mock_ensure_dir.called)
+        self.assertTrue(mock_write_file.called)
+        # Verify that a success message is displayed
+        self.assertIn("Module 'users' created in centralized structure (apps/users/)", out.getvalue())
 
     @patch("smartcli.management.commands.create_module.get_app_path", return_value="/fake/path/apps/users")
     @patch("smartcli.management.commands.create_module.check_file_exists", return_value=True)
@@ -32,4 +38,78 @@ class CreateModuleCommandTest(TestCase):
     def test_create_module_invalid_name(self):
         with self.assertRaises(CommandError) as cm:
             call_command("create_module", "123invalid")
-        self.assertIn("is not a valid Python identifier", str(cm.exception)) 
\ No newline at end of file
+        self.assertIn("is not a valid Python identifier", str(cm.exception))
+
+    def test_create_module_requires_a_name(self):
+        with self.assertRaises(CommandError) as cm:
+            call_command("create_module")
+        self.assertIn("at least one module name", str(cm.exception))
+
+
+class CreateMultipleModulesCommandTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_file = os.path.join(self.temp_dir, "settings.py")
+        with open(self.settings_file, "w", encoding="utf-8") as f:
+            f.write('INSTALLED_APPS = [\n    "django.contrib.admin",\n]\n')
+        self.settings_override = override_settings(BASE_DIR=self.temp_dir, USE_CENTRALIZED_APPS=True)
+        self.settings_override.enable()
+        self.detect_patcher = patch(
+            "smartcli.management.commands.create_module.detect_django_project_settings",
+            return_value=(self.temp_dir, self.settings_file),
+        )
+        self.detect_patcher.start()
+
+    def tearDown(self):
+        self.detect_patcher.stop()
+        self.settings_override.disable()
+        shutil.rmtree(self.temp_dir)
+
+    def _read_settings(self):
+        with open(self.settings_file, encoding="utf-8") as f:
+            return f.read()
+
+    def test_create_several_modules(self):
+        out = StringIO()
+        call_command("create_module", "users", "orders", "billing", stdout=out)
+
+        for module_name in ["users", "orders", "billing"]:
+            module_path = os.path.join(self.temp_dir, "apps", module_name)
+            self.assertTrue(os.path.exists(os.path.join(module_path, "apps.py")))
+            self.assertTrue(os.path.exists(os.path.join(module_path, "tests", "models", "__init__.py")))
+        self.assertIn(
+            'INSTALLED_APPS = [\n    "apps.billing",\n    "apps.orders",\n    "apps.users",\n    "django.contrib.admin"\n]',
+            self._read_settings(),
+        )
+        self.assertIn("3 modules have been automatically added to INSTALLED_APPS.", out.getvalue())
+
+    def test_settings_written_once(self):
+        with patch("smartcli.management.commands.create_module.write_file_content") as mock_write:
+            call_command("create_module", "users", "orders", stdout=StringIO())
+
+        settings_writes = [call for call in mock_write.call_args_list if call.args[0] == self.settings_file]
+        self.assertEqual(len(settings_writes), 1)
+
+    def test_create_modules_from_file(self):
+        modules_file = os.path.join(self.temp_dir, "modules.txt")
+        with open(modules_file, "w", encoding="utf-8") as f:
+            f.write("# Modules to create\nusers\n\norders  # comment\nusers\n")
+
+        call_command("create_module", "billing", "--from-file", modules_file, stdout=StringIO())
+
+        for module_name in ["billing", "users", "orders"]:
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "apps", module_name, "__init__.py")))
+
+    def test_invalid_module_creates_nothing(self):
+        with self.assertRaises(CommandError):
+            call_command("create_module", "users", "123invalid", stdout=StringIO())
+
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "apps", "users")))
+        self.assertNotIn("apps.users", self._read_settings())
+
+    def test_verbose_output_lists_files(self):
+        out = StringIO()
+        call_command("create_module", "users", verbosity=2, stdout=out)
+
+        self.assertIn("Created file: ", out.getvalue())
+        self.assertIn(os.path.join("apps", "users", "urls.py"), out.getvalue())
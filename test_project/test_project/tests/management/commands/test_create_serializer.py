@@ -4,6 +4,12 @@ from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 class CreateSerializerCommandTest(TestCase):
+    def setUp(self):
+        # Keep the project index cache out of the test project
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("smartcli.management.commands.create_serializer.ensure_directory_exists")
     @patch("smartcli.management.commands.create_serializer.write_file_content")
     @patch("smartcli.management.commands.create_serializer.get_app_path", return_value="/fake/path/apps/users")
@@ -55,4 +61,22 @@ class CreateSerializerCommandTest(TestCase):
             call_command("create_serializer", "UserSerializer", "users", model="CustomUser")
             # Verify that validation functions are called with correct parameters
             mock_validate_name.assert_any_call("UserSerializer", "Serializer")
-            mock_validate_name.assert_any_call("CustomUser", "Model") 
\ No newline at end of file
+            mock_validate_name.assert_any_call("CustomUser", "Model")
+
+    @patch("smartcli.management.commands.create_serializer.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_serializer.write_file_content")
+    @patch("smartcli.management.commands.create_serializer.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.management.commands.create_serializer.check_file_exists", return_value=False)
+    @patch("smartcli.management.commands.create_serializer.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_serializer.validate_app_exists")
+    @patch("smartcli.management.commands.create_serializer.validate_directory_exists")
+    def test_create_serializer_from_installed_model(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file, mock_ensure_dir):
+        # Test that the fields of the installed model are used
+        with patch("builtins.print"):
+            call_command("create_serializer", "Group", "auth")
+
+        contents = {call.args[0]: call.args[1] for call in mock_write_file.call_args_list}
+        serializer = contents["/fake/path/apps/users/serializers/group_serializer.py"]
+        self.assertIn('"permissions",', serializer)
+        test = contents["/fake/path/apps/users/tests/serializers/test_group_serializer.py"]
+        self.assertIn('expected_fields = ["id", "name", "permissions"]', test)
@@ -1,13 +1,22 @@
+from io import StringIO
+
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.test import override_settings
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 class CreateServiceCommandTest(TestCase):
+    def setUp(self):
+        # Keep the project index cache out of the test project
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("smartcli.management.commands.create_service.ensure_directory_exists")
     @patch("smartcli.management.commands.create_service.write_file_content")
     @patch("smartcli.management.commands.create_service.get_app_path", return_value="/fake/path/apps/users")
-    @patch("smartcli.management.commands.create_service.check_file_exists", return_value=False)
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=False)
     @patch("smartcli.management.commands.create_service.validate_pascal_case_name")
     @patch("smartcli.management.commands.create_service.validate_app_exists")
     @patch("smartcli.management.commands.create_service.validate_directory_exists")
@@ -23,8 +32,44 @@ class CreateServiceCommandTest(TestCase):
             mock_validate_app.assert_called_once_with("users")
             mock_validate_dir.assert_called_once_with("users", "services")
 
+    @patch("smartcli.management.commands.create_service.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_service.write_file_content")
+    @patch("smartcli.management.commands.create_service.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=False)
+    @patch("smartcli.management.commands.create_service.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_service.validate_app_exists")
+    @patch("smartcli.management.commands.create_service.validate_directory_exists")
+    def test_create_service_bulk(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file, mock_ensure_dir):
+        out = StringIO()
+        call_command("create_service", "User", "users", "--bulk", stdout=out)
+
+        written = {call.args[0]: call.args[1] for call in mock_write_file.call_args_list}
+        self.assertIn("def bulk_create_users(cls", written["/fake/path/apps/users/services/user_service.py"])
+        self.assertIn("from apps.users.models import User\n", written["/fake/path/apps/users/services/user_service.py"])
+        self.assertIn("assertNumQueries", written["/fake/path/apps/users/tests/services/test_user_service.py"])
+        # The User model file doesn't exist
+        self.assertIn("Model 'User' not found in users", out.getvalue())
+
+    @patch("smartcli.management.commands.create_service.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_service.write_file_content")
     @patch("smartcli.management.commands.create_service.get_app_path", return_value="/fake/path/apps/users")
-    @patch("smartcli.management.commands.create_service.check_file_exists", return_value=True)
+    @patch("smartcli.management.commands.create_service.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_service.validate_app_exists")
+    @patch("smartcli.management.commands.create_service.validate_directory_exists")
+    def test_create_service_with_model(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_get_app_path, mock_write_file, mock_ensure_dir):
+        # The User model exists, not the service: create_user creates it and its budget test runs
+        def has_component(app_path, component_type, model_name):
+            return component_type == "model"
+
+        with patch("smartcli.project_index.ProjectIndex.has_component", side_effect=has_component):
+            call_command("create_service", "User", "users", stdout=StringIO())
+
+        written = {call.args[0]: call.args[1] for call in mock_write_file.call_args_list}
+        self.assertIn("return User.objects.create(**fields)", written["/fake/path/apps/users/services/user_service.py"])
+        self.assertNotIn("@skip", written["/fake/path/apps/users/tests/services/test_user_service.py"])
+
+    @patch("smartcli.management.commands.create_service.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=True)
     def test_create_service_already_exists(self, mock_check_exists, mock_get_app_path):
         with self.assertRaises(CommandError) as cm:
             call_command("create_service", "UserService", "users")
@@ -40,4 +85,26 @@ class CreateServiceCommandTest(TestCase):
     def test_create_service_app_not_found(self, mock_validate_app):
         with self.assertRaises(CommandError) as cm:
             call_command("create_service", "UserService", "nonexistent")
-        self.assertIn("App 'nonexistent' does not exist", str(cm.exception)) 
\ No newline at end of file
+        self.assertIn("App 'nonexistent' does not exist", str(cm.exception))
+
+    @override_settings(USE_LAZY_INIT_FILES=True)
+    @patch("smartcli.management.commands.create_service.InitFileBatch")
+    @patch("smartcli.management.commands.create_service.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_service.write_file_content")
+    @patch("smartcli.management.commands.create_service.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.project_index.ProjectIndex.has_component", return_value=False)
+    @patch("smartcli.management.commands.create_service.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_service.validate_app_exists")
+    @patch("smartcli.management.commands.create_service.validate_directory_exists")
+    def test_create_service_lazy_init(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file, mock_ensure_dir, mock_batch):
+        # Test that the services package is maintained as a lazy registry, not its tests
+        mock_batch.return_value.flush.return_value = []
+        call_command("create_service", "User", "users", stdout=StringIO())
+
+        mock_batch.return_value.add.assert_any_call(
+            "/fake/path/apps/users/services/__init__.py",
+            "from .user_service import UserService",
+            ["UserService"],
+            lazy=True,
+        )
+        self.assertNotIn("lazy", mock_batch.return_value.add.call_args_list[-1].kwargs)
@@ -1,9 +1,17 @@
+from io import StringIO
+
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 class CreateViewsCommandTest(TestCase):
+    def setUp(self):
+        # Keep the project index cache out of the test project
+        patcher = patch("smartcli.project_index.ProjectIndex.save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("smartcli.management.commands.create_views.ensure_directory_exists")
     @patch("smartcli.management.commands.create_views.write_file_content")
     @patch("smartcli.management.commands.create_views.get_app_path", return_value="/fake/path/apps/users")
@@ -66,12 +74,36 @@ class CreateViewsCommandTest(TestCase):
     @patch("smartcli.management.commands.create_views.validate_directory_exists")
     def test_create_views_dependencies_warnings(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file, mock_ensure_dir):
         # Test view creation with missing dependencies (should show warnings but not fail)
-        with patch("smartcli.management.commands.create_views._check_model_exists", return_value=False):
-            with patch("smartcli.management.commands.create_views._check_serializer_exists", return_value=False):
-                with patch("smartcli.management.commands.create_views._check_service_exists", return_value=False):
-                    with patch("builtins.print") as mock_print:
-                        call_command("create_views", "UserViewSet", "users")
-                        # Verify that warning messages are displayed for missing dependencies
-                        mock_print.assert_any_call("Note: Model 'User' was not found. Make sure the model exists before using this view.")
-                        mock_print.assert_any_call("Note: Serializer 'UserSerializer' was not found. Make sure the serializer exists before using this view.")
-                        mock_print.assert_any_call("Note: Service 'UserService' was not found. Make sure the service exists before using this view.") 
\ No newline at end of file
+        with patch("smartcli.project_index.ProjectIndex.has_component", return_value=False) as mock_has_component:
+            stdout = StringIO()
+            call_command("create_views", "User", "users", stdout=stdout)
+            # Verify that warning messages are displayed for missing dependencies
+            output = stdout.getvalue()
+            self.assertIn("Note: Model 'User' was not found. Make sure the model exists before using this view.", output)
+            self.assertIn("Note: Serializer 'UserSerializer' was not found. Make sure the serializer exists before using this view.", output)
+            self.assertIn("Note: Service 'UserService' was not found. Make sure the service exists before using this view.", output)
+            # Each component is looked up once
+            self.assertEqual(mock_has_component.call_count, 3)
+
+    @patch("smartcli.management.commands.create_views.ensure_directory_exists")
+    @patch("smartcli.management.commands.create_views.write_file_content")
+    @patch("smartcli.management.commands.create_views.get_app_path", return_value="/fake/path/apps/users")
+    @patch("smartcli.management.commands.create_views.check_file_exists", return_value=False)
+    @patch("smartcli.management.commands.create_views.validate_pascal_case_name")
+    @patch("smartcli.management.commands.create_views.validate_app_exists")
+    @patch("smartcli.management.commands.create_views.validate_directory_exists")
+    def test_create_views_implement(self, mock_validate_dir, mock_validate_app, mock_validate_name, mock_check_exists, mock_get_app_path, mock_write_file, mock_ensure_dir):
+        # Test that --implement plans the queryset from the model relations
+        with patch("builtins.print"):
+            call_command("create_views", "Group", "auth", implement=True)
+
+        contents = {call.args[0]: call.args[1] for call in mock_write_file.call_args_list}
+        view = contents["/fake/path/apps/users/views/group_view.py"]
+        self.assertIn('.prefetch_related("permissions")', view)
+        self.assertIn("class GroupPagination(CursorPagination):", view)
+        # The budget of each action includes the prefetch query
+        test = contents["/fake/path/apps/users/tests/views/test_group_view.py"]
+        self.assertIn("LIST_QUERIES = 2", test)
+        # Create also validates the unique name and sets the permissions
+        self.assertIn("CREATE_QUERIES = 6", test)
+        self.assertNotIn("@skip(", test)
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from unittest import TestCase
+from unittest.mock import patch
+
+
+class ListComponentsCommandTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.app_path = os.path.join(self.temp_dir, "apps", "users")
+        for relative_path, content in [
+            ("models/user.py", "class UserManager(models.Manager):\n    pass\n\n\nclass User(models.Model):\n    pass\n"),
+            ("serializers/user_serializer.py", "class UserSerializer:\n    pass\n"),
+        ]:
+            path = os.path.join(self.app_path, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+        self.settings_override = override_settings(BASE_DIR=self.temp_dir)
+        self.settings_override.enable()
+        patcher = patch(
+            "smartcli.management.commands.list_components.get_project_apps",
+            return_value=[("apps.users", self.app_path), ("apps.orders", os.path.join(self.temp_dir, "apps", "orders"))],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.temp_dir)
+
+    def test_list_components(self):
+        stdout = StringIO()
+        call_command("list_components", stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("📦 apps.users", output)
+        self.assertIn(f"    - User ({os.path.join('models', 'user.py')})", output)
+        self.assertIn("    - UserSerializer", output)
+        self.assertNotIn("UserManager", output)
+        self.assertNotIn("services:", output)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, ".smartcli", "index.json")))
+
+    def test_list_components_of_one_app(self):
+        stdout = StringIO()
+        call_command("list_components", "orders", stdout=stdout)
+
+        self.assertIn("📦 apps.orders", stdout.getvalue())
+        self.assertNotIn("apps.users", stdout.getvalue())
+
+    def test_list_components_unknown_app(self):
+        with self.assertRaises(CommandError) as cm:
+            call_command("list_components", "billing")
+        self.assertIn("Unknown project app(s): billing", str(cm.exception))
@@ -0,0 +1,75 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from unittest import TestCase
+from unittest.mock import patch
+
+
+LABELS = ["apps.users.tests.models.test_user", "apps.users.tests.services.test_user_service"]
+
+
+@patch("smartcli.management.commands.test.get_project_apps", return_value=[])
+@patch("smartcli.management.commands.test.get_changed_files", return_value=["/project/apps/users/models/user.py"])
+@patch("smartcli.management.commands.test.TestCommand.handle")
+class TestCommandChangedSinceTest(TestCase):
+    def test_runs_impacted_labels(self, mock_handle, mock_changed, mock_apps):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=(LABELS, [])) as mock_impact:
+            call_command("test", "--changed-since", "main", stdout=out)
+
+        mock_changed.assert_called_once_with("main")
+        self.assertIsNone(mock_impact.call_args.args[2])
+        self.assertEqual(mock_handle.call_args.args, tuple(LABELS))
+        self.assertIn("1 changed files since main: 2 files with tests found", out.getvalue())
+
+    def test_restricted_to_filter(self, mock_handle, mock_changed, mock_apps):
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=(LABELS[:1], [])) as mock_impact:
+            call_command("test", "--changed-since", "main", "--models", stdout=StringIO())
+
+        self.assertEqual(mock_impact.call_args.args[2], ["models"])
+
+    def test_no_impacted_tests(self, mock_handle, mock_changed, mock_apps):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=([], [])):
+            call_command("test", "--changed-since", "main", stdout=out)
+
+        mock_handle.assert_not_called()
+        self.assertIn("No tests impacted by changes since main", out.getvalue())
+
+    def test_outside_changes_run_full_suite(self, mock_handle, mock_changed, mock_apps):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=([], ["/project/core/settings.py"])):
+            call_command("test", "--changed-since", "main", stdout=out)
+
+        self.assertEqual(mock_handle.call_args.args, ())
+        self.assertIn("outside the project apps", out.getvalue())
+        self.assertIn("running the full test suite", out.getvalue())
+
+    def test_outside_changes_run_filtered_suite(self, mock_handle, mock_changed, mock_apps):
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=([], ["/project/core/settings.py"])), \
+                patch("smartcli.management.commands.test.Command._get_filtered_test_labels", return_value=LABELS[:1]):
+            call_command("test", "--changed-since", "main", "--models", stdout=StringIO())
+
+        self.assertEqual(mock_handle.call_args.args, (LABELS[0],))
+
+    def test_ignore_outside_changes(self, mock_handle, mock_changed, mock_apps):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=([], ["/project/core/settings.py"])):
+            call_command("test", "--changed-since", "main", "--ignore-outside-changes", stdout=out)
+
+        mock_handle.assert_not_called()
+        self.assertIn("not mapped to tests", out.getvalue())
+        self.assertIn("No tests impacted by changes since main", out.getvalue())
+
+    def test_git_error(self, mock_handle, mock_changed, mock_apps):
+        mock_changed.side_effect = ValueError("git diff failed")
+
+        with self.assertRaises(CommandError):
+            call_command("test", "--changed-since", "unknown", stdout=StringIO())
+
+    def test_intersected_with_explicit_labels(self, mock_handle, mock_changed, mock_apps):
+        with patch("smartcli.management.commands.test.get_impacted_test_labels", return_value=(LABELS, [])):
+            call_command("test", "apps.users.tests.services", "--changed-since", "main", stdout=StringIO())
+
+        self.assertEqual(mock_handle.call_args.args, (LABELS[1],))
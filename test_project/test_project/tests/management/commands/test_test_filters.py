@@ -0,0 +1,86 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from unittest import TestCase
+from unittest.mock import patch
+
+from smartcli.management.commands.test import intersect_test_labels
+
+
+PROJECT_APPS = [("apps.users", "/project/apps/users"), ("apps.orders", "/project/apps/orders")]
+LABELS = {
+    "models": ["apps.users.tests.models.test_user", "apps.orders.tests.models.test_order"],
+    "views": ["apps.users.tests.views.test_user_view"],
+}
+
+
+class FakeTestLabelIndex:
+    @classmethod
+    def load(cls):
+        return cls()
+
+    def get_labels(self, category, project_apps=None):
+        app_names = [app_name for app_name, _ in project_apps or PROJECT_APPS]
+        return [label for label in LABELS.get(category, []) if label.rsplit(".tests.", 1)[0] in app_names]
+
+    def save(self):
+        pass
+
+
+@patch("smartcli.management.commands.test.get_project_apps", return_value=PROJECT_APPS)
+@patch("smartcli.management.commands.test.TestLabelIndex", FakeTestLabelIndex)
+@patch("smartcli.management.commands.test.TestCommand.handle")
+class TestCommandFiltersTest(TestCase):
+    def test_several_filters_run_together(self, mock_handle, mock_apps):
+        out = StringIO()
+        call_command("test", "--models", "--views", stdout=out)
+
+        mock_handle.assert_called_once()
+        self.assertEqual(mock_handle.call_args.args, tuple(LABELS["models"] + LABELS["views"]))
+        self.assertIn("filtered by 'models, views': 3 files", out.getvalue())
+
+    def test_app_restriction(self, mock_handle, mock_apps):
+        call_command("test", "--models", "--app", "orders", stdout=StringIO())
+
+        self.assertEqual(mock_handle.call_args.args, ("apps.orders.tests.models.test_order",))
+
+    def test_app_without_filter(self, mock_handle, mock_apps):
+        call_command("test", "--app", "apps.users", stdout=StringIO())
+
+        self.assertEqual(mock_handle.call_args.args, ("apps.users",))
+
+    def test_unknown_app(self, mock_handle, mock_apps):
+        with self.assertRaises(CommandError) as cm:
+            call_command("test", "--app", "billing", stdout=StringIO())
+        self.assertIn("available: users, orders", str(cm.exception))
+
+    def test_filters_intersected_with_explicit_labels(self, mock_handle, mock_apps):
+        call_command("test", "apps.users", "--models", "--views", stdout=StringIO())
+
+        self.assertEqual(
+            mock_handle.call_args.args,
+            ("apps.users.tests.models.test_user", "apps.users.tests.views.test_user_view"),
+        )
+
+    def test_empty_intersection(self, mock_handle, mock_apps):
+        out = StringIO()
+        call_command("test", "apps.orders", "--views", stdout=out)
+
+        mock_handle.assert_not_called()
+        self.assertIn("No tests found for filter 'views'", out.getvalue())
+
+
+class IntersectTestLabelsTest(TestCase):
+    def test_labels_inside_selected_packages(self):
+        self.assertEqual(
+            intersect_test_labels(LABELS["models"], ["apps.users"]),
+            ["apps.users.tests.models.test_user"],
+        )
+
+    def test_selected_tests_inside_labels(self):
+        selected = "apps.users.tests.models.test_user.UserTest.test_create"
+        self.assertEqual(intersect_test_labels(LABELS["models"], [selected]), [selected])
+
+    def test_prefix_is_not_a_package(self):
+        self.assertEqual(intersect_test_labels(["apps.users_extra.tests.test_x"], ["apps.users"]), [])
@@ -0,0 +1,44 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from unittest import TestCase
+from unittest.mock import patch
+
+
+LABELS = [f"apps.users.tests.views.test_{index}" for index in range(4)]
+
+
+@patch("smartcli.management.commands.test.load_label_durations", return_value={})
+@patch("smartcli.management.commands.test.TestCommand.handle")
+class TestCommandShardingTest(TestCase):
+    def test_runs_only_shard_labels(self, mock_handle, mock_durations):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.Command._get_filtered_test_labels", return_value=LABELS):
+            call_command("test", "--views", "--shard-index", "1", "--shard-count", "2", stdout=out)
+
+        labels = mock_handle.call_args.args
+        self.assertEqual(len(labels), 2)
+        self.assertTrue(set(labels) <= set(LABELS))
+        self.assertIn("Running shard 2/2: 2 of 4 test labels", out.getvalue())
+
+    def test_shards_explicit_labels(self, mock_handle, mock_durations):
+        call_command("test", *LABELS, "--shard-index", "0", "--shard-count", "4", stdout=StringIO())
+
+        self.assertEqual(len(mock_handle.call_args.args), 1)
+
+    def test_shard_options_must_be_used_together(self, mock_handle, mock_durations):
+        with self.assertRaises(CommandError) as cm:
+            call_command("test", *LABELS, "--shard-count", "2", stdout=StringIO())
+        self.assertIn("must be used together", str(cm.exception))
+
+    def test_sharding_requires_labels(self, mock_handle, mock_durations):
+        with self.assertRaises(CommandError) as cm:
+            call_command("test", "--shard-index", "0", "--shard-count", "2", stdout=StringIO())
+        self.assertIn("requires a test filter", str(cm.exception))
+
+    def test_invalid_shard_index(self, mock_handle, mock_durations):
+        with self.assertRaises(CommandError) as cm:
+            call_command("test", *LABELS, "--shard-index", "2", "--shard-count", "2", stdout=StringIO())
+        self.assertIn("Shard index must be between 0 and 1", str(cm.exception))
+        mock_handle.assert_not_called()
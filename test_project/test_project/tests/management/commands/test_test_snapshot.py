@@ -0,0 +1,56 @@
+from io import StringIO
+
+from django.core.management import call_command
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from smartcli.snapshot import SnapshotRunnerMixin
+from smartcli.timings import TimingRunnerMixin
+
+
+@patch("smartcli.management.commands.test.TestCommand.handle")
+class TestCommandSnapshotTest(TestCase):
+    def _snapshot(self, restored):
+        snapshot = MagicMock(alias="default")
+        snapshot.restore.return_value = restored
+        return snapshot
+
+    def test_restores_snapshots_and_keeps_database(self, mock_handle):
+        snapshot = self._snapshot(True)
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_database_snapshots", return_value=[snapshot]):
+            call_command("test", "apps.users", "--snapshot-db", stdout=out)
+
+        options = mock_handle.call_args.kwargs
+        self.assertTrue(options["keepdb"])
+        self.assertEqual(options["testrunner"], "smartcli.runner.ExtendedTestRunner")
+        self.assertEqual(options["runner_mixins"], [SnapshotRunnerMixin])
+        self.assertEqual(options["db_snapshots"], [snapshot])
+        self.assertIn("Using test database snapshot for alias 'default'", out.getvalue())
+        snapshot.release.assert_called_once()
+
+    def test_missing_snapshot_is_saved_after_migrating(self, mock_handle):
+        out = StringIO()
+        with patch("smartcli.management.commands.test.get_database_snapshots", return_value=[self._snapshot(False)]):
+            call_command("test", "apps.users", "--snapshot-db", stdout=out)
+
+        self.assertIn("it will be saved after migrating", out.getvalue())
+
+    def test_other_backends_only_keep_database(self, mock_handle):
+        with patch("smartcli.management.commands.test.get_database_snapshots", return_value=[]):
+            call_command("test", "apps.users", "--snapshot-db", stdout=StringIO())
+
+        options = mock_handle.call_args.kwargs
+        self.assertTrue(options["keepdb"])
+        self.assertNotIn("runner_mixins", options)
+
+    def test_combined_with_record_timings(self, mock_handle):
+        with patch("smartcli.management.commands.test.get_database_snapshots", return_value=[self._snapshot(True)]):
+            call_command(
+                "test", "apps.users", "--snapshot-db", "--record-timings",
+                "--testrunner", "custom.Runner", stdout=StringIO(),
+            )
+
+        options = mock_handle.call_args.kwargs
+        self.assertEqual(options["base_runner"], "custom.Runner")
+        self.assertEqual(options["runner_mixins"], [TimingRunnerMixin, SnapshotRunnerMixin])
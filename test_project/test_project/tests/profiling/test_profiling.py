@@ -0,0 +1,188 @@
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase
+
+from smartcli import profiling
+from smartcli.management.commands.test import Command as TestCommand
+from smartcli.profiling import (
+    FILE_IO, TEMPLATE_RENDERING, TEST_RUN, TEST_SELECTION, VALIDATION, ProfilingSession, get_active_session,
+    profile_phase,
+)
+from smartcli.utils import write_file_content
+
+
+class _FakeClock:
+    """perf_counter replacement advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProfilingSessionTest(TestCase):
+    """Test ProfilingSession and profile_phase."""
+
+    def setUp(self):
+        """Replace the clock of the profiling module."""
+        self.clock = _FakeClock()
+        clock_patch = patch.object(profiling.time, "perf_counter", self.clock)
+        clock_patch.start()
+        self.addCleanup(clock_patch.stop)
+
+    def test_phases_are_recorded(self):
+        """Test that the time of each phase is recorded and the rest is other."""
+        with ProfilingSession() as session:
+            with profile_phase(VALIDATION):
+                self.clock.now += 1.0
+            self.clock.now += 0.5
+            with profile_phase(TEMPLATE_RENDERING):
+                self.clock.now += 2.0
+
+        self.assertEqual(session.total, 3.5)
+        self.assertEqual(session.durations, {VALIDATION: 1.0, TEMPLATE_RENDERING: 2.0})
+        self.assertIsNone(get_active_session())
+
+    def test_nested_phase_is_not_counted_in_outer_phase(self):
+        """Test that an inner phase pauses the enclosing one."""
+        with ProfilingSession() as session:
+            with profile_phase(TEMPLATE_RENDERING):
+                self.clock.now += 1.0
+                with profile_phase(FILE_IO):
+                    self.clock.now += 3.0
+                self.clock.now += 1.0
+
+        self.assertEqual(session.durations, {TEMPLATE_RENDERING: 2.0, FILE_IO: 3.0})
+
+    def test_profile_phase_as_decorator(self):
+        """Test that profile_phase decorates functions."""
+        @profile_phase(FILE_IO)
+        def write():
+            self.clock.now += 2.0
+            return "written"
+
+        with ProfilingSession() as session:
+            self.assertEqual(write(), "written")
+
+        self.assertEqual(session.durations, {FILE_IO: 2.0})
+
+    def test_profile_phase_without_session(self):
+        """Test that profile_phase does nothing without an active session."""
+        with profile_phase(VALIDATION):
+            self.clock.now += 1.0
+        self.assertIsNone(get_active_session())
+
+    def test_other_threads_are_ignored(self):
+        """Test that phases of worker threads are not recorded."""
+        def work():
+            with profile_phase(FILE_IO):
+                pass
+
+        with ProfilingSession() as session:
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(session.durations, {})
+
+    def test_format_report(self):
+        """Test that the report lists the phases in order, then other."""
+        with ProfilingSession() as session:
+            with profile_phase(TEMPLATE_RENDERING):
+                self.clock.now += 1.0
+            with profile_phase(VALIDATION):
+                self.clock.now += 2.0
+            self.clock.now += 1.0
+
+        lines = session.format_report()
+
+        self.assertEqual(lines[0], "⏱️  Timings (total 4.000s):")
+        self.assertEqual([line.split()[0] for line in lines[1:]], ["validation", "template", "other"])
+        self.assertIn(" 50.0%", lines[1])
+        self.assertIn(" 25.0%", lines[3])
+
+
+class ProfileFileTest(TestCase):
+    """Test the cProfile dump of a session."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_profile_file_is_dumped(self):
+        """Test that the stats are saved (in a new directory) and reported."""
+        profile_file = os.path.join(self.temp_dir, "profiles", "command.pstats")
+
+        with ProfilingSession(profile_file) as session:
+            write_file_content(os.path.join(self.temp_dir, "file.py"), "content")
+
+        self.assertGreater(pstats.Stats(profile_file).total_calls, 0)
+        self.assertIn(FILE_IO, session.durations)
+        self.assertIn(f"Profile saved to {profile_file}", session.format_report()[-1])
+
+
+class ProfiledCommandMixinTest(TestCase):
+    """Test the --timings and --profile options of the commands."""
+
+    def setUp(self):
+        """Keep the project index cache out of the test project."""
+        save_patch = patch("smartcli.project_index.ProjectIndex.save")
+        save_patch.start()
+        self.addCleanup(save_patch.stop)
+
+    def test_timings_option(self):
+        """Test that --timings prints the phase breakdown after the output."""
+        out = StringIO()
+        call_command("list_components", timings=True, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("⏱️  Timings (total", output)
+        self.assertIn("other", output)
+        self.assertIsNone(get_active_session())
+
+    def test_no_report_by_default(self):
+        """Test that commands don't time themselves without the options."""
+        out = StringIO()
+        call_command("list_components", stdout=out)
+
+        self.assertNotIn("Timings", out.getvalue())
+
+    def test_command_joins_active_session(self):
+        """Test that a command run inside a session leaves the report to its caller."""
+        out = StringIO()
+        with ProfilingSession() as session:
+            call_command("list_components", timings=True, stdout=out)
+
+        self.assertNotIn("Timings", out.getvalue())
+        self.assertIn(FILE_IO, session.durations)
+
+    def test_test_command_options(self):
+        """Test that the test command has --timings next to Django's --timing."""
+        parser = TestCommand().create_parser("manage.py", "test")
+
+        options = parser.parse_args(["--models", "--timings", "--timing", "--profile", "test.pstats"])
+
+        self.assertTrue(options.timings)
+        self.assertTrue(options.timing)
+        self.assertEqual(options.profile, "test.pstats")
+
+    def test_test_command_phases(self):
+        """Test that the test command times its test selection and run."""
+        out = StringIO()
+        with patch("django.core.management.commands.test.Command.handle") as mock_handle:
+            with ProfilingSession() as session:
+                call_command("test", "test_project.tests.profiling", timings=True, stdout=out)
+
+        mock_handle.assert_called_once()
+        self.assertEqual(set(session.durations), {TEST_SELECTION, TEST_RUN})
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.test import TestCase
+
+from smartcli import project
+
+
+class GetProjectTest(TestCase):
+    """Test get_project discovery and caching."""
+
+    def setUp(self):
+        """Set up a temporary project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manage_py = os.path.join(self.temp_dir, "manage.py")
+        self._write("manage.py", 'os.environ.setdefault("DJANGO_SETTINGS_MODULE", "shop.settings")\n')
+        self._write("shop/settings.py")
+        project.forget_projects()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        project.forget_projects()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative_path, content=""):
+        path = os.path.join(self.temp_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_discovers_project(self):
+        """Test that manage.py and the settings file are found."""
+        django_project = project.get_project(self.temp_dir)
+
+        self.assertEqual(django_project.root, self.temp_dir)
+        self.assertEqual(django_project.manage_py, self.manage_py)
+        self.assertEqual(django_project.settings_module, "shop.settings")
+        self.assertEqual(django_project.settings_file, os.path.join(self.temp_dir, "shop", "settings.py"))
+
+    def test_discovers_project_from_subdirectory(self):
+        """Test that parent directories are searched for manage.py."""
+        subdirectory = os.path.join(self.temp_dir, "apps", "users")
+        os.makedirs(subdirectory)
+
+        self.assertEqual(project.get_project(subdirectory).manage_py, self.manage_py)
+
+    def test_outside_project(self):
+        """Test that no project is found without manage.py."""
+        os.remove(self.manage_py)
+
+        self.assertIsNone(project.get_project(self.temp_dir))
+
+    def test_memoized_until_manage_py_changes(self):
+        """Test that manage.py is parsed again only when its mtime changes."""
+        project.get_project(self.temp_dir)
+
+        with patch("smartcli.project.read_settings_module", return_value="core.settings") as mock_read:
+            project.get_project(self.temp_dir)
+            mock_read.assert_not_called()
+
+            stat = os.stat(self.manage_py)
+            os.utime(self.manage_py, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            django_project = project.get_project(self.temp_dir)
+
+        mock_read.assert_called_once_with(self.manage_py)
+        self.assertEqual(django_project.settings_module, "core.settings")
+        self.assertIsNone(django_project.settings_file)
+
+    def test_resolve_settings_package(self):
+        """Test that settings packages resolve to their __init__.py."""
+        settings_file = self._write("core/settings/__init__.py")
+
+        self.assertEqual(project.resolve_settings_file(self.temp_dir, "core.settings"), settings_file)
+        self.assertIsNone(project.resolve_settings_file(self.temp_dir, "missing.settings"))
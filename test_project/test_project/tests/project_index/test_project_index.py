@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.test import TestCase
+
+from smartcli import transaction, utils
+from smartcli.project_index import ProjectIndex
+
+
+class ProjectIndexTest(TestCase):
+    """Test ProjectIndex scanning and caching."""
+
+    def setUp(self):
+        """Set up a temporary project with one app."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, ".smartcli", "index.json")
+        self.app_path = os.path.join(self.temp_dir, "apps", "users")
+        self._write("models/__init__.py", "from .user import User\n")
+        self._write(
+            "models/user.py",
+            "class UserManager(models.Manager):\n    pass\n\n\nclass User(models.Model):\n    pass\n",
+        )
+        self._write("serializers/user_serializer.py", "class UserSerializer:\n    pass\n")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative_path, content):
+        path = os.path.join(self.app_path, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _bump_mtime(self, relative_path):
+        path = os.path.join(self.app_path, relative_path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _components(self):
+        index = ProjectIndex.load(self.cache_file)
+        components = index.get_components(self.app_path)
+        index.save()
+        return components
+
+    def test_finds_component_classes(self):
+        """Test that component classes of the component directories are indexed."""
+        components = self._components()
+
+        self.assertEqual(list(components["model"]), ["User"])
+        self.assertEqual(
+            components["serializer"],
+            {"UserSerializer": os.path.join(self.app_path, "serializers", "user_serializer.py")},
+        )
+        self.assertEqual(components["service"], {})
+
+    def test_cached_index_skips_parsing(self):
+        """Test that a second run reuses the cache without parsing files."""
+        self._components()
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        with patch("smartcli.project_index._get_classes") as mock_parse:
+            components = self._components()
+
+        mock_parse.assert_not_called()
+        self.assertIn("User", components["model"])
+
+    def test_edited_file_is_parsed_again(self):
+        """Test that only the edited file is parsed again, even if its directory didn't change."""
+        self._components()
+        self._write("models/user.py", "class Account(models.Model):\n    pass\n")
+        self._bump_mtime("models/user.py")
+
+        with patch("smartcli.project_index._get_classes", return_value={"Account": ["Model"]}) as mock_parse:
+            components = self._components()
+
+        mock_parse.assert_called_once_with(os.path.join(self.app_path, "models", "user.py"))
+        self.assertEqual(list(components["model"]), ["Account"])
+
+    def test_unchanged_directories_are_not_listed(self):
+        """Test that only changed directories are listed again."""
+        self._components()
+        self._bump_mtime("serializers")
+
+        with patch("smartcli.project_index._list_component_files", return_value=[]) as mock_list:
+            self._components()
+
+        mock_list.assert_called_once_with(os.path.join(self.app_path, "serializers"))
+
+    def test_helper_classes_are_not_components(self):
+        """Test that managers, paginations and choices are not listed as components."""
+        self._write(
+            "models/order.py",
+            "class OrderStatus(models.TextChoices):\n    pass\n\n\n"
+            "class Order(BaseModel):\n    pass\n\n\n"
+            "class RushOrder(Order):\n    pass\n\n\n"
+            "class Account(AbstractUser):\n    pass\n",
+        )
+        self._write(
+            "views/order_view.py",
+            "class OrderPagination(CursorPagination):\n    pass\n\n\nclass OrderViewSet(ViewSet):\n    pass\n",
+        )
+
+        components = self._components()
+
+        self.assertEqual(sorted(components["model"]), ["Account", "Order", "RushOrder", "User"])
+        self.assertEqual(list(components["view"]), ["OrderViewSet"])
+
+    def test_added_and_removed_files(self):
+        """Test that adding or removing files is picked up on the next run."""
+        self._components()
+        self._write("services/user_service.py", "class UserService:\n    pass\n")
+        os.remove(os.path.join(self.app_path, "serializers", "user_serializer.py"))
+        self._bump_mtime("serializers")
+
+        components = self._components()
+
+        self.assertIn("UserService", components["service"])
+        self.assertEqual(components["serializer"], {})
+
+    def test_has_component(self):
+        """Test lookups by model name, including files staged in a write transaction."""
+        index = ProjectIndex.load(self.cache_file)
+
+        self.assertTrue(index.has_component(self.app_path, "model", "User"))
+        self.assertTrue(index.has_component(self.app_path, "serializer", "User"))
+        self.assertFalse(index.has_component(self.app_path, "service", "User"))
+
+        with transaction.use_transaction(transaction.WriteTransaction()):
+            utils.write_file_content(os.path.join(self.app_path, "services", "user_service.py"), "")
+            self.assertTrue(index.has_component(self.app_path, "service", "User"))
+
+    def test_missing_app_is_not_cached(self):
+        """Test that an app directory that doesn't exist leaves the cache untouched."""
+        index = ProjectIndex.load(self.cache_file)
+
+        self.assertFalse(index.has_component(os.path.join(self.temp_dir, "missing"), "model", "User"))
+        index.save()
+
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_syntax_error_file_has_no_classes(self):
+        """Test that files that can't be parsed are indexed without classes."""
+        self._write("views/user_view.py", "class UserView(:\n")
+
+        self.assertEqual(self._components()["view"], {})
+
+    def test_invalid_cache_file_is_ignored(self):
+        """Test that a corrupted cache file is rebuilt."""
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertIn("User", self._components()["model"])
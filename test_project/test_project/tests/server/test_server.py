@@ -0,0 +1,171 @@
+import io
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from smartcli import server
+
+
+class SocketPathTest(TestCase):
+    """Test get_socket_path function."""
+
+    def test_socket_path_is_stable_per_project(self):
+        """Test that the same project always gets the same socket."""
+        self.assertEqual(server.get_socket_path("/project/a"), server.get_socket_path("/project/a"))
+
+    def test_socket_path_differs_between_projects(self):
+        """Test that two projects get different sockets."""
+        self.assertNotEqual(server.get_socket_path("/project/a"), server.get_socket_path("/project/b"))
+
+    def test_socket_path_in_runtime_directory(self):
+        """Test that sockets go to $XDG_RUNTIME_DIR when it is set."""
+        runtime_dir = tempfile.mkdtemp()
+        try:
+            with patch.dict(os.environ, {"XDG_RUNTIME_DIR": runtime_dir}):
+                self.assertEqual(os.path.dirname(server.get_socket_path("/project/a")), runtime_dir)
+        finally:
+            os.rmdir(runtime_dir)
+
+    def test_socket_path_in_user_directory(self):
+        """Test that sockets go to a per-user directory without $XDG_RUNTIME_DIR."""
+        with patch.dict(os.environ, {"XDG_RUNTIME_DIR": ""}):
+            socket_directory = os.path.dirname(server.get_socket_path("/project/a"))
+        self.assertEqual(os.path.dirname(socket_directory), tempfile.gettempdir())
+        self.assertTrue(os.path.basename(socket_directory).startswith("smartcli-"))
+
+
+class PrivateDirectoryTest(TestCase):
+    """Test is_private_directory function."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        os.chmod(self.temp_dir, 0o700)
+        os.rmdir(self.temp_dir)
+
+    def test_private_directory(self):
+        """Test that a 0700 directory of the current user is private."""
+        self.assertTrue(server.is_private_directory(self.temp_dir))
+
+    def test_shared_directory(self):
+        """Test that a directory readable by others is not private."""
+        os.chmod(self.temp_dir, 0o755)
+        self.assertFalse(server.is_private_directory(self.temp_dir))
+
+    def test_missing_directory(self):
+        """Test that a missing directory is not private."""
+        self.assertFalse(server.is_private_directory(os.path.join(self.temp_dir, "missing")))
+
+
+class ForwardCommandTest(TestCase):
+    """Test the client side of the server protocol."""
+
+    def test_forward_command_without_server(self):
+        """Test that forward_command returns None when no server is running."""
+        socket_path = os.path.join(tempfile.gettempdir(), "smartcli-missing.sock")
+        self.assertIsNone(server.forward_command("create_model", ["User", "users"], socket_path))
+
+    def test_forward_command_in_shared_directory(self):
+        """Test that sockets in a directory other users can write to are ignored."""
+        temp_dir = tempfile.mkdtemp()
+        os.chmod(temp_dir, 0o777)
+        try:
+            socket_path = os.path.join(temp_dir, "test.sock")
+            with patch("smartcli.server.os.path.exists", return_value=True), \
+                    patch("smartcli.server.socket.socket") as mock_socket:
+                self.assertIsNone(server.forward_command("create_model", ["User", "users"], socket_path))
+            mock_socket.assert_not_called()
+        finally:
+            os.rmdir(temp_dir)
+
+    def test_stop_server_without_server(self):
+        """Test that stop_server returns False when no server is running."""
+        socket_path = os.path.join(tempfile.gettempdir(), "smartcli-missing.sock")
+        self.assertFalse(server.stop_server(socket_path))
+
+
+@skipUnless(hasattr(server.socket, "AF_UNIX"), "Unix domain sockets are required")
+class ServeTest(TestCase):
+    """Test a full round trip between the client and the server."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.temp_dir, "test.sock")
+        self.print_patch = patch("builtins.print")
+        self.print_patch.start()
+        self.thread = threading.Thread(target=server.serve, args=(self.socket_path,))
+        self.thread.start()
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.01)
+
+    def tearDown(self):
+        server.stop_server(self.socket_path)
+        self.thread.join(timeout=5)
+        self.print_patch.stop()
+        os.rmdir(self.temp_dir)
+
+    def test_forward_command_streams_output(self):
+        """Test that the command output and exit code are forwarded."""
+        def fake_execute(command, args, stdout, stderr):
+            stdout.write(f"ran {command} {' '.join(args)}\n")
+            return 0
+
+        with patch("smartcli.cli.execute_django_command", side_effect=fake_execute):
+            with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+                exit_code = server.forward_command("create_model", ["User", "users"], self.socket_path)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(mock_stdout.getvalue(), "ran create_model User users\n")
+
+    def test_forward_command_error(self):
+        """Test that exceptions are reported with a non-zero exit code."""
+        with patch("smartcli.cli.execute_django_command", side_effect=ValueError("boom")):
+            with patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+                exit_code = server.forward_command("create_model", ["User", "users"], self.socket_path)
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("boom", mock_stderr.getvalue())
+
+    def test_model_command_with_unchanged_models(self):
+        """Test that model-driven commands run on the server while the models are unchanged."""
+        with patch("smartcli.cli.execute_django_command", return_value=0) as mock_execute:
+            exit_code = server.forward_command("create_serializer", ["User", "users"], self.socket_path)
+
+        self.assertEqual(exit_code, 0)
+        mock_execute.assert_called_once()
+
+    def test_model_command_with_changed_models(self):
+        """Test that model-driven commands are left to the client once a models file changed."""
+        with patch("smartcli.introspection.get_models_mtimes", return_value={"/app/models/user.py": 1}), \
+                patch("smartcli.cli.execute_django_command") as mock_execute, \
+                patch("sys.stderr", new_callable=io.StringIO) as mock_stderr:
+            exit_code = server.forward_command("create_serializer", ["User", "users"], self.socket_path)
+
+        self.assertIsNone(exit_code)
+        mock_execute.assert_not_called()
+        self.assertIn("Models changed since the SmartCLI server started", mock_stderr.getvalue())
+
+    def test_other_command_with_changed_models(self):
+        """Test that commands that don't read the models still run on the server."""
+        with patch("smartcli.introspection.get_models_mtimes", return_value={"/app/models/user.py": 1}), \
+                patch("smartcli.cli.execute_django_command", return_value=0):
+            exit_code = server.forward_command("create_service", ["User", "users"], self.socket_path)
+
+        self.assertEqual(exit_code, 0)
+
+    def test_socket_is_private(self):
+        """Test that the socket is only accessible by its owner."""
+        self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+
+    def test_unsupported_command(self):
+        """Test that commands outside SERVED_COMMANDS are rejected."""
+        with patch("sys.stderr", new_callable=io.StringIO):
+            exit_code = server.forward_command("flush", [], self.socket_path)
+
+        self.assertEqual(exit_code, 1)
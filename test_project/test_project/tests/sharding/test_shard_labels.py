@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+from django.test import TestCase
+
+from smartcli.sharding import load_label_durations, shard_labels
+
+
+class ShardLabelsTest(TestCase):
+    """Test shard_labels function."""
+
+    def setUp(self):
+        self.labels = [f"apps.users.tests.views.test_{index}" for index in range(10)]
+
+    def test_shards_cover_all_labels_once(self):
+        """Test that every label belongs to exactly one shard."""
+        shards = [shard_labels(self.labels, index, 3) for index in range(3)]
+
+        all_labels = [label for shard in shards for label in shard]
+        self.assertCountEqual(all_labels, self.labels)
+        self.assertEqual(sorted(len(shard) for shard in shards), [3, 3, 4])
+
+    def test_shards_are_deterministic(self):
+        """Test that the split does not depend on the label order."""
+        reversed_labels = list(reversed(self.labels))
+        for index in range(3):
+            with self.subTest(index=index):
+                self.assertCountEqual(
+                    shard_labels(self.labels, index, 3), shard_labels(reversed_labels, index, 3)
+                )
+
+    def test_shard_keeps_label_order(self):
+        """Test that a shard lists its labels in the original order."""
+        shard = shard_labels(self.labels, 0, 2)
+        self.assertEqual(shard, [label for label in self.labels if label in shard])
+
+    def test_balanced_by_durations(self):
+        """Test that a slow label gets a shard on its own."""
+        labels = ["slow", "a", "b", "c", "d"]
+        durations = {"slow": 40.0, "a": 10.0, "b": 10.0, "c": 10.0, "d": 10.0}
+
+        self.assertEqual(shard_labels(labels, 0, 2, durations), ["slow"])
+        self.assertEqual(shard_labels(labels, 1, 2, durations), ["a", "b", "c", "d"])
+
+    def test_unknown_durations_use_average(self):
+        """Test that labels without duration weigh the average known duration."""
+        labels = ["slow", "fast", "new"]
+        durations = {"slow": 10.0, "fast": 2.0}
+
+        # new weighs 6s: slow | new + fast
+        self.assertEqual(shard_labels(labels, 0, 2, durations), ["slow"])
+        self.assertEqual(shard_labels(labels, 1, 2, durations), ["fast", "new"])
+
+    def test_more_shards_than_labels(self):
+        """Test that extra shards are empty."""
+        self.assertEqual(shard_labels(["a"], 1, 2), [])
+
+    def test_invalid_shard(self):
+        """Test that invalid indexes and counts raise ValueError."""
+        for shard_index, shard_count in [(0, 0), (2, 2), (-1, 2)]:
+            with self.subTest(shard_index=shard_index, shard_count=shard_count):
+                with self.assertRaises(ValueError):
+                    shard_labels(self.labels, shard_index, shard_count)
+
+
+class LoadLabelDurationsTest(TestCase):
+    """Test load_label_durations function."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.durations_file = os.path.join(self.temp_dir, "durations.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_durations(self):
+        """Test that valid durations are loaded and invalid ones skipped."""
+        with open(self.durations_file, "w", encoding="utf-8") as f:
+            json.dump({"a": 1.5, "b": 2, "c": "slow", "d": -1}, f)
+
+        self.assertEqual(load_label_durations(self.durations_file), {"a": 1.5, "b": 2.0})
+
+    def test_missing_or_invalid_file(self):
+        """Test that a missing or invalid file gives no durations."""
+        self.assertEqual(load_label_durations(self.durations_file), {})
+
+        with open(self.durations_file, "w", encoding="utf-8") as f:
+            f.write("[not a mapping")
+        self.assertEqual(load_label_durations(self.durations_file), {})
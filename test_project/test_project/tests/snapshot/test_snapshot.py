@@ -0,0 +1,179 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest.mock import patch
+from django.test import SimpleTestCase
+
+from smartcli.snapshot import DatabaseSnapshot, SnapshotRunnerMixin, get_migrations_hash
+
+
+class FakeConnection:
+    """SQLite connection stand-in exposing what DatabaseSnapshot uses."""
+
+    vendor = "sqlite"
+
+    def __init__(self, name):
+        self.settings_dict = {"NAME": name, "TEST": {"NAME": None}}
+        self.connection = None
+
+    def ensure_connection(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.settings_dict["NAME"])
+
+
+class MigrationsHashTest(SimpleTestCase):
+    """Test get_migrations_hash."""
+
+    def setUp(self):
+        """Set up a temporary migrations directory used for every app."""
+        self.temp_dir = tempfile.mkdtemp()
+        self._write("0001_initial.py", "initial")
+        patcher = patch("smartcli.snapshot.get_migrations_directory", return_value=self.temp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        with open(os.path.join(self.temp_dir, name), "w") as f:
+            f.write(content)
+
+    def test_hash_is_stable(self):
+        """Test that the hash only depends on the migration files."""
+        self.assertEqual(get_migrations_hash(), get_migrations_hash())
+
+    def test_hash_changes_with_migrations(self):
+        """Test that adding or editing a migration changes the hash."""
+        initial = get_migrations_hash()
+
+        self._write("0002_add_field.py", "add field")
+        added = get_migrations_hash()
+        self._write("0002_add_field.py", "add another field")
+
+        self.assertNotEqual(initial, added)
+        self.assertNotEqual(added, get_migrations_hash())
+
+    def test_non_python_files_are_ignored(self):
+        """Test that compiled or other files don't change the hash."""
+        initial = get_migrations_hash()
+
+        self._write("README.txt", "notes")
+
+        self.assertEqual(initial, get_migrations_hash())
+
+
+class DatabaseSnapshotTest(SimpleTestCase):
+    """Test DatabaseSnapshot restore and save."""
+
+    def setUp(self):
+        """Set up a fake SQLite alias and a snapshot directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.temp_dir, "test_db")
+        self.connection = FakeConnection(os.path.join(self.temp_dir, "db.sqlite3"))
+        patcher = patch("smartcli.snapshot.connections", {"default": self.connection})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _migrate(self, snapshot):
+        """Simulate the runner creating and migrating the test database."""
+        self.connection.settings_dict["NAME"] = snapshot.database_path
+        self.connection.ensure_connection()
+        self.connection.connection.execute("CREATE TABLE migrated (id INTEGER)")
+        self.connection.connection.commit()
+
+    def test_restore_without_template(self):
+        """Test that the test database is redirected and starts empty."""
+        snapshot = DatabaseSnapshot("default", "abc", self.directory)
+        os.makedirs(self.directory)
+        open(snapshot.database_path, "w").close()
+
+        self.assertFalse(snapshot.restore())
+        self.assertFalse(os.path.exists(snapshot.database_path))
+        self.assertEqual(self.connection.settings_dict["TEST"]["NAME"], snapshot.database_path)
+
+        snapshot.release()
+        self.assertIsNone(self.connection.settings_dict["TEST"]["NAME"])
+
+    def test_save_then_restore(self):
+        """Test that a saved template is copied in by the next run."""
+        snapshot = DatabaseSnapshot("default", "abc", self.directory)
+        snapshot.restore()
+        self._migrate(snapshot)
+
+        self.assertTrue(snapshot.save())
+        self.connection.connection.close()
+
+        restored = DatabaseSnapshot("default", "abc", self.directory)
+        self.assertTrue(restored.restore())
+        tables = sqlite3.connect(restored.database_path).execute("SELECT name FROM sqlite_master").fetchall()
+        self.assertEqual(tables, [("migrated",)])
+
+    def test_save_removes_outdated_templates(self):
+        """Test that templates of other migration states are removed."""
+        os.makedirs(self.directory)
+        outdated = os.path.join(self.directory, "default-old.sqlite3")
+        other_alias = os.path.join(self.directory, "other-old.sqlite3")
+        open(outdated, "w").close()
+        open(other_alias, "w").close()
+        snapshot = DatabaseSnapshot("default", "new", self.directory)
+        snapshot.restore()
+        self._migrate(snapshot)
+
+        snapshot.save()
+
+        self.assertFalse(os.path.exists(outdated))
+        self.assertTrue(os.path.exists(other_alias))
+        self.assertTrue(os.path.exists(snapshot.template_path))
+
+    def test_restore_removes_parallel_clones(self):
+        """Test that clones kept by --keepdb are rebuilt from the restored database."""
+        snapshot = DatabaseSnapshot("default", "abc", self.directory)
+        os.makedirs(self.directory)
+        clone = os.path.join(self.directory, "default_1.sqlite3")
+        open(clone, "w").close()
+
+        snapshot.restore()
+
+        self.assertFalse(os.path.exists(clone))
+
+    def test_save_skips_unused_alias(self):
+        """Test that aliases without test database are not saved."""
+        snapshot = DatabaseSnapshot("default", "abc", self.directory)
+        snapshot.restore()
+
+        self.assertFalse(snapshot.save())
+        self.assertFalse(os.path.exists(snapshot.template_path))
+
+
+class SnapshotRunnerMixinTest(SimpleTestCase):
+    """Test SnapshotRunnerMixin."""
+
+    def test_saves_new_snapshots_after_setup(self):
+        """Test that only snapshots without template are saved."""
+
+        class BaseRunner:
+            def __init__(self, **kwargs):
+                pass
+
+            def setup_databases(self, **kwargs):
+                return "old config"
+
+            def log(self, msg, level=None):
+                pass
+
+        class Runner(SnapshotRunnerMixin, BaseRunner):
+            pass
+
+        new, restored = DatabaseSnapshot("default", "abc"), DatabaseSnapshot("other", "abc")
+        restored.restored = True
+        with patch.object(DatabaseSnapshot, "save", autospec=True, return_value=True) as mock_save:
+            self.assertEqual(Runner(db_snapshots=[new, restored]).setup_databases(), "old config")
+
+        mock_save.assert_called_once_with(new)
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+from django.test import TestCase
+
+from smartcli import spec
+
+
+class LoadSpecTest(TestCase):
+    """Test spec file loading."""
+
+    def setUp(self):
+        """Set up temporary directory for spec files."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        for filename in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, filename))
+        os.rmdir(self.temp_dir)
+
+    def _write_spec(self, filename, content):
+        path = os.path.join(self.temp_dir, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_load_json_spec(self):
+        """Test loading a JSON spec."""
+        path = self._write_spec("spec.json", json.dumps({
+            "apps": {"users": {"models": ["User"], "serializers": [{"name": "UserDetail", "model": "User"}]}}
+        }))
+
+        result = spec.load_spec(path)
+
+        self.assertEqual(result["users"]["models"], [{"name": "User"}])
+        self.assertEqual(result["users"]["serializers"], [{"name": "UserDetail", "model": "User"}])
+        self.assertEqual(result["users"]["views"], [])
+
+    def test_load_yaml_spec(self):
+        """Test loading a YAML spec."""
+        path = self._write_spec("spec.yaml", "apps:\n  users:\n    models: [User]\n    services: [User]\n")
+
+        result = spec.load_spec(path)
+
+        self.assertEqual(result["users"]["models"], [{"name": "User"}])
+        self.assertEqual(result["users"]["services"], [{"name": "User"}])
+
+    def test_load_toml_spec(self):
+        """Test loading a TOML spec."""
+        path = self._write_spec("spec.toml", '[apps.users]\nmodels = ["User"]\nviews = ["User"]\n')
+
+        result = spec.load_spec(path)
+
+        self.assertEqual(result["users"]["models"], [{"name": "User"}])
+        self.assertEqual(result["users"]["views"], [{"name": "User"}])
+
+    def test_load_app_without_components(self):
+        """Test that an app without components only creates the module."""
+        path = self._write_spec("spec.json", '{"apps": {"users": null}}')
+
+        result = spec.load_spec(path)
+
+        self.assertEqual(list(result), ["users"])
+        self.assertTrue(all(items == [] for items in result["users"].values()))
+
+    def test_load_missing_file(self):
+        """Test loading a spec file that doesn't exist."""
+        with self.assertRaises(ValueError) as cm:
+            spec.load_spec(os.path.join(self.temp_dir, "missing.json"))
+        self.assertIn("does not exist", str(cm.exception))
+
+    def test_load_unsupported_format(self):
+        """Test loading a spec with an unsupported extension."""
+        path = self._write_spec("spec.txt", "apps: {}")
+        with self.assertRaises(ValueError) as cm:
+            spec.load_spec(path)
+        self.assertIn("Unsupported spec format", str(cm.exception))
+
+    def test_load_invalid_json(self):
+        """Test loading an invalid JSON spec."""
+        path = self._write_spec("spec.json", "{invalid")
+        with self.assertRaises(ValueError) as cm:
+            spec.load_spec(path)
+        self.assertIn("Invalid JSON spec", str(cm.exception))
+
+
+class NormalizeSpecTest(TestCase):
+    """Test spec validation and normalization."""
+
+    def test_missing_apps(self):
+        """Test that a spec without 'apps' is rejected."""
+        with self.assertRaises(ValueError):
+            spec.normalize_spec({"models": ["User"]})
+
+    def test_invalid_app_name(self):
+        """Test that app names must be valid identifiers."""
+        with self.assertRaises(ValueError) as cm:
+            spec.normalize_spec({"apps": {"123users": {}}})
+        self.assertIn("not a valid Python identifier", str(cm.exception))
+
+    def test_unknown_section(self):
+        """Test that unknown sections are rejected."""
+        with self.assertRaises(ValueError) as cm:
+            spec.normalize_spec({"apps": {"users": {"forms": ["User"]}}})
+        self.assertIn("Unknown section(s) in app 'users': forms", str(cm.exception))
+
+    def test_model_option_not_allowed(self):
+        """Test that 'model' is only accepted for serializers and views."""
+        with self.assertRaises(ValueError) as cm:
+            spec.normalize_spec({"apps": {"users": {"services": [{"name": "User", "model": "User"}]}}})
+        self.assertIn("Unknown option(s)", str(cm.exception))
+
+    def test_invalid_entry(self):
+        """Test that entries must be names or mappings with a name."""
+        with self.assertRaises(ValueError):
+            spec.normalize_spec({"apps": {"users": {"models": [{"model": "User"}]}}})
@@ -1,6 +1,10 @@
+import re
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from smartcli import templates
+from smartcli.config import TEMPLATE_CONFIGS
 
 
 class ModelTemplatesTest(TestCase):
@@ -40,10 +44,10 @@ class ModelTemplatesTest(TestCase):
 
     def test_factory_template_basic(self):
         """Test basic factory template generation."""
-        result = templates.ModelTemplates.factory_template("UserFactory", "User", "users")
+        result = templates.ModelTemplates.factory_template("User", "User", "users")
         
         # Check that the template contains expected elements
-        self.assertIn("class UserFactoryFactory(factory.django.DjangoModelFactory):", result)
+        self.assertIn("class UserFactory(factory.django.DjangoModelFactory):", result)
         self.assertIn("class Meta:", result)
         self.assertIn("model = User", result)
         self.assertIn("from users.models import User", result)
@@ -52,10 +56,10 @@ class ModelTemplatesTest(TestCase):
 
     def test_factory_template_with_complex_name(self):
         """Test factory template with complex names."""
-        result = templates.ModelTemplates.factory_template("ProductCategoryFactory", "ProductCategory", "products")
+        result = templates.ModelTemplates.factory_template("ProductCategory", "ProductCategory", "products")
         
         # Check that the template contains expected elements
-        self.assertIn("class ProductCategoryFactoryFactory(factory.django.DjangoModelFactory):", result)
+        self.assertIn("class ProductCategoryFactory(factory.django.DjangoModelFactory):", result)
         self.assertIn("model = ProductCategory", result)
         self.assertIn("from products.models import ProductCategory", result)
 
@@ -91,4 +95,87 @@ class ModelTemplatesTest(TestCase):
         self.assertIn("class OrderItemModelTest(TestCase):", result)
         self.assertIn("class OrderItemManagerTest(TestCase):", result)
         self.assertIn("cls.orderitem = OrderItem.objects.create()", result)
-        self.assertIn("def test_orderitem_creation(self):", result) 
\ No newline at end of file
+        self.assertIn("def test_orderitem_creation(self):", result)
+
+    def test_factory_template_with_declarations(self):
+        """Test factory template with introspected declarations and many-to-many fields."""
+        result = templates.ModelTemplates.factory_template(
+            "Group", "Group", "auth", ['name = factory.Sequence(lambda n: f"name-{n}")'], ["permissions"]
+        )
+
+        self.assertIn('    name = factory.Sequence(lambda n: f"name-{n}")', result)
+        self.assertIn("@factory.post_generation", result)
+        self.assertIn("def permissions(self, create, extracted, **kwargs):", result)
+        self.assertIn("self.permissions.set(extracted)", result)
+        # timezone is only imported when a declaration uses it
+        self.assertNotIn("from django.utils import timezone", result)
+        compile(result, "group_factory.py", "exec")
+
+    def test_model_template_indexes(self):
+        """Test that models get a partial index on active rows and a created_at index."""
+        result = templates.ModelTemplates.model_template("OrderLine", "shop")
+
+        self.assertIn("class Meta:", result)
+        self.assertIn('fields=["-created_at"],', result)
+        self.assertIn("condition=models.Q(deleted_at__isnull=True),", result)
+        self.assertIn('name="shop_order_line_active_idx",', result)
+        self.assertIn('models.Index(fields=["created_at"], name="shop_order_line_created_idx"),', result)
+        compile(result, "order_line.py", "exec")
+
+    def test_model_template_index_names_are_shortened(self):
+        """Test that index names fit the 30 characters allowed by Django."""
+        result = templates.ModelTemplates.model_template("WarehouseLocationItem", "inventory")
+
+        for name in re.findall(r'name="([^"]+)"', result):
+            self.assertLessEqual(len(name), 30)
+            self.assertTrue(name.startswith("inventory_w"))
+
+    def test_model_template_without_indexes(self):
+        """Test that indexes can be disabled in TEMPLATE_CONFIGS."""
+        config = {**TEMPLATE_CONFIGS["model"], "active_index_fields": [], "created_at_index": False}
+        with patch.dict(TEMPLATE_CONFIGS, {"model": config}):
+            result = templates.ModelTemplates.model_template("Product", "shop")
+
+        self.assertNotIn("class Meta:", result)
+        self.assertIn("    objects = ProductManager()\n\n    def __str__(self):", result)
+
+    def test_model_template_str(self):
+        """Test that models are represented by their ID, as the generated tests expect."""
+        result = templates.ModelTemplates.model_template("Product")
+
+        self.assertIn("    def __str__(self):\n", result)
+        self.assertIn("        return str(self.id)\n", result)
+
+    def test_model_template_cached(self):
+        """Test that cached models read get_by_id through the cache and invalidate it."""
+        result = templates.ModelTemplates.model_template("Product", "shop", cached=True)
+
+        self.assertIn("from django.core.cache import cache", result)
+        self.assertIn("cache_version = 1", result)
+        self.assertIn("cache_timeout = 300", result)
+        self.assertIn("product = cache.get(key, version=self.cache_version)", result)
+        self.assertIn("cache.set(key, product, self.cache_timeout, version=self.cache_version)", result)
+        self.assertIn("transaction.on_commit(delete_keys)", result)
+        self.assertIn("        Product.objects.invalidate(self.pk)", result)
+        self.assertIn("        Product.objects.invalidate(pk)", result)
+        compile(result, "product.py", "exec")
+
+    def test_model_template_not_cached_by_default(self):
+        """Test that models don't use the cache unless asked."""
+        result = templates.ModelTemplates.model_template("Product", "shop")
+
+        self.assertNotIn("cache", result)
+        self.assertNotIn("def save(", result)
+
+    def test_model_test_template_cached(self):
+        """Test that cached models get hit/miss and invalidation tests against the locmem cache."""
+        result = templates.ModelTemplates.model_test_template("Product", "shop", cached=True)
+
+        self.assertIn("django.core.cache.backends.locmem.LocMemCache", result)
+        self.assertIn("class ProductCacheTest(TestCase):", result)
+        self.assertIn("def test_get_by_id_miss_then_hit(self):", result)
+        self.assertIn("with self.assertNumQueries(0):", result)
+        self.assertIn("def test_soft_delete_invalidates_cache(self):", result)
+        self.assertIn("def test_delete_invalidates_cache(self):", result)
+        self.assertNotIn("CacheTest", templates.ModelTemplates.model_test_template("Product", "shop"))
+        compile(result, "test_product.py", "exec")
@@ -97,4 +97,24 @@ class SerializerTemplatesTest(TestCase):
         
         # Check docstring
         self.assertIn('"""', result)
-        self.assertIn("Tests for the UserSerializerSerializer.", result) 
\ No newline at end of file
+        self.assertIn("Tests for the UserSerializerSerializer.", result)
+
+    def test_serializer_template_with_model_fields(self):
+        """Test that introspected fields replace the base fields."""
+        result = templates.SerializerTemplates.serializer_template(
+            "Group", "Group", "auth", ["id", "name", "permissions"], ["id"]
+        )
+
+        self.assertIn('            "permissions",\n        ]\n        read_only_fields = [\n            "id",\n        ]', result)
+        compile(result, "group_serializer.py", "exec")
+
+    def test_serializer_test_template_with_model_fields(self):
+        """Test that the expected fields of the tests follow the introspected fields."""
+        result = templates.SerializerTemplates.serializer_test_template(
+            "Group", "Group", "auth", ["id", "name", "permissions"], ["id"]
+        )
+
+        self.assertIn('expected_fields = ["id", "name", "permissions"]', result)
+        self.assertIn('expected_read_only = ["id"]', result)
+        self.assertIn("cls.serializer = GroupSerializer(cls.group)", result)
+        compile(result, "test_group_serializer.py", "exec")
@@ -141,7 +141,9 @@ class ViewTemplatesTest(TestCase):
         self.assertIn("from unittest.mock import patch", result)
         self.assertIn("from django.urls import reverse", result)
         self.assertIn("from rest_framework import status", result)
-        self.assertIn("from rest_framework.test import TestCase", result)
+        self.assertIn("from django.test import TestCase", result)
+        self.assertIn("from rest_framework.test import APIRequestFactory, force_authenticate", result)
+        self.assertIn("from users.views.user_view_set_view import UserViewSetViewSet", result)
 
     def test_view_template_class_docstring(self):
         """Test that view template includes proper class docstring."""
@@ -166,4 +168,78 @@ class ViewTemplatesTest(TestCase):
         # Check setUpTestData method
         self.assertIn("@classmethod", result)
         self.assertIn("def setUpTestData(cls):", result)
-        self.assertIn("Set up test data shared across all test methods.", result) 
\ No newline at end of file
+        self.assertIn("Set up test data shared across all test methods.", result)
+
+    def test_view_test_template_query_budget(self):
+        """Test that view tests guard list, retrieve and create query counts."""
+        result = templates.ViewTemplates.view_test_template("User", "User", "users")
+
+        self.assertIn("class UserViewSetQueryBudgetTest(TestCase):", result)
+        self.assertIn("LIST_QUERIES = 1", result)
+        self.assertIn("RETRIEVE_QUERIES = 1", result)
+        self.assertIn("CREATE_QUERIES = 3", result)
+        self.assertIn("cls.users = UserFactory.create_batch(3)", result)
+        self.assertIn("self.assertWithinBudget(queries, self.LIST_QUERIES)", result)
+        self.assertIn("self.assertWithinBudget(queries, self.RETRIEVE_QUERIES)", result)
+        self.assertIn("self.assertWithinBudget(queries, self.CREATE_QUERIES)", result)
+        self.assertIn("self.assertLessEqual(len(queries), budget,", result)
+        self.assertNotIn("assertNumQueries", result)
+        compile(result, "test_user_view.py", "exec")
+
+    def test_view_test_template_query_budget_skipped_until_implemented(self):
+        """Test that budget tests of stub actions are skipped, those of implemented actions run."""
+        skip_line = '@skip("Implement the UserViewSet actions, then enable their query budget tests")\n'
+
+        stub = templates.ViewTemplates.view_test_template("User", "User", "users")
+        implemented = templates.ViewTemplates.view_test_template("User", "User", "users", implemented=True)
+
+        self.assertIn(skip_line + "class UserViewSetQueryBudgetTest(TestCase):", stub)
+        self.assertNotIn(skip_line, implemented)
+
+    def test_view_test_template_create_payload(self):
+        """Test that the create budget test posts a valid payload made by the factory."""
+        result = templates.ViewTemplates.view_test_template("User", "User", "users", implemented=True)
+
+        self.assertIn("from users.serializers import UserSerializer", result)
+        self.assertIn("user = UserFactory.create()", result)
+        self.assertIn("if not serializer.fields[field_name].read_only", result)
+        self.assertIn("User.objects.filter(pk=user.pk).delete()", result)
+        self.assertIn('response = self._call("post", "create", payload)', result)
+        self.assertIn("self.assertEqual(response.status_code, HTTPStatus.CREATED, response.data)", result)
+
+    def test_view_test_template_custom_query_budget(self):
+        """Test that the query budget can be configured."""
+        result = templates.ViewTemplates.view_test_template(
+            "User", "User", "users", query_budget={"list": 2, "retrieve": 1, "create": 4}
+        )
+
+        self.assertIn("LIST_QUERIES = 2", result)
+        self.assertIn("CREATE_QUERIES = 4", result)
+
+    def test_implemented_view_template(self):
+        """Test that implemented views paginate an optimized queryset of active objects."""
+        result = templates.ViewTemplates.implemented_view_template(
+            "Order", "Order", "orders", ["id", "created_at", "customer"], ["customer"], ["products"], 50, "-created_at"
+        )
+
+        self.assertIn("class OrderPagination(CursorPagination):", result)
+        self.assertIn("page_size = 50", result)
+        self.assertIn('ordering = "-created_at"', result)
+        self.assertIn("pagination_class = OrderPagination", result)
+        self.assertIn("Order.objects.get_active()", result)
+        self.assertIn('.select_related("customer")', result)
+        self.assertIn('.prefetch_related("products")', result)
+        self.assertIn('.only("id", "created_at", "customer")', result)
+        self.assertIn("with transaction.atomic():", result)
+        compile(result, "order_view.py", "exec")
+
+    def test_implemented_view_template_without_relations(self):
+        """Test that no select_related()/prefetch_related() is generated without relations."""
+        result = templates.ViewTemplates.implemented_view_template(
+            "Tag", "Tag", "tags", ["id", "created_at"], [], [], 20, "-created_at"
+        )
+
+        self.assertNotIn("select_related", result)
+        self.assertNotIn("prefetch_related", result)
+        self.assertIn("page_size = 20", result)
+        compile(result, "tag_view.py", "exec")
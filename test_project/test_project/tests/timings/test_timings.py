@@ -0,0 +1,151 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from django.core.management.color import no_style
+from django.test import TestCase
+from django.test.runner import DiscoverRunner
+
+from smartcli.runner import ExtendedTestRunner
+from smartcli.timings import (
+    TimingHistory, TimingRecorder, TimingRunnerMixin, get_test_category, get_test_label,
+)
+
+
+class _SampleTest(unittest.TestCase):
+    def test_one(self):
+        pass
+
+    def test_two(self):
+        pass
+
+
+class TimingHelpersTest(TestCase):
+    """Test get_test_label and get_test_category functions."""
+
+    def test_get_test_label(self):
+        """Test that the test module is extracted from a test id."""
+        self.assertEqual(
+            get_test_label("apps.users.tests.models.test_user.UserTest.test_create"),
+            "apps.users.tests.models.test_user",
+        )
+
+    def test_get_test_category(self):
+        """Test categories of labels inside and outside tests/<category>/."""
+        cases = [
+            ("apps.users.tests.models.test_user", "models"),
+            ("users.tests.views.nested.test_list", "views"),
+            ("apps.users.tests.test_misc", "other"),
+        ]
+        for label, expected in cases:
+            with self.subTest(label=label):
+                self.assertEqual(get_test_category(label), expected)
+
+
+class TimingHistoryTest(TestCase):
+    """Test TimingHistory class."""
+
+    def setUp(self):
+        """Set up a temporary history database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.history = TimingHistory(os.path.join(self.temp_dir, "timings.sqlite3"))
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_slowest_tests_per_category(self):
+        """Test that the slowest tests of a run are grouped by category."""
+        run_id = self.history.record_run([
+            ("app.tests.models.test_a.ATest.test_fast", 0.1),
+            ("app.tests.models.test_a.ATest.test_slow", 2.0),
+            ("app.tests.models.test_b.BTest.test_medium", 1.0),
+            ("app.tests.views.test_c.CTest.test_view", 0.5),
+        ])
+
+        slowest = self.history.get_slowest_tests(run_id, 2)
+
+        self.assertEqual(
+            slowest["models"],
+            [("app.tests.models.test_a.ATest.test_slow", 2.0), ("app.tests.models.test_b.BTest.test_medium", 1.0)],
+        )
+        self.assertEqual(slowest["views"], [("app.tests.views.test_c.CTest.test_view", 0.5)])
+
+    def test_label_durations_average_recent_runs(self):
+        """Test that file durations are summed per run and averaged over recent runs."""
+        self.history.record_run([("app.tests.test_a.ATest.test_x", 1.0), ("app.tests.test_a.ATest.test_y", 1.0)])
+        self.history.record_run([("app.tests.test_a.ATest.test_x", 3.0), ("app.tests.test_a.ATest.test_y", 1.0)])
+        self.history.record_run([("app.tests.test_a.ATest.test_x", 5.0), ("app.tests.test_a.ATest.test_y", 1.0)])
+
+        self.assertEqual(self.history.get_label_durations(), {"app.tests.test_a": 4.0})
+        self.assertEqual(self.history.get_label_durations(runs=2), {"app.tests.test_a": 5.0})
+
+    def test_export_label_durations(self):
+        """Test that file durations are exported as JSON for sharding."""
+        self.history.record_run([("app.tests.test_a.ATest.test_x", 1.5)])
+        durations_file = os.path.join(self.temp_dir, "durations.json")
+
+        self.history.export_label_durations(durations_file)
+
+        with open(durations_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"app.tests.test_a": 1.5})
+
+
+class TimingRunnerTest(TestCase):
+    """Test TimingRunnerMixin and TimingRecorder."""
+
+    def setUp(self):
+        """Set up a recorder with a temporary history."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.out = StringIO()
+        history = TimingHistory(os.path.join(self.temp_dir, "timings.sqlite3"))
+        self.recorder = TimingRecorder(self.out, no_style(), 5, history)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_runner_extends_base_runner(self):
+        """Test that the extended runner is the base runner with TimingRunnerMixin."""
+        runner = ExtendedTestRunner(
+            base_runner="django.test.runner.DiscoverRunner",
+            runner_mixins=[TimingRunnerMixin],
+            timing_recorder=self.recorder,
+            verbosity=0,
+        )
+
+        self.assertIsInstance(runner, DiscoverRunner)
+        self.assertIsInstance(runner, TimingRunnerMixin)
+        self.assertIs(runner.timing_recorder, self.recorder)
+
+    def test_result_class_records_durations(self):
+        """Test that each test of a run gets a duration."""
+        runner = ExtendedTestRunner(runner_mixins=[TimingRunnerMixin], timing_recorder=self.recorder)
+        suite = unittest.TestLoader().loadTestsFromTestCase(_SampleTest)
+
+        unittest.TextTestRunner(stream=StringIO(), resultclass=runner.get_resultclass()).run(suite)
+
+        self.assertEqual(
+            sorted(test_id.rsplit(".", 1)[1] for test_id, _ in self.recorder.durations),
+            ["test_one", "test_two"],
+        )
+
+    def test_parallel_runs_are_not_recorded(self):
+        """Test that replayed parallel results are not timed."""
+        runner = ExtendedTestRunner(runner_mixins=[TimingRunnerMixin], timing_recorder=self.recorder, parallel=2)
+
+        self.assertIs(runner.get_resultclass(), unittest.TextTestResult)
+        runner._save_timings()
+        self.assertIn("not recorded with --parallel", self.out.getvalue())
+
+    def test_save_prints_slowest_tests(self):
+        """Test that saving reports the slowest tests of each category."""
+        self.recorder.durations = [("app.tests.models.test_a.ATest.test_x", 0.25)]
+        self.recorder.history.export_label_durations = lambda: "durations.json"
+
+        self.recorder.save()
+
+        self.assertIn("Slowest models tests:", self.out.getvalue())
+        self.assertIn("0.250s  app.tests.models.test_a.ATest.test_x", self.out.getvalue())
@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+from django.test import TestCase
+
+from smartcli import transaction, utils
+
+
+class WriteTransactionTest(TestCase):
+    """Test WriteTransaction class and write_transaction context manager."""
+
+    def setUp(self):
+        """Set up temporary directory for file tests."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.existing_file = os.path.join(self.temp_dir, "existing.py")
+        with open(self.existing_file, "w", encoding="utf-8") as f:
+            f.write("original")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self, file_path):
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_writes_are_staged_until_commit(self):
+        """Test that files are only written when the block exits."""
+        new_file = os.path.join(self.temp_dir, "new.py")
+
+        with transaction.write_transaction():
+            utils.write_file_content(new_file, "new")
+            utils.write_file_content(self.existing_file, "edited")
+
+            self.assertFalse(os.path.exists(new_file))
+            self.assertEqual(self._read(self.existing_file), "original")
+            self.assertTrue(utils.check_file_exists(new_file))
+            self.assertEqual(utils.read_file_content(self.existing_file), "edited")
+
+        self.assertEqual(self._read(new_file), "new")
+        self.assertEqual(self._read(self.existing_file), "edited")
+        self.assertEqual([name for name in os.listdir(self.temp_dir) if name.endswith(".tmp")], [])
+
+    def test_exception_discards_staged_files(self):
+        """Test that nothing is written when the block raises."""
+        new_dir = os.path.join(self.temp_dir, "models")
+        new_file = os.path.join(new_dir, "user.py")
+
+        with self.assertRaises(ValueError):
+            with transaction.write_transaction():
+                utils.ensure_directory_exists(new_dir)
+                utils.write_file_content(new_file, "new")
+                utils.write_file_content(self.existing_file, "edited")
+                raise ValueError("boom")
+
+        self.assertFalse(os.path.exists(new_dir))
+        self.assertEqual(self._read(self.existing_file), "original")
+        self.assertIsNone(transaction.get_active_transaction())
+
+    def test_nested_transactions_join_outer(self):
+        """Test that inner blocks are committed by the outermost one."""
+        new_file = os.path.join(self.temp_dir, "new.py")
+
+        with transaction.write_transaction() as outer:
+            with transaction.write_transaction() as inner:
+                utils.write_file_content(new_file, "new")
+            self.assertIs(inner, outer)
+            self.assertFalse(os.path.exists(new_file))
+
+        self.assertTrue(os.path.exists(new_file))
+
+    def test_worker_thread_joins_transaction(self):
+        """Test that use_transaction lets another thread stage into a transaction."""
+        new_file = os.path.join(self.temp_dir, "new.py")
+
+        with transaction.write_transaction() as active:
+            def worker():
+                with transaction.use_transaction(active):
+                    utils.write_file_content(new_file, "new")
+                self.assertIsNone(transaction.get_active_transaction())
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            self.assertFalse(os.path.exists(new_file))
+
+        self.assertEqual(self._read(new_file), "new")
+
+    def test_commit_failure_restores_edited_files(self):
+        """Test that already replaced files are restored if a rename fails."""
+        new_file = os.path.join(self.temp_dir, "new.py")
+        write = transaction.WriteTransaction()
+        write.stage(self.existing_file, "edited")
+        write.stage(new_file, "new")
+
+        real_replace = os.replace
+        calls = []
+
+        def failing_replace(source, destination):
+            calls.append(destination)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_replace(source, destination)
+
+        with patch("smartcli.transaction.os.replace", side_effect=failing_replace):
+            with self.assertRaises(OSError):
+                write.commit()
+
+        self.assertEqual(self._read(self.existing_file), "original")
+        self.assertFalse(os.path.exists(new_file))
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["existing.py"])
+
+    def test_commit_keeps_file_mode(self):
+        """Test that replaced files keep their permissions."""
+        os.chmod(self.existing_file, 0o640)
+
+        write = transaction.WriteTransaction()
+        write.stage(self.existing_file, "edited")
+        write.commit()
+
+        self.assertEqual(os.stat(self.existing_file).st_mode & 0o777, 0o640)
+
+    def test_commit_skips_unchanged_files(self):
+        """Test that files staged with their current content are not replaced."""
+        os.utime(self.existing_file, (1000000000, 1000000000))
+        new_file = os.path.join(self.temp_dir, "new.py")
+
+        write = transaction.WriteTransaction()
+        write.stage(self.existing_file, "original")
+        write.stage(new_file, "new")
+        written_files = write.commit()
+
+        self.assertEqual(written_files, [new_file])
+        self.assertEqual(write.unchanged_files, [self.existing_file])
+        self.assertEqual(os.path.getmtime(self.existing_file), 1000000000)
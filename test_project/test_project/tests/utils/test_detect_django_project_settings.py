@@ -1,56 +1,93 @@
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
 from unittest.mock import patch
 from django.test import TestCase
 
-from smartcli import utils
+from smartcli import project, utils
 
 
 class DetectDjangoProjectSettingsTest(TestCase):
     """Test detect_django_project_settings function."""
 
-    @patch('smartcli.utils.settings')
-    @patch('os.path.exists')
-    def test_detect_standard_structure(self, mock_exists, mock_settings):
-        """Test detection of standard Django project structure."""
-        mock_settings.BASE_DIR = "/project/test_project"
-        mock_exists.side_effect = lambda path: path.endswith("settings.py")
-        
-        project_dir, settings_file = utils.detect_django_project_settings()
-        
-        self.assertEqual(project_dir, "test_project")
-        self.assertEqual(settings_file, "/project/test_project/test_project/settings.py")
-
-    @patch('smartcli.utils.settings')
-    @patch('os.path.exists')
-    def test_detect_direct_settings(self, mock_exists, mock_settings):
-        """Test detection of direct settings.py file."""
-        mock_settings.BASE_DIR = "/project/test_project"
-        mock_exists.side_effect = lambda path: path == "/project/test_project/settings.py"
-        
-        project_dir, settings_file = utils.detect_django_project_settings()
-        
-        self.assertEqual(project_dir, "test_project")
-        self.assertEqual(settings_file, "/project/test_project/settings.py")
-
-    @patch('smartcli.utils.settings')
-    @patch('os.path.exists')
-    def test_detect_settings_module(self, mock_exists, mock_settings):
-        """Test detection of settings module structure."""
-        mock_settings.BASE_DIR = "/project/test_project"
-        mock_exists.side_effect = lambda path: path.endswith("__init__.py")
-        
-        project_dir, settings_file = utils.detect_django_project_settings()
-        
-        self.assertEqual(project_dir, "test_project")
-        self.assertEqual(settings_file, "/project/test_project/settings/__init__.py")
-
-    @patch('smartcli.utils.settings')
-    @patch('os.path.exists')
-    def test_detect_no_settings_found(self, mock_exists, mock_settings):
+    def setUp(self):
+        """Set up a temporary project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_dir = os.path.join(self.temp_dir, "shop")
+        self._write("manage.py", "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'shop.settings')\n")
+        project.forget_projects()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        project.forget_projects()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative_path, content=""):
+        path = os.path.join(self.base_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _detect(self, settings_module):
+        mock_settings = SimpleNamespace(BASE_DIR=self.base_dir, SETTINGS_MODULE=settings_module)
+        with patch("smartcli.utils.settings", mock_settings):
+            return utils.detect_django_project_settings()
+
+    def test_detect_settings_module_in_use(self):
+        """Test that the settings module in use is resolved, whatever its layout."""
+        settings_file = self._write("core/settings/base.py")
+
+        self.assertEqual(self._detect("core.settings.base"), ("shop", settings_file))
+
+    def test_detect_settings_package(self):
+        """Test detection of a settings package."""
+        settings_file = self._write("shop/settings/__init__.py")
+
+        self.assertEqual(self._detect("shop.settings"), ("shop", settings_file))
+
+    def test_detect_settings_from_manage_py(self):
+        """Test that manage.py gives the settings module when settings don't."""
+        settings_file = self._write("shop/settings.py")
+
+        self.assertEqual(self._detect(None), ("shop", settings_file))
+
+    def test_detect_imported_settings_module(self):
+        """Test that an imported settings module is resolved from its __file__."""
+        with patch.dict("sys.modules", {"shop.settings": SimpleNamespace(__file__="/elsewhere/settings.py")}):
+            self.assertEqual(self._detect("shop.settings"), ("shop", "/elsewhere/settings.py"))
+
+    def test_detect_split_settings_base(self):
+        """Test that split settings resolve to the base module defining INSTALLED_APPS."""
+        self._write("core/settings/dev.py", "from .base import *\n\nDEBUG = True\n")
+        settings_file = self._write("core/settings/base.py", "INSTALLED_APPS = []\n")
+
+        self.assertEqual(self._detect("core.settings.dev"), ("shop", settings_file))
+
+    def test_detect_settings_base(self):
+        """Test detection of settings/base.py when the settings module isn't found."""
+        settings_file = self._write("settings/base.py", "INSTALLED_APPS = []\n")
+
+        self.assertEqual(self._detect("shop.settings"), ("shop", settings_file))
+
+    def test_detect_core_settings_base(self):
+        """Test detection of core/settings/base.py when the settings file has no INSTALLED_APPS."""
+        self._write("shop/settings.py", "from core.settings.base import *\n")
+        settings_file = self._write("core/settings/base.py", "INSTALLED_APPS = []\n")
+
+        self.assertEqual(self._detect("shop.settings"), ("shop", settings_file))
+
+    def test_settings_with_installed_apps_are_kept(self):
+        """Test that a settings file defining INSTALLED_APPS is used over base modules."""
+        settings_file = self._write("shop/settings.py", "INSTALLED_APPS = []\n")
+        self._write("core/settings/base.py", "INSTALLED_APPS = []\n")
+
+        self.assertEqual(self._detect("shop.settings"), ("shop", settings_file))
+
+    def test_detect_no_settings_found(self):
         """Test when no settings file is found."""
-        mock_settings.BASE_DIR = "/project/test_project"
-        mock_exists.return_value = False
-        
-        project_dir, settings_file = utils.detect_django_project_settings()
-        
+        project_dir, settings_file = self._detect("shop.settings")
+
         self.assertIsNone(project_dir)
         self.assertIsNone(settings_file)
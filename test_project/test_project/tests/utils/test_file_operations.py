@@ -91,3 +91,14 @@ class FileOperationsTest(TestCase):
         # Clean up
         os.remove(file_in_sub_dir)
         os.rmdir(sub_dir)
+
+    def test_write_file_content_skips_unchanged_file(self):
+        """Test that rewriting the same content leaves the file untouched."""
+        utils.write_file_content(self.test_file, "Test content")
+        os.utime(self.test_file, (1000000000, 1000000000))
+
+        self.assertFalse(utils.write_file_content(self.test_file, "Test content"))
+        self.assertEqual(os.path.getmtime(self.test_file), 1000000000)
+
+        self.assertTrue(utils.write_file_content(self.test_file, "New content"))
+        self.assertNotEqual(os.path.getmtime(self.test_file), 1000000000)
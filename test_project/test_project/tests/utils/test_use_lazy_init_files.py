@@ -0,0 +1,23 @@
+from django.test import TestCase, override_settings
+
+from smartcli import utils
+
+
+class UseLazyInitFilesTest(TestCase):
+    """Test the use_lazy_init_files function."""
+
+    @override_settings(USE_LAZY_INIT_FILES=True)
+    def test_enabled(self):
+        """Test that serializers, services and views packages are lazy when enabled."""
+        for directory in ["serializers", "services", "views"]:
+            self.assertTrue(utils.use_lazy_init_files(directory))
+
+    @override_settings(USE_LAZY_INIT_FILES=True)
+    def test_models_stay_eager(self):
+        """Test that models and factories packages are never lazy."""
+        self.assertFalse(utils.use_lazy_init_files("models"))
+        self.assertFalse(utils.use_lazy_init_files("factories"))
+
+    def test_disabled_by_default(self):
+        """Test that packages are eager unless USE_LAZY_INIT_FILES is set."""
+        self.assertFalse(utils.use_lazy_init_files("services"))